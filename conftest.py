@@ -0,0 +1,91 @@
+"""Pytest configuration for performance benchmarks.
+
+Tests marked with `benchmark` are skipped unless `--run-benchmarks` is given. This
+lives in the root directory, so that the option is known wherever pytest is
+started from, e.g. by `lando tests`.
+"""
+
+import statistics
+import time
+from collections.abc import Callable
+
+import pytest
+
+
+def pytest_addoption(parser: pytest.Parser):
+    parser.addoption(
+        "--run-benchmarks",
+        action="store_true",
+        default=False,
+        help="Run tests marked as benchmarks.",
+    )
+
+
+def pytest_configure(config: pytest.Config):
+    config.addinivalue_line(
+        "markers", "benchmark: performance benchmark, run with --run-benchmarks"
+    )
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]):
+    if config.getoption("--run-benchmarks"):
+        return
+
+    skip_benchmark = pytest.mark.skip(reason="Benchmarks need --run-benchmarks.")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip_benchmark)
+
+
+def pytest_terminal_summary(terminalreporter):  # noqa: ANN001
+    """Report the timings recorded by the `benchmark_timer` fixture."""
+    results = [
+        (report.nodeid, name, value)
+        for report in terminalreporter.getreports("passed")
+        for name, value in report.user_properties
+        if name.startswith("benchmark:")
+    ]
+    if not results:
+        return
+
+    terminalreporter.section("benchmarks")
+    for nodeid, name, value in results:
+        terminalreporter.write_line(
+            f"{nodeid} {name.removeprefix('benchmark:')}: {value}"
+        )
+
+
+@pytest.fixture
+def benchmark_timer(request: pytest.FixtureRequest) -> Callable:
+    """Time repeated calls of a function, and record the result for the test report.
+
+    The median and maximum durations are reported at the end of the test session.
+    If given, `setup` is called before each round, outside of the timing.
+    """
+
+    def _benchmark_timer(
+        label: str,
+        func: Callable,
+        *,
+        rounds: int = 10,
+        setup: Callable | None = None,
+    ) -> float:
+        durations = []
+        for _ in range(rounds):
+            if setup:
+                setup()
+            start = time.perf_counter()
+            func()
+            durations.append(time.perf_counter() - start)
+
+        median = statistics.median(durations)
+        request.node.user_properties.append(
+            (
+                f"benchmark:{label}",
+                f"median {median * 1000:.2f}ms, max {max(durations) * 1000:.2f}ms "
+                f"over {rounds} rounds",
+            )
+        )
+        return median
+
+    return _benchmark_timer
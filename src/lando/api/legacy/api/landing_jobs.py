@@ -8,7 +8,7 @@ from django.utils.decorators import method_decorator
 from django.views import View
 
 from lando.main.auth import require_authenticated_user
-from lando.main.models import JobAction, JobStatus, LandingJob
+from lando.main.models import JobAction, JobStatus, LandingJob, Worker, WorkerType
 from lando.utils.exceptions import NotFoundProblemException
 
 logger = logging.getLogger(__name__)
@@ -107,3 +107,48 @@ class LandingJobApiView(View):
                     ]
                 }
                 return JsonResponse(data, status=400)
+
+
+class LandingJobQueueApiView(View):
+    def get(self, request: WSGIRequest, job_id: int) -> JsonResponse:
+        """Get the queue position of a landing job as JSON.
+
+        The position is the number of jobs ahead of this job in the queue of the
+        landing worker serving its target repository. Jobs which are no longer
+        pending have no position.
+        """
+        try:
+            job = LandingJob.objects.get(id=job_id)
+        except LandingJob.DoesNotExist:
+            exc = NotFoundProblemException(
+                title="Landing job not found",
+                detail=f"A landing job with ID {job_id} was not found.",
+            )
+            return JsonResponse(exc.to_response(), status=404)
+
+        if job.status not in JobStatus.pending():
+            return JsonResponse(
+                {"id": job.id, "status": job.status, "position": None, "ahead": []}
+            )
+
+        try:
+            landing_worker = Worker.objects.get(
+                applicable_repos=job.target_repo, type=WorkerType.LANDING
+            )
+        except Worker.DoesNotExist:
+            repositories = [job.target_repo]
+        else:
+            repositories = landing_worker.applicable_repos.all()
+
+        # Jobs in the grace period are included, to match the job page.
+        ahead_query = job.jobs_ahead_query(repositories=repositories, grace_seconds=0)
+        ahead = list(ahead_query.values_list("id", flat=True))
+
+        return JsonResponse(
+            {
+                "id": job.id,
+                "status": job.status,
+                "position": len(ahead),
+                "ahead": ahead,
+            }
+        )
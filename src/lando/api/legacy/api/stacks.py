@@ -6,13 +6,6 @@ from django.conf import settings
 from django.http import Http404
 
 from lando.api.legacy.commit_message import format_commit_message
-from lando.api.legacy.projects import (
-    get_data_policy_review_phid,
-    get_release_managers,
-    get_sec_approval_project_phid,
-    get_secure_project_phid,
-    project_search,
-)
 from lando.api.legacy.reviews import (
     approvals_for_commit_message,
     get_collated_reviewers,
@@ -30,16 +23,10 @@ from lando.api.legacy.revisions import (
 )
 from lando.api.legacy.stacks import (
     RevisionStack,
-    build_stack_graph,
+    StackSnapshot,
     get_diffs_for_revision,
-    request_extended_revision_data,
-)
-from lando.api.legacy.transplants import (
-    build_stack_assessment_state,
-    run_landing_checks,
 )
-from lando.api.legacy.users import user_search
-from lando.main.models import Repo
+from lando.api.legacy.transplants import assess_stack
 from lando.main.models.revision import Revision
 from lando.utils.phabricator import PhabricatorClient
 
@@ -48,32 +35,33 @@ logger = logging.getLogger(__name__)
 HTTP_404_STRING = "Revision does not exist or you do not have permission to view it"
 
 
-def get(phab: PhabricatorClient, revision_id: int) -> dict[str, Any]:
+def get(
+    phab: PhabricatorClient, revision_id: int, snapshot: StackSnapshot | None = None
+) -> dict[str, Any]:
     """Get the stack a revision is part of.
 
     Args:
         revision_id: (int) ID of the revision in 'D{number}' format
+        snapshot: A StackSnapshot of the revision's stack, shared with other
+            uses of the stack in the request.
     """
-    revision = phab.call_conduit(
-        "differential.revision.search", constraints={"ids": [revision_id]}
-    )
-    revision = phab.single(revision, "data", none_when_empty=True)
-    if revision is None:
+    snapshot = snapshot or StackSnapshot(phab, revision_id)
+    if snapshot.revision is None:
         raise Http404(HTTP_404_STRING)
 
-    nodes, edges = build_stack_graph(revision)
+    nodes, edges = snapshot.graph
     try:
-        stack_data = request_extended_revision_data(phab, list(nodes))
+        stack_data = snapshot.stack_data
     except ValueError:
         raise Http404(HTTP_404_STRING)
 
-    supported_repos = Repo.get_mapping()
+    supported_repos = snapshot.supported_repos
 
-    release_managers = get_release_managers(phab)
+    release_managers = snapshot.release_managers
     if not release_managers:
         raise Exception("Could not find `#release-managers` project on Phabricator.")
 
-    data_policy_review_phid = get_data_policy_review_phid(phab)
+    data_policy_review_phid = snapshot.data_policy_review_phid
     if not data_policy_review_phid:
         raise Exception(
             "Could not find `#needs-data-classification` project on Phabricator."
@@ -82,17 +70,17 @@ def get(phab: PhabricatorClient, revision_id: int) -> dict[str, Any]:
     relman_group_phid = str(phab.expect(release_managers, "phid"))
 
     stack = RevisionStack(set(stack_data.revisions.keys()), edges)
-    stack_state = build_stack_assessment_state(
+    # Run landing checks and update the stack state.
+    _assessment, landable_stack = assess_stack(
         phab,
         supported_repos,
         stack_data,
         stack,
         relman_group_phid,
         data_policy_review_phid,
+        snapshot=snapshot,
     )
-    # Run landing checks and update the stack state.
-    run_landing_checks(stack_state)
-    landable = stack_state.landable_stack.landable_paths()
+    landable = landable_stack.landable_paths()
     uplift_repos = [
         name for name, repo in supported_repos.items() if repo.approval_required
     ]
@@ -104,14 +92,14 @@ def get(phab: PhabricatorClient, revision_id: int) -> dict[str, Any]:
 
     involved_phids = list(involved_phids)
 
-    users = user_search(phab, involved_phids)
-    projects = project_search(phab, involved_phids)
+    users = snapshot.user_search(involved_phids)
+    projects = snapshot.project_search(involved_phids)
 
-    secure_project_phid = get_secure_project_phid(phab)
+    secure_project_phid = snapshot.secure_project_phid
     if not secure_project_phid:
         raise Exception("Could not find `#secure-revision` project on Phabricator.")
 
-    sec_approval_project_phid = get_sec_approval_project_phid(phab)
+    sec_approval_project_phid = snapshot.sec_approval_project_phid
     if not sec_approval_project_phid:
         raise Exception("Could not find `#sec-approval` project on Phabricator.")
 
@@ -166,7 +154,7 @@ def get(phab: PhabricatorClient, revision_id: int) -> dict[str, Any]:
         )
         author_response = serialize_author(phab.expect(fields, "authorPHID"), users)
 
-        blocked_reasons = stack_state.stack.nodes[revision_phid].get("blocked")
+        blocked_reasons = stack.nodes[revision_phid].get("blocked")
 
         revisions_response.append(
             {
@@ -33,6 +33,7 @@ from lando.api.legacy.revisions import (
 )
 from lando.api.legacy.stacks import (
     RevisionStack,
+    StackSnapshot,
     build_stack_graph,
     get_diffs_for_revision,
     request_extended_revision_data,
@@ -40,8 +41,7 @@ from lando.api.legacy.stacks import (
 from lando.api.legacy.transplants import (
     LandingAssessmentState,
     StackAssessment,
-    build_stack_assessment_state,
-    run_landing_checks,
+    assess_stack,
 )
 from lando.api.legacy.users import user_search
 from lando.api.legacy.validation import (
@@ -114,30 +114,60 @@ def _find_stack_from_landing_path(
     return build_stack_graph(revision)
 
 
-def dryrun(phab: PhabricatorClient, user: User, data: dict) -> dict[str, Any]:
-    """Perform a dryrun of a landing to check for warnings and blockers."""
+def _find_stack_snapshot_from_landing_path(
+    phab: PhabricatorClient,
+    landing_path: list[tuple[int, int]],
+    snapshot: StackSnapshot | None = None,
+) -> StackSnapshot:
+    """Return a snapshot of the stack containing `landing_path`.
+
+    The given `snapshot` is reused if the landing path is part of its stack.
+    """
+    if snapshot is not None and snapshot.contains_revision_ids(
+        revision_id for revision_id, _diff_id in landing_path
+    ):
+        return snapshot
+
+    snapshot = StackSnapshot(phab, _choose_middle_revision_from_path(landing_path))
+    if snapshot.revision is None:
+        raise LegacyAPIException(404, "Stack Not Found")
+    return snapshot
+
+
+def dryrun(
+    phab: PhabricatorClient,
+    user: User,
+    data: dict,
+    snapshot: StackSnapshot | None = None,
+) -> dict[str, Any]:
+    """Perform a dryrun of a landing to check for warnings and blockers.
+
+    A `snapshot` of the stack already fetched during the request may be passed to
+    avoid requesting it from Phabricator again.
+    """
     landing_path = _parse_transplant_request(data)["landing_path"]
+    snapshot = _find_stack_snapshot_from_landing_path(phab, landing_path, snapshot)
 
-    release_managers = get_release_managers(phab)
+    release_managers = snapshot.release_managers
     if not release_managers:
         raise Exception("Could not find `#release-managers` project on Phabricator.")
 
-    data_policy_review_phid = get_data_policy_review_phid(phab)
+    data_policy_review_phid = snapshot.data_policy_review_phid
     if not data_policy_review_phid:
         raise Exception(
             "Could not find `#needs-data-classification` project on Phabricator."
         )
 
-    supported_repos = Repo.get_mapping()
+    supported_repos = snapshot.supported_repos
 
     relman_group_phid = phab.expect(release_managers, "phid")
-    nodes, edges = _find_stack_from_landing_path(phab, landing_path)
-    stack_data = request_extended_revision_data(phab, list(nodes))
+    nodes, edges = snapshot.graph
+    stack_data = snapshot.stack_data
     stack = RevisionStack(set(stack_data.revisions.keys()), edges)
     landing_assessment = LandingAssessmentState.from_landing_path(
         landing_path, stack_data, user
     )
-    stack_state = build_stack_assessment_state(
+    assessment, _landable_stack = assess_stack(
         phab,
         supported_repos,
         stack_data,
@@ -145,8 +175,8 @@ def dryrun(phab: PhabricatorClient, user: User, data: dict) -> dict[str, Any]:
         relman_group_phid,
         data_policy_review_phid,
         landing_assessment=landing_assessment,
+        snapshot=snapshot,
     )
-    assessment = run_landing_checks(stack_state)
 
     # NOTE: we should switch to returning the `StackAssessment` directly.
     return assessment.to_dict()
@@ -189,7 +219,8 @@ def post(phab: PhabricatorClient, user: User, data: dict) -> tuple[dict[str, int
     landing_assessment = LandingAssessmentState.from_landing_path(
         landing_path, stack_data, user
     )
-    stack_state = build_stack_assessment_state(
+    # The assessment made for the dry run is reused if nothing changed since.
+    assessment, _landable_stack = assess_stack(
         phab,
         supported_repos,
         stack_data,
@@ -198,7 +229,6 @@ def post(phab: PhabricatorClient, user: User, data: dict) -> tuple[dict[str, int
         data_policy_review_phid,
         landing_assessment=landing_assessment,
     )
-    assessment = run_landing_checks(stack_state)
     to_land, landing_repo = (
         landing_assessment.to_land,
         landing_assessment.landing_repo,
@@ -266,6 +296,11 @@ def post(phab: PhabricatorClient, user: User, data: dict) -> tuple[dict[str, int
         for member in release_managers["attachments"]["members"]["members"]
     }
 
+    # Record the stack of each revision, to find the landing jobs of the stack later.
+    stack_revision_ids = sorted(
+        PhabricatorClient.expect(r, "id") for r in stack_data.revisions.values()
+    )
+
     lando_revisions = []
     revision_reviewers = {}
 
@@ -310,6 +345,8 @@ def post(phab: PhabricatorClient, user: User, data: dict) -> tuple[dict[str, int
             lando_revision = Revision(revision_id=revision_id)
 
         lando_revision.diff_id = diff_id
+        lando_revision.revision_phid = PhabricatorClient.expect(revision, "phid")
+        lando_revision.stack_revision_ids = stack_revision_ids
         lando_revision.save()
 
         revision_reviewers[lando_revision.id] = get_approved_by_ids(
@@ -382,24 +419,39 @@ def post(phab: PhabricatorClient, user: User, data: dict) -> tuple[dict[str, int
     return {"id": job.id}, 202
 
 
-def get_list(phab: PhabricatorClient, stack_revision_id: str) -> list[LandingJob]:
-    """Return a list of landing jobs related to the revision."""
+def get_list(
+    phab: PhabricatorClient,
+    stack_revision_id: str,
+    snapshot: StackSnapshot | None = None,
+) -> list[LandingJob]:
+    """Return a list of landing jobs related to the revision.
+
+    Phabricator is only queried for the stack of the revision if Lando doesn't have
+    landing jobs recorded for it.
+    """
     revision_id_int = revision_id_to_int(stack_revision_id)
 
-    revision = phab.call_conduit(
-        "differential.revision.search", constraints={"ids": [revision_id_int]}
-    )
-    revision = phab.single(revision, "data", none_when_empty=True)
-    if revision is None:
+    landing_jobs = LandingJob.revision_stack_query(revision_id_int)
+    if landing_jobs:
+        return landing_jobs
+
+    snapshot = snapshot or StackSnapshot(phab, revision_id_int)
+    if snapshot.revision is None:
         raise LegacyAPIException(404, HTTP_404_STRING)
-    nodes, edges = build_stack_graph(revision)
-    revision_phids = list(nodes)
-    revs = phab.call_conduit_collated(
-        "differential.revision.search",
-        constraints={"phids": revision_phids},
-        limit=len(revision_phids),
-    )
 
-    rev_ids = [phab.expect(r, "id") for r in phab.expect(revs, "data")]
+    try:
+        revisions = snapshot.stack_data.revisions.values()
+    except ValueError:
+        # Some revisions of the stack can't be viewed, list the jobs of the others.
+        nodes, edges = snapshot.graph
+        revision_phids = list(nodes)
+        revs = phab.call_conduit_collated(
+            "differential.revision.search",
+            constraints={"phids": revision_phids},
+            limit=len(revision_phids),
+        )
+        revisions = phab.expect(revs, "data")
+
+    rev_ids = [phab.expect(r, "id") for r in revisions]
 
     return LandingJob.revisions_query(rev_ids).all()
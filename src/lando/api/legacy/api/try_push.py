@@ -1,8 +1,7 @@
-import base64
-import binascii
 import io
 import logging
 
+from django.conf import settings
 from django.core.handlers.wsgi import WSGIRequest
 
 from lando.main.auth import require_authenticated_user, require_permission
@@ -13,13 +12,16 @@ from lando.main.models.landing_job import (
 )
 from lando.main.scm.helpers import (
     PATCH_HELPER_MAPPING,
-    BugReferencesCheck,
-    PatchCollectionAssessor,
     PatchFormat,
     PatchHelper,
-    PreventSymlinksCheck,
+    decode_base64_patch,
 )
 from lando.main.support import LegacyAPIException
+from lando.utils.landing_checks import (
+    BugReferencesCheck,
+    PatchCollectionAssessor,
+    PreventSymlinksCheck,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -35,7 +37,7 @@ def build_revision_from_patch_helper(helper: PatchHelper, repo: Repo) -> Revisio
 
     raw_diff = helper.get_diff()
 
-    return Revision.new_from_patch(
+    return Revision.build_from_patch(
         raw_diff=raw_diff,
         patch_data={
             "author_name": author,
@@ -46,11 +48,11 @@ def build_revision_from_patch_helper(helper: PatchHelper, repo: Repo) -> Revisio
     )
 
 
-def decode_json_patch_to_text(patch: str) -> str:
-    """Decode from the base64 encoded patch to `str`."""
+def decode_json_patch_to_bytes_io(patch: str) -> io.BytesIO:
+    """Decode from the base64 encoded patch to a `BytesIO`."""
     try:
-        return base64.b64decode(patch.encode("ascii")).decode("utf-8")
-    except binascii.Error:
+        return decode_base64_patch(patch)
+    except ValueError:
         raise LegacyAPIException(400, "A patch could not be decoded from base64.")
 
 
@@ -58,11 +60,12 @@ def parse_revisions_from_request(
     patches: list[str], patch_format: PatchFormat, repo: Repo
 ) -> list[Revision]:
     """Convert a set of base64 encoded patches to `Revision` objects."""
-    patches_io = (io.StringIO(decode_json_patch_to_text(patch)) for patch in patches)
+    patches_io = (decode_json_patch_to_bytes_io(patch) for patch in patches)
 
     try:
         patch_helpers = [
-            PATCH_HELPER_MAPPING[patch_format](patch) for patch in patches_io
+            PATCH_HELPER_MAPPING[patch_format].from_bytes_io(patch)
+            for patch in patches_io
         ]
     except ValueError as exc:
         raise LegacyAPIException(
@@ -74,6 +77,7 @@ def parse_revisions_from_request(
     try:
         errors = PatchCollectionAssessor(
             patch_helpers=patch_helpers,
+            max_workers=settings.TRY_PATCH_PARSE_CONCURRENCY,
         ).run_patch_collection_checks(
             patch_collection_checks=[BugReferencesCheck],
             patch_checks=[PreventSymlinksCheck],
@@ -95,7 +99,7 @@ def parse_revisions_from_request(
         )
 
     try:
-        return [
+        revisions = [
             build_revision_from_patch_helper(patch_helper, repo)
             for patch_helper in patch_helpers
         ]
@@ -105,6 +109,8 @@ def parse_revisions_from_request(
             f"Patch does not match expected format `{patch_format.value}`: {str(exc)}",
         )
 
+    return Revision.bulk_create_with_patches(revisions)
+
 
 @require_authenticated_user
 @require_permission("scm_level_1")
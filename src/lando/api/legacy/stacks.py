@@ -1,11 +1,25 @@
 import logging
 from collections import namedtuple
 from collections.abc import (
+    Callable,
+    Hashable,
+    Iterable,
     Iterator,
 )
-
-import networkx as nx
-
+from functools import cached_property
+from itertools import pairwise
+from typing import Optional, TypeVar
+
+from lando.api.legacy.projects import (
+    get_data_policy_review_phid,
+    get_release_managers,
+    get_sec_approval_project_phid,
+    get_secure_project_phid,
+    get_testing_policy_phid,
+    get_testing_tag_project_phids,
+    project_search,
+)
+from lando.api.legacy.users import user_search
 from lando.main.models import Repo
 from lando.utils.phabricator import (
     PhabricatorClient,
@@ -14,6 +28,8 @@ from lando.utils.phabricator import (
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 
 def build_stack_graph(revision: dict) -> tuple[set[str], set[tuple[str, str]]]:
     """Return a graph representation of a revision stack.
@@ -106,18 +122,173 @@ def request_extended_revision_data(
     return RevisionData(revs, diffs, repos)
 
 
-class RevisionStack(nx.DiGraph):
-    def __init__(self, nodes: set[str], edges: set[tuple[str, str]]):
-        super().__init__(
-            # Reverse the order of the nodes in the edges set as `networkx`
-            # represents `a -> b` as `(a, b)` but Lando uses `(b, a)`.
-            (successor, predecessor)
-            for predecessor, successor in edges
+class StackSnapshot:
+    """Phabricator data for a stack, fetched at most once per request.
+
+    Rendering a revision page serializes the stack, lists its landing jobs and
+    runs a landing dry run, all of which need the same revisions, diffs, users and
+    projects. Sharing a snapshot between them means each of those is only requested
+    from Phabricator once.
+
+    Args:
+        phab: A PhabricatorClient.
+        revision_id: The `int` ID of a revision in the stack.
+        stack_data: Optionally, an already fetched RevisionData for the stack.
+    """
+
+    def __init__(
+        self,
+        phab: PhabricatorClient,
+        revision_id: Optional[int] = None,
+        stack_data: Optional[RevisionData] = None,
+    ):
+        if revision_id is None and stack_data is None:
+            raise ValueError("A revision ID or stack data is required.")
+
+        self.phab = phab
+        self.revision_id = revision_id
+        if stack_data is not None:
+            self.stack_data = stack_data
+
+        self._memoized = {}
+
+    @cached_property
+    def revision(self) -> Optional[dict]:
+        """The revision the snapshot was requested for, or `None` if not found."""
+        revision = self.phab.call_conduit(
+            "differential.revision.search", constraints={"ids": [self.revision_id]}
+        )
+        return self.phab.single(revision, "data", none_when_empty=True)
+
+    @cached_property
+    def graph(self) -> tuple[set[str], set[tuple[str, str]]]:
+        """The `(nodes, edges)` of the stack, as returned by `build_stack_graph`."""
+        return build_stack_graph(self.revision)
+
+    @cached_property
+    def stack_data(self) -> RevisionData:
+        """Extended data for every revision in the stack.
+
+        Raises a `ValueError` if some revisions of the stack can't be viewed.
+        """
+        nodes, _edges = self.graph
+        return request_extended_revision_data(self.phab, list(nodes))
+
+    @cached_property
+    def supported_repos(self) -> dict[str, Repo]:
+        return Repo.get_mapping()
+
+    @cached_property
+    def release_managers(self) -> Optional[dict]:
+        return get_release_managers(self.phab)
+
+    @cached_property
+    def data_policy_review_phid(self) -> Optional[str]:
+        return get_data_policy_review_phid(self.phab)
+
+    @cached_property
+    def secure_project_phid(self) -> Optional[str]:
+        return get_secure_project_phid(self.phab)
+
+    @cached_property
+    def sec_approval_project_phid(self) -> Optional[str]:
+        return get_sec_approval_project_phid(self.phab)
+
+    @cached_property
+    def testing_tag_project_phids(self) -> list[str]:
+        return get_testing_tag_project_phids(self.phab)
+
+    @cached_property
+    def testing_policy_phid(self) -> Optional[str]:
+        return get_testing_policy_phid(self.phab)
+
+    def contains_revision_ids(self, revision_ids: Iterable[int]) -> bool:
+        """Return `True` if all of the revision IDs are part of this stack."""
+        stack_ids = {
+            PhabricatorClient.expect(revision, "id")
+            for revision in self.stack_data.revisions.values()
+        }
+        return set(revision_ids) <= stack_ids
+
+    def user_search(self, user_phids: list[str]) -> dict[str, dict]:
+        return self.memoize(
+            ("user.search", frozenset(user_phids)),
+            lambda: user_search(self.phab, user_phids),
+        )
+
+    def project_search(self, project_phids: list[str]) -> dict[str, dict]:
+        return self.memoize(
+            ("project.search", frozenset(project_phids)),
+            lambda: project_search(self.phab, project_phids),
         )
 
-        # Individually add each node to set the `blocked` attribute.
+    def memoize(self, key: Hashable, fetch: Callable[[], T]) -> T:
+        """Return the value stored under `key`, calling `fetch` to set it first."""
+        if key not in self._memoized:
+            self._memoized[key] = fetch()
+        return self._memoized[key]
+
+
+class RevisionStack:
+    """A directed acyclic graph of the revisions in a stack.
+
+    Edges go from a revision to the revisions that depend on it, so the roots of the
+    graph are the bottom of the stack and the leaves are its tips.
+
+    `nodes` maps each revision PHID to its attributes, which start with an empty list
+    of `blocked` reasons. Nodes, and the successors of each node, are kept in the
+    order they were first seen in `edges`, so that the paths walked are stable.
+    """
+
+    def __init__(self, nodes: set[str], edges: set[tuple[str, str]]):
+        self.nodes: dict[str, dict] = {}
+        self._successors: dict[str, dict[str, None]] = {}
+        self._predecessors: dict[str, dict[str, None]] = {}
+
+        # Lando represents `a -> b` as `(b, a)`.
+        for successor, predecessor in edges:
+            self.add_node(predecessor)
+            self.add_node(successor)
+            self._successors[predecessor][successor] = None
+            self._predecessors[successor][predecessor] = None
+
+        # Revisions without any dependency only appear in `nodes`.
         for node in nodes:
-            self.add_node(node, blocked=[])
+            self.add_node(node)
+
+    def __contains__(self, node: str) -> bool:
+        return node in self.nodes
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.nodes)
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def add_node(self, node: str):
+        """Add `node` to the stack, if it isn't part of it already."""
+        if node in self.nodes:
+            return
+
+        self.nodes[node] = {"blocked": []}
+        self._successors[node] = {}
+        self._predecessors[node] = {}
+
+    def remove_node(self, node: str):
+        """Remove `node` and its edges from the stack."""
+        for successor in self._successors.pop(node):
+            del self._predecessors[successor][node]
+        for predecessor in self._predecessors.pop(node):
+            del self._successors[predecessor][node]
+        del self.nodes[node]
+
+    def successors(self, node: str) -> Iterator[str]:
+        """Iterate over the revisions which depend directly on `node`."""
+        return iter(self._successors[node])
+
+    def predecessors(self, node: str) -> Iterator[str]:
+        """Iterate over the revisions `node` depends on directly."""
+        return iter(self._predecessors[node])
 
     def root_revisions(self) -> Iterator[str]:
         """Iterate over the set of root revisions in the stack.
@@ -133,7 +304,7 @@ class RevisionStack(nx.DiGraph):
 
         `set(stack.root_revisions()) == {"D", "E"}`.
         """
-        return (node for node, degree in self.in_degree if degree == 0)
+        return (node for node in self.nodes if not self._predecessors[node])
 
     def leaf_revisions(self) -> Iterator[str]:
         """Iterate over the set of root revisions in the stack.
@@ -149,7 +320,41 @@ class RevisionStack(nx.DiGraph):
 
         `set(stack.leaf_revisions()) == {"A"}`.
         """
-        return (node for node, degree in self.out_degree if degree == 0)
+        return (node for node in self.nodes if not self._successors[node])
+
+    def ancestors(self, node: str) -> set[str]:
+        """Return the revisions `node` depends on, directly or not."""
+        ancestors = set()
+        pending = [node]
+        while pending:
+            for predecessor in self._predecessors[pending.pop()]:
+                if predecessor not in ancestors:
+                    ancestors.add(predecessor)
+                    pending.append(predecessor)
+        return ancestors
+
+    def is_path(self, path: list[str]) -> bool:
+        """Return `True` if `path` is a non-empty path of distinct revisions."""
+        if not path or len(set(path)) != len(path):
+            return False
+
+        if any(node not in self.nodes for node in path):
+            return False
+
+        return all(
+            successor in self._successors[node] for node, successor in pairwise(path)
+        )
+
+    def is_landable_path_prefix(self, path: list[str]) -> bool:
+        """Return `True` if `path` is the start of one of the `landable_paths`.
+
+        As every revision leads to a leaf of the stack, this only needs to check that
+        `path` starts at a root, instead of listing all the landable paths.
+        """
+        if not path:
+            return bool(self.nodes)
+
+        return self.is_path(path) and not self._predecessors[path[0]]
 
     def iter_stack_from_root(self, dest: str) -> Iterator[str]:
         """Iterate over the revisions in the stack starting from the root.
@@ -157,21 +362,27 @@ class RevisionStack(nx.DiGraph):
         Walks from one of the root nodes of the graphs to `dest`. If multiple
         root nodes exist, it will select one naively.
         """
+        # Only revisions `dest` depends on can be on the way to it, and every one of
+        # them has a path to it, so the walk never needs to backtrack.
+        ancestors = self.ancestors(dest) if dest in self.nodes else set()
+
         for root in self.root_revisions():
             if root == dest:
                 yield root
                 return
 
-            paths = list(nx.all_simple_paths(self, root, dest))
-
-            if not paths:
+            if root not in ancestors:
                 logger.debug(f"Graph has no paths from {root} to {dest}.")
                 continue
 
-            # Select one of the available paths.
-            path = paths[0]
-
-            for node in path:
+            node = root
+            yield node
+            while node != dest:
+                node = next(
+                    successor
+                    for successor in self._successors[node]
+                    if successor == dest or successor in ancestors
+                )
                 yield node
 
             return
@@ -179,20 +390,25 @@ class RevisionStack(nx.DiGraph):
         raise ValueError(f"Could not walk from a root node to {dest}.")
 
     def landable_paths(self) -> list[list[str]]:
-        """Return the landable paths for the given stack."""
-        leaf_nodes = list(self.leaf_revisions())
+        """Return the landable paths for the given stack.
 
+        These are all the paths from a root to a leaf revision, walked depth-first.
+        """
         landable_paths = []
         for root in self.root_revisions():
-            # If the root is the same as the leaf node, it is a landable single revision.
-            # Add it as a landable path since networkx doesn't consider a single node as a path.
-            if root in leaf_nodes:
-                landable_paths.append([root])
-                continue
-
-            # Find the paths between each landable root and landable leaf node.
-            for path in nx.all_simple_paths(self, root, leaf_nodes):
-                landable_paths.append(path)
+            path = [root]
+            pending = [iter(self._successors[root])]
+            while pending:
+                successor = next(pending[-1], None)
+                if successor is None:
+                    if not self._successors[path[-1]]:
+                        landable_paths.append(list(path))
+                    pending.pop()
+                    path.pop()
+                    continue
+
+                path.append(successor)
+                pending.append(iter(self._successors[successor]))
 
         return landable_paths
 
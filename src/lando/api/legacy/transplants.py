@@ -7,17 +7,12 @@ from collections import namedtuple
 from dataclasses import dataclass
 from typing import Any, Callable, Self
 
-import networkx as nx
 import rs_parsepatch
+from django.conf import settings
 from django.contrib.auth.models import User
 from django.core.cache import cache
+from django.db.models import Count, Max
 
-from lando.api.legacy.projects import (
-    get_secure_project_phid,
-    get_testing_policy_phid,
-    get_testing_tag_project_phids,
-    project_search,
-)
 from lando.api.legacy.reviews import (
     calculate_review_extra_state,
     get_collated_reviewers,
@@ -33,11 +28,11 @@ from lando.api.legacy.revisions import (
 from lando.api.legacy.stacks import (
     RevisionData,
     RevisionStack,
+    StackSnapshot,
     get_diffs_for_revision,
     get_landable_repos_for_revision_data,
 )
 from lando.api.legacy.transactions import get_inline_comments
-from lando.api.legacy.users import user_search
 from lando.main.models import (
     DiffWarning,
     DiffWarningStatus,
@@ -142,6 +137,9 @@ class StackAssessmentState:
     # State required for assessing landing requests.
     landing_assessment: LandingAssessmentState | None = None
 
+    # Phabricator data shared with other assessments of the stack.
+    snapshot: StackSnapshot | None = None
+
     @classmethod
     def from_assessment(
         cls,
@@ -160,6 +158,7 @@ class StackAssessmentState:
         testing_tag_project_phids: list[str],
         testing_policy_phid: str,
         landing_assessment: LandingAssessmentState | None = None,
+        snapshot: StackSnapshot | None = None,
     ) -> Self:
         """Build a `StackAssessmentState` from passed arguments.
 
@@ -197,6 +196,7 @@ class StackAssessmentState:
             testing_tag_project_phids=testing_tag_project_phids,
             testing_policy_phid=testing_policy_phid,
             landing_assessment=landing_assessment,
+            snapshot=snapshot,
         )
 
     def assessment_blocking_pairs(self) -> set[str]:
@@ -226,6 +226,21 @@ class StackAssessmentState:
             for revision in self.stack_data.revisions.values()
         ]
 
+    def get_inline_comments(self, revision: dict) -> list[dict]:
+        """Return the inline comments of a revision.
+
+        The comments are only requested once for all assessments sharing a snapshot.
+        """
+        object_identifier = f"D{PhabricatorClient.expect(revision, 'id')}"
+
+        def fetch() -> list[dict]:
+            return list(get_inline_comments(self.phab, object_identifier))
+
+        if self.snapshot is None:
+            return fetch()
+
+        return self.snapshot.memoize(("inline_comments", object_identifier), fetch)
+
     def get_repo_for_revision(self, revision: dict) -> Repo | None:
         """Given a revision object, return the associated `Repo` in Lando."""
         repo_phid = PhabricatorClient.expect(revision, "fields", "repositoryPHID")
@@ -507,7 +522,7 @@ def warning_unresolved_comments(
 ) -> str | None:
     if not all(
         stack_state.phab.expect(inline, "fields", "isDone")
-        for inline in get_inline_comments(stack_state.phab, f"D{revision['id']}")
+        for inline in stack_state.get_inline_comments(revision)
     ):
         return "Revision has unresolved comments."
 
@@ -642,7 +657,7 @@ def blocker_stack_landing_path_valid(
         revision_phid
         for revision_phid, diff_id in stack_state.landing_assessment.landing_path_by_phid
     ]
-    if not nx.is_simple_path(stack_state.landable_stack, revision_path):
+    if not stack_state.landable_stack.is_path(revision_path):
         return "The requested set of revisions is not a valid stack."
 
 
@@ -658,10 +673,7 @@ def blocker_stack_landing_path_landable(
         revision_phid
         for revision_phid, diff_id in stack_state.landing_assessment.landing_path_by_phid
     ]
-    landable_paths = stack_state.landable_stack.landable_paths()
-    if not landable_paths or not any(
-        revision_path == path[: len(revision_path)] for path in landable_paths
-    ):
+    if not stack_state.landable_stack.is_landable_path_prefix(revision_path):
         return "The requested set of revisions are not landable."
 
 
@@ -1023,12 +1035,21 @@ def build_stack_assessment_state(
     relman_group_phid: str,
     data_policy_review_phid: str,
     landing_assessment: LandingAssessmentState | None = None,
+    snapshot: StackSnapshot | None = None,
 ) -> StackAssessmentState:
-    """Given the required state information for a stack, build a `StackAssessmentState`"""
+    """Given the required state information for a stack, build a `StackAssessmentState`
+
+    Phabricator data is read through `snapshot` when given, so that it is shared with
+    other assessments of the same stack in the request.
+    """
+    snapshot = snapshot or StackSnapshot(phab, stack_data=stack_data)
+
     landable_repos = get_landable_repos_for_revision_data(stack_data, supported_repos)
 
     # Retrieve and parse diffs from Phabricator.
-    parsed_diffs = get_parsed_diffs(phab, stack_data)
+    parsed_diffs = snapshot.memoize(
+        "parsed_diffs", lambda: get_parsed_diffs(phab, stack_data)
+    )
 
     involved_phids = set()
     reviewers = {}
@@ -1040,12 +1061,12 @@ def build_stack_assessment_state(
     # Get more Phabricator data.
     involved_phids = list(involved_phids)
 
-    users = user_search(phab, involved_phids)
-    projects = project_search(phab, involved_phids)
+    users = snapshot.user_search(involved_phids)
+    projects = snapshot.project_search(involved_phids)
 
-    secure_project_phid = get_secure_project_phid(phab)
-    testing_tag_project_phids = get_testing_tag_project_phids(phab)
-    testing_policy_phid = get_testing_policy_phid(phab)
+    secure_project_phid = snapshot.secure_project_phid
+    testing_tag_project_phids = snapshot.testing_tag_project_phids
+    testing_policy_phid = snapshot.testing_policy_phid
 
     stack_state = StackAssessmentState.from_assessment(
         phab=phab,
@@ -1063,10 +1084,157 @@ def build_stack_assessment_state(
         testing_tag_project_phids=testing_tag_project_phids,
         testing_policy_phid=testing_policy_phid,
         landing_assessment=landing_assessment,
+        snapshot=snapshot,
     )
     return stack_state
 
 
+def stack_assessment_cache_key(
+    stack_data: RevisionData,
+    supported_repos: dict[str, Repo],
+    relman_group_phid: str,
+    data_policy_review_phid: str,
+    landing_assessment: LandingAssessmentState | None = None,
+) -> str:
+    """Return a cache key covering every input of a stack assessment.
+
+    Phabricator updates the `dateModified` of a revision whenever it changes,
+    including reviews, project tags and comments. Lando's own inputs are the
+    repository configurations, the landing jobs and diff warnings of the stack,
+    and the landing user's permissions.
+    """
+    revision_ids = [
+        PhabricatorClient.expect(revision, "id")
+        for revision in stack_data.revisions.values()
+    ]
+    jobs = LandingJob.objects.filter(
+        unsorted_revisions__revision_id__in=revision_ids
+    ).aggregate(count=Count("id", distinct=True), last_updated=Max("updated_at"))
+    diff_warnings = DiffWarning.objects.filter(revision_id__in=revision_ids).aggregate(
+        count=Count("id"), last_updated=Max("updated_at")
+    )
+
+    key_data = {
+        "revisions": sorted(
+            (
+                phid,
+                PhabricatorClient.expect(revision, "fields", "dateModified"),
+                PhabricatorClient.expect(revision, "fields", "diffPHID"),
+            )
+            for phid, revision in stack_data.revisions.items()
+        ),
+        "diffs": sorted(
+            PhabricatorClient.expect(diff, "id") for diff in stack_data.diffs.values()
+        ),
+        "repos": sorted(
+            (name, repo.pk, repo.updated_at) for name, repo in supported_repos.items()
+        ),
+        "relman_group_phid": relman_group_phid,
+        "data_policy_review_phid": data_policy_review_phid,
+        "jobs": jobs,
+        "diff_warnings": diff_warnings,
+    }
+
+    if landing_assessment:
+        user = landing_assessment.lando_user
+        if user.is_superuser:
+            # Mirror `Repo.user_can_push`, which only considers explicit permissions.
+            permissions = user.user_permissions.values_list(
+                "content_type__app_label", "codename"
+            )
+            permissions = [
+                f"{app_label}.{codename}" for app_label, codename in permissions
+            ]
+        else:
+            permissions = user.get_user_permissions()
+
+        key_data["landing"] = {
+            "path": landing_assessment.landing_path_by_phid,
+            "user": (user.pk, user.email, user.is_superuser, sorted(permissions)),
+        }
+
+    digest = hashlib.sha256(
+        json.dumps(key_data, sort_keys=True, default=str).encode("utf-8")
+    ).hexdigest()
+    return f"stack_assessment_{digest}"
+
+
+def assess_stack(
+    phab: PhabricatorClient,
+    supported_repos: dict[str, Repo],
+    stack_data: RevisionData,
+    stack: RevisionStack,
+    relman_group_phid: str,
+    data_policy_review_phid: str,
+    landing_assessment: LandingAssessmentState | None = None,
+    snapshot: StackSnapshot | None = None,
+) -> tuple[StackAssessment, RevisionStack]:
+    """Run the landing checks on a stack, reusing a cached result when possible.
+
+    The result of an assessment is cached under `stack_assessment_cache_key`, so
+    unchanged stacks aren't assessed again when viewed or landed. As with
+    `run_landing_checks`, the blocked reasons are set on the nodes of `stack`, and
+    the landing repository is set on `landing_assessment`.
+
+    Returns the assessment and the landable part of `stack`.
+    """
+    cache_key = stack_assessment_cache_key(
+        stack_data,
+        supported_repos,
+        relman_group_phid,
+        data_policy_review_phid,
+        landing_assessment,
+    )
+
+    if result := cache.get(cache_key):
+        assessment = StackAssessment(
+            blockers=result["blockers"], warnings=result["warnings"]
+        )
+        landable_stack = copy.deepcopy(stack)
+        for phid, reasons in result["blocked"].items():
+            stack.nodes[phid]["blocked"].extend(reasons)
+            landable_stack.remove_node(phid)
+
+        if landing_assessment and result["landing_repo_id"]:
+            landing_assessment.landing_repo = next(
+                (
+                    repo
+                    for repo in supported_repos.values()
+                    if repo.pk == result["landing_repo_id"]
+                ),
+                None,
+            ) or Repo.objects.get(pk=result["landing_repo_id"])
+
+        return assessment, landable_stack
+
+    stack_state = build_stack_assessment_state(
+        phab,
+        supported_repos,
+        stack_data,
+        stack,
+        relman_group_phid,
+        data_policy_review_phid,
+        landing_assessment=landing_assessment,
+        snapshot=snapshot,
+    )
+    assessment = run_landing_checks(stack_state)
+
+    landing_repo = landing_assessment.landing_repo if landing_assessment else None
+    result = {
+        "blockers": assessment.blockers,
+        "warnings": assessment.warnings,
+        "blocked": {
+            phid: list(data["blocked"])
+            for phid, data in stack.nodes.items()
+            if data["blocked"]
+        },
+        "landing_repo_id": landing_repo.pk if landing_repo else None,
+    }
+    cache.set(cache_key, result, settings.STACK_ASSESSMENT_CACHE_TTL)
+
+    return assessment, stack_state.landable_stack
+
+
 def convert_path_id_to_phid(
     landing_path: list[tuple[int, int]], stack_data: RevisionData
 ) -> list[tuple[str, int]]:
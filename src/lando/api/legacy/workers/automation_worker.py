@@ -1,5 +1,6 @@
 import logging
 
+from django.conf import settings
 from typing_extensions import override
 
 from lando.api.legacy.workers.base import Worker
@@ -27,7 +28,10 @@ from lando.main.scm import (
 )
 from lando.pushlog.pushlog import PushLogForRepo
 from lando.utils.landing_checks import LandingChecks
-from lando.utils.tasks import phab_trigger_repo_update
+from lando.utils.tasks import (
+    mark_phab_repo_update_pending,
+    phab_trigger_repo_update,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -176,8 +180,13 @@ class AutomationWorker(Worker):
         job.transition_status(JobAction.LAND, commit_id=commit_id)
 
         # Trigger update of repo in Phabricator so patches are closed quicker.
-        # Especially useful on low-traffic repositories.
-        if repo.phab_identifier:
-            self.call_task(phab_trigger_repo_update, repo.phab_identifier)
+        # Especially useful on low-traffic repositories. Updates following a burst
+        # of landings are sent together.
+        if repo.phab_identifier and mark_phab_repo_update_pending(repo.phab_identifier):
+            self.call_task(
+                phab_trigger_repo_update,
+                repo.phab_identifier,
+                countdown=settings.PHABRICATOR_REPO_UPDATE_DELAY,
+            )
 
         return True
@@ -4,11 +4,14 @@ import logging
 import os
 import re
 import subprocess
+import threading
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from time import sleep
 from typing import Callable, TypeVar
 
 from celery import Task
+from django.conf import settings
 from django.db import transaction
 from kombu.exceptions import OperationalError
 
@@ -39,6 +42,95 @@ logger = logging.getLogger(__name__)
 T = TypeVar("T")
 
 
+def run_for_repos(
+    action: Callable[[Repo], None],
+    repos: list[Repo],
+    *,
+    description: str,
+    max_workers: int,
+    max_attempts: int = 1,
+) -> dict[Repo, Exception]:
+    """Run `action` on each repo concurrently, retrying each repo separately.
+
+    At most `max_workers` repos are processed at the same time, and progress is logged
+    as each repo completes.
+
+    Returns:
+        dict: the repos which still failed after `max_attempts`, mapped to their last
+            exception.
+    """
+
+    def run_with_retries(repo: Repo) -> Exception | None:
+        error = None
+        for attempt in range(1, max_attempts + 1):
+            try:
+                action(repo)
+            except Exception as e:
+                logger.warning(
+                    f"Error while {description} {repo} (attempt {attempt} of "
+                    f"{max_attempts}): {e}"
+                )
+                error = e
+            else:
+                return None
+        return error
+
+    failures = {}
+    if not repos:
+        return failures
+
+    with ThreadPoolExecutor(max_workers=max(max_workers, 1)) as executor:
+        futures = {executor.submit(run_with_retries, repo): repo for repo in repos}
+        for completed, future in enumerate(as_completed(futures), start=1):
+            repo = futures[future]
+            if error := future.result():
+                failures[repo] = error
+                status = "failed"
+            else:
+                status = "done"
+            logger.info(
+                f"Finished {description} {repo}: {status} ({completed}/{len(repos)})."
+            )
+
+    return failures
+
+
+class RepoPrefetcher(threading.Thread):
+    """Periodically fetch the default branch of repositories, in the background.
+
+    This keeps the repositories of a worker current between jobs, so that
+    `update_repo` usually has nothing new to fetch. The `lock` is held while
+    fetching, and the worker holds it while running a job.
+    """
+
+    def __init__(self, repos: list[Repo], interval: int, lock: threading.Lock):
+        super().__init__(name="repo-prefetcher", daemon=True)
+        self.repos = repos
+        self.interval = interval
+        self.lock = lock
+        self.stopped = threading.Event()
+
+    def run(self):
+        while not self.stopped.wait(self.interval):
+            self.prefetch()
+
+    def prefetch(self):
+        """Fetch each repository once."""
+        for repo in self.repos:
+            if self.stopped.is_set():
+                return
+
+            with self.lock:
+                try:
+                    if repo.scm.repo_is_initialized:
+                        repo.scm.prefetch(repo.pull_path)
+                except Exception as e:
+                    logger.warning(f"Error while prefetching {repo}: {e}")
+
+    def stop(self):
+        self.stopped.set()
+
+
 class Worker(ABC):
     """A base class for repository workers."""
 
@@ -87,6 +179,9 @@ class Worker(ABC):
     ):
         self.worker_instance = worker_instance
 
+        # Held while running a job, so that repositories aren't prefetched meanwhile.
+        self.repo_lock = threading.Lock()
+
         self.treestatus_client = lando.utils.treestatus.get_treestatus_client()
         if not self.treestatus_client.ping():
             raise ConnectionError("Could not connect to Treestatus")
@@ -217,7 +312,7 @@ class Worker(ABC):
             self.throttle(self.worker_instance.sleep_seconds)
             return
 
-        with job.processing():
+        with job.processing(), self.repo_lock:
             logger.info(f"Starting {job}", extra={"id": job.id})
 
             if job.status not in [JobStatus.SUBMITTED, JobStatus.DEFERRED]:
@@ -369,19 +464,34 @@ class Worker(ABC):
             logger.warning(f"Will not start worker {self}.")
             return
         self._setup()
-        self._start(max_loops=max_loops)
+
+        prefetcher = None
+        if settings.LANDING_WORKER_PREFETCH_INTERVAL > 0:
+            prefetcher = RepoPrefetcher(
+                self.enabled_repos,
+                settings.LANDING_WORKER_PREFETCH_INTERVAL,
+                self.repo_lock,
+            )
+            prefetcher.start()
+
+        try:
+            self._start(max_loops=max_loops)
+        finally:
+            if prefetcher:
+                prefetcher.stop()
 
     @staticmethod
-    def call_task(task: Task, *args):
+    def call_task(task: Task, *args, **options):
         """Exception-absorbing wrapper to call asynchronous Celery tasks.
 
         Args:
             task: celery.Task to call
             *args: list of argurents for the Task
+            **options: execution options for the Task, such as `countdown`
         """
         try:
             # Send a task to Celery.
-            task.apply_async(args=args)
+            task.apply_async(args=args, **options)
         except OperationalError as e:
             # Log the exception but continue gracefully.
             logger.exception(f"Failed sending {task.__name__} task to Celery.")
@@ -1,10 +1,18 @@
 import configparser
+import fnmatch
+import hashlib
 import json
 import logging
 import subprocess
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
 
 import sentry_sdk
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Subquery
 from typing_extensions import override
 
 from lando.api.legacy.commit_message import bug_list_to_commit_string, parse_bugs
@@ -15,9 +23,10 @@ from lando.api.legacy.notifications import (
 from lando.api.legacy.uplift import (
     update_bugs_for_uplift,
 )
-from lando.api.legacy.workers.base import Worker
+from lando.api.legacy.workers.base import Worker, run_for_repos
 from lando.main.models import (
     JobAction,
+    JobStatus,
     LandingJob,
     PermanentFailureException,
     Repo,
@@ -35,11 +44,14 @@ from lando.main.scm import (
     TreeApprovalRequired,
     TreeClosed,
 )
-from lando.pushlog.pushlog import PushLog, PushLogForRepo
-from lando.utils.config import read_lando_config
+from lando.pushlog.pushlog import PushLog, PushLogForRepo, new_pushlog
+from lando.utils.config import read_autoformat_patterns, read_lando_config
 from lando.utils.github import GitHubAPIClient
 from lando.utils.landing_checks import LandingChecks
-from lando.utils.tasks import phab_trigger_repo_update
+from lando.utils.tasks import (
+    mark_phab_repo_update_pending,
+    phab_trigger_repo_update,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -50,11 +62,43 @@ AUTOFORMAT_COMMIT_MESSAGE = """
 """.strip()
 
 
+# Errors after which pushing again later is expected to succeed.
+TEMPORARY_PUSH_ERRORS = (
+    TreeClosed,
+    TreeApprovalRequired,
+    SCMLostPushRace,
+    SCMPushTimeoutException,
+    SCMInternalServerError,
+)
+
+
+@dataclass
+class TrainCar:
+    """A landing job applied in a push train, waiting to be pushed."""
+
+    job: LandingJob
+    pushlog: PushLog
+    bug_ids: list[str]
+    commit_id: str
+
+
+@dataclass
+class PreparedJob:
+    """The commits of a landing job, applied ahead of time in a separate worktree."""
+
+    job_id: int
+    revision_ids: list[int]
+    commits: list[str]
+
+
 class LandingWorker(Worker):
     job_type = LandingJob
 
     worker_type = WorkerType.LANDING
 
+    # Set after pushing a job, if the next one could be applied meanwhile.
+    prepared_job: PreparedJob | None = None
+
     @staticmethod
     def notify_user_of_landing_failure(job: LandingJob):
         """Wrapper around notify_user_of_landing_failure for convenience.
@@ -114,6 +158,9 @@ class LandingWorker(Worker):
             )
             return False
 
+        if followers := self.claim_train_jobs(job):
+            return self.run_train([job, *followers])
+
         with (
             scm.for_push(job.requester_email),
             PushLogForRepo(repo, job.requester_email) as pushlog,
@@ -130,6 +177,18 @@ class LandingWorker(Worker):
                 self.notify_user_of_landing_failure(job)
                 return True
 
+        self.finish_landing(job, repo, scm, bug_ids, commit_id)
+        return True
+
+    def finish_landing(
+        self,
+        job: LandingJob,
+        repo: Repo,
+        scm: AbstractSCM,
+        bug_ids: list[str],
+        commit_id: str,
+    ):
+        """Mark a pushed job as landed, and run the post-landing steps."""
         job.set_landed_commit_ids()
         job.transition_status(JobAction.LAND, commit_id=commit_id)
 
@@ -169,11 +228,14 @@ class LandingWorker(Worker):
                 self.notify_user_of_bug_update_failure(job, e)
 
         # Trigger update of repo in Phabricator so patches are closed quicker.
-        # Especially useful on low-traffic repositories.
-        if repo.phab_identifier:
-            self.call_task(phab_trigger_repo_update, repo.phab_identifier)
-
-        return True
+        # Especially useful on low-traffic repositories. Updates following a burst
+        # of landings are sent together.
+        if repo.phab_identifier and mark_phab_repo_update_pending(repo.phab_identifier):
+            self.call_task(
+                phab_trigger_repo_update,
+                repo.phab_identifier,
+                countdown=settings.PHABRICATOR_REPO_UPDATE_DELAY,
+            )
 
     def add_try_task_config(self, scm: AbstractSCM, **github_params):
         """
@@ -285,6 +347,61 @@ class LandingWorker(Worker):
 
         Returns a tuple of bug_ids and tip commit_id.
         """
+        self.update_repo(repo, job, scm, job.target_commit_hash)
+
+        if job.is_pull_request_job:
+            if job.handover_repo:
+                self.handover_job(scm, job)
+
+            self.convert_patches_to_diff(scm, job)
+            self.update_repo(repo, job, scm, job.target_commit_hash)
+
+        bug_ids, commit_id = self.apply_job(job, repo, scm, pushlog)
+
+        repo_push_info = f"tree: {repo.tree}, push path: {repo.push_path}"
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            preparation = self.prepare_next_job(executor, job, repo, scm)
+            try:
+                scm.push(
+                    repo.push_path,
+                    push_target=repo.push_target,
+                    force_push=repo.force_push,
+                )
+            except TEMPORARY_PUSH_ERRORS as e:
+                message = (
+                    f"`Temporary error ({e.__class__}) "
+                    f"encountered while pushing to {repo_push_info}: {e}"
+                )
+                logger.exception(message)
+                job.transition_status(JobAction.DEFER, message=message)
+                raise TemporaryFailureException(message)
+            except Exception as exc:
+                message = f"Unexpected error while pushing to {repo.name}."
+                logger.exception(message)
+                job.transition_status(
+                    JobAction.FAIL,
+                    message=f"{message}\n{exc}",
+                )
+                raise PermanentFailureException(message) from exc
+            else:
+                pushlog.confirm()
+            finally:
+                self.prepared_job = preparation.result() if preparation else None
+
+        return bug_ids, commit_id
+
+    def apply_job(
+        self,
+        job: LandingJob,
+        repo: Repo,
+        scm: AbstractSCM,
+        pushlog: PushLog,
+    ) -> tuple[list[str], str]:
+        """Apply, format and check the patches of the job, ready to be pushed.
+
+        The new commits are added to the `pushlog`. Returns a tuple of bug_ids and
+        tip commit_id.
+        """
 
         def apply_patch(revision: Revision):
             logger.debug(f"Landing {revision} ...")
@@ -295,28 +412,23 @@ class LandingWorker(Worker):
                 revision.timestamp,
             )
 
-        self.update_repo(repo, job, scm, job.target_commit_hash)
-
-        if job.is_pull_request_job:
-            if job.handover_repo:
-                self.handover_job(scm, job)
-
-            self.convert_patches_to_diff(scm, job)
-            self.update_repo(repo, job, scm, job.target_commit_hash)
+        # Run through the patches one by one and try to apply them, unless they
+        # were already applied while pushing the previous job.
+        if not self.apply_prepared_job(repo, job, scm):
+            logger.debug(
+                f"About to land {job.revisions.count()} revisions: {job.revisions.all()} ..."
+            )
+            revisions = list(job.revisions.all())
+            for revision in revisions:
+                self.handle_new_commit_failures(apply_patch, repo, job, scm, revision)
 
-        # Run through the patches one by one and try to apply them.
-        logger.debug(
-            f"About to land {job.revisions.count()} revisions: {job.revisions.all()} ..."
-        )
-        for revision in job.revisions.all():
-            self.handle_new_commit_failures(apply_patch, repo, job, scm, revision)
+                new_commit = scm.describe_commit()
+                logger.debug(f"Created new commit {new_commit}")
 
-            new_commit = scm.describe_commit()
-            logger.debug(f"Created new commit {new_commit}")
+                # Record the commit ID on the revision object.
+                revision.commit_id = new_commit.hash
 
-            # Record the commit ID on the revision object.
-            revision.commit_id = new_commit.hash
-            revision.save()
+            Revision.objects.bulk_update(revisions, ["commit_id"])
 
         # Get the changeset titles for the stack.
         changeset_titles = scm.changeset_descriptions()
@@ -367,39 +479,241 @@ class LandingWorker(Worker):
         # We'll only confirm them if the push succeeds.
         for commit in new_commits:
             pushlog.add_commit(commit)
-        repo_push_info = f"tree: {repo.tree}, push path: {repo.push_path}"
+
+        return bug_ids, commit_id
+
+    def claim_train_jobs(self, job: LandingJob) -> list[LandingJob]:
+        """Claim the jobs queued after `job` which can be pushed along with it.
+
+        Up to `LANDING_WORKER_PUSH_TRAIN_SIZE - 1` consecutive submitted jobs for the
+        same repository are claimed, stopping at the first one which can't be part of
+        a push train, so that jobs still land in queue order.
+        """
+        repo = job.target_repo
+        max_followers = settings.LANDING_WORKER_PUSH_TRAIN_SIZE - 1
+        if (
+            max_followers < 1
+            or not repo.scm.supports_push_trains
+            or not self.can_join_train(job)
+        ):
+            return []
+
+        followers = []
+        with transaction.atomic():
+            queued = LandingJob.next_job(repositories=[repo]).exclude(id=job.id)
+            for follower in queued[:max_followers]:
+                if follower.status != JobStatus.SUBMITTED or not self.can_join_train(
+                    follower
+                ):
+                    break
+                followers.append(follower)
+
+            for follower in followers:
+                follower.status = JobStatus.IN_PROGRESS
+                follower.attempts += 1
+                follower.save()
+
+        if followers:
+            logger.info(f"Pushing {job} along with {followers}.")
+        return followers
+
+    @staticmethod
+    def can_join_train(job: LandingJob) -> bool:
+        """Whether the job can be landed on top of other jobs, in a push train."""
+        return not (
+            job.is_pull_request_job or job.handover_repo_id or job.target_commit_hash
+        )
+
+    def run_train(self, jobs: list[LandingJob]) -> bool:
+        """Land several jobs for the same repository with a single push.
+
+        The jobs are applied in order on the same work branch, each with its own
+        checks, pushlog and failure handling. If the push is rejected, the train is
+        bisected to find the job causing it, which fails on its own, while the jobs
+        before it land and the jobs after it are deferred.
+
+        Return whether the first job is in a final state, as `run_job` does.
+        """
+        lead = jobs[0]
+        repo: Repo = lead.target_repo
+        scm = repo.scm
+
+        with scm.for_push(lead.requester_email):
+            try:
+                self.update_repo(repo, lead, scm, None)
+            except (TemporaryFailureException, PermanentFailureException) as exc:
+                self.defer_jobs(jobs[1:], f"Could not update {repo.name}: {exc}")
+                raise
+
+        cars = []
+        for job in jobs:
+            pushlog = new_pushlog(repo, job.requester_email)
+            try:
+                with scm.for_push(job.requester_email):
+                    bug_ids, commit_id = self.apply_job(job, repo, scm, pushlog)
+            except PermanentFailureException:
+                self.notify_user_of_landing_failure(job)
+            except TemporaryFailureException:
+                # The job status has already been updated.
+                pass
+            except Exception as exc:
+                logger.exception(exc)
+                job.transition_status(
+                    JobAction.FAIL,
+                    message=f"Unexpected error while landing {job}.\n{exc}",
+                )
+                self.notify_user_of_landing_failure(job)
+            else:
+                # Apply the next job on top of this one, as if it had been pushed.
+                scm.mark_as_upstream()
+                cars.append(TrainCar(job, pushlog, bug_ids, commit_id))
+                continue
+
+            # Drop whatever this job left, and continue from the previous one.
+            scm.clean_repo()
+
+        pushed, error = self.push_train(repo, scm, cars) if cars else (0, None)
+
+        for car in cars[:pushed]:
+            car.pushlog.confirm()
+            car.pushlog.record_push()
+            self.finish_landing(car.job, repo, scm, car.bug_ids, car.commit_id)
+
+        if error:
+            culprit, *remaining = cars[pushed:]
+            repo_push_info = f"tree: {repo.tree}, push path: {repo.push_path}"
+            if isinstance(error, TEMPORARY_PUSH_ERRORS):
+                message = (
+                    f"`Temporary error ({error.__class__}) "
+                    f"encountered while pushing to {repo_push_info}: {error}"
+                )
+                self.defer_jobs([car.job for car in [culprit, *remaining]], message)
+            else:
+                message = f"Unexpected error while pushing to {repo.name}."
+                culprit.job.transition_status(
+                    JobAction.FAIL, message=f"{message}\n{error}"
+                )
+                self.notify_user_of_landing_failure(culprit.job)
+                self.defer_jobs(
+                    [car.job for car in remaining],
+                    f"Pushing {culprit.job} along with this job failed - retrying later.",
+                )
+
+        return lead.status != JobStatus.DEFERRED
+
+    def push_train(
+        self, repo: Repo, scm: AbstractSCM, cars: list[TrainCar]
+    ) -> tuple[int, Exception | None]:
+        """Push the commits of `cars`, bisecting them if the push is rejected.
+
+        Return the number of cars which were pushed, in order, and the error which
+        prevented pushing the next one, if any.
+        """
         try:
+            scm.reset_to(cars[-1].commit_id)
             scm.push(
                 repo.push_path,
                 push_target=repo.push_target,
                 force_push=repo.force_push,
             )
-        except (
-            TreeClosed,
-            TreeApprovalRequired,
-            SCMLostPushRace,
-            SCMPushTimeoutException,
-            SCMInternalServerError,
-        ) as e:
-            message = (
-                f"`Temporary error ({e.__class__}) "
-                f"encountered while pushing to {repo_push_info}: {e}"
-            )
-            logger.exception(message)
+        except TEMPORARY_PUSH_ERRORS as exc:
+            logger.warning(f"Temporary error while pushing {len(cars)} jobs: {exc}")
+            return 0, exc
+        except Exception as exc:
+            if len(cars) == 1:
+                logger.exception(f"Error while pushing {cars[0].job}.")
+                return 0, exc
+
+            logger.warning(f"Error while pushing {len(cars)} jobs, bisecting: {exc}")
+            half = len(cars) // 2
+            pushed, error = self.push_train(repo, scm, cars[:half])
+            if error:
+                return pushed, error
+
+            pushed, error = self.push_train(repo, scm, cars[half:])
+            return half + pushed, error
+
+        return len(cars), None
+
+    @staticmethod
+    def defer_jobs(jobs: list[LandingJob], message: str):
+        for job in jobs:
             job.transition_status(JobAction.DEFER, message=message)
-            raise TemporaryFailureException(message)
+
+    def prepare_next_job(
+        self,
+        executor: ThreadPoolExecutor,
+        job: LandingJob,
+        repo: Repo,
+        scm: AbstractSCM,
+    ) -> Future | None:
+        """Start applying the next queued job for `repo` on top of `job`.
+
+        The patches are applied in a separate worktree while `job` is being pushed,
+        and the resulting commits are picked up by `apply_prepared_job`.
+        """
+        if not settings.LANDING_WORKER_PIPELINE_JOBS:
+            return None
+
+        next_job = (
+            LandingJob.job_queue_query(repositories=[repo]).exclude(id=job.id).first()
+        )
+        if not next_job or next_job.is_pull_request_job or next_job.target_commit_hash:
+            return None
+
+        # Only the SCM is used from the other thread, so read what's needed now.
+        revisions = list(next_job.revisions.all())
+        patches = [(r.diff, r.commit_message, r.author, r.timestamp) for r in revisions]
+        base = scm.head_ref()
+
+        def prepare() -> PreparedJob | None:
+            try:
+                worktree = scm.worktree(f"{scm.path}-next", base)
+                if not worktree:
+                    return None
+
+                commits = []
+                for patch in patches:
+                    worktree.apply_patch(*patch)
+                    commits.append(worktree.head_ref())
+            except Exception as exc:
+                logger.info(f"Could not prepare {next_job} ahead of time: {exc}")
+                return None
+
+            logger.info(f"Prepared {next_job} on top of {base}.")
+            return PreparedJob(next_job.id, [r.id for r in revisions], commits)
+
+        return executor.submit(prepare)
+
+    def apply_prepared_job(self, repo: Repo, job: LandingJob, scm: AbstractSCM) -> bool:
+        """Cherry-pick the commits prepared for `job` while the previous job pushed.
+
+        Return `False` if there are none, or if they don't apply anymore. The
+        repository is then left ready for the patches to be applied.
+        """
+        prepared, self.prepared_job = self.prepared_job, None
+
+        revisions = list(job.revisions.all())
+        if (
+            not prepared
+            or prepared.job_id != job.id
+            or prepared.revision_ids != [r.id for r in revisions]
+        ):
+            return False
+
+        try:
+            for revision, commit in zip(revisions, prepared.commits, strict=True):
+                scm.cherry_pick_commit(commit)
+                revision.commit_id = scm.head_ref()
         except Exception as exc:
-            message = f"Unexpected error while pushing to {repo.name}."
-            logger.exception(message)
-            job.transition_status(
-                JobAction.FAIL,
-                message=f"{message}\n{exc}",
-            )
-            raise PermanentFailureException(message) from exc
-        else:
-            pushlog.confirm()
+            logger.info(f"Could not reuse the prepared commits of {job}: {exc}")
+            self.update_repo(repo, job, scm, job.target_commit_hash)
+            return False
 
-        return bug_ids, commit_id
+        Revision.objects.bulk_update(revisions, ["commit_id"])
+
+        logger.debug(f"Reused the prepared commits of {job}.")
+        return True
 
     def autoformat(
         self,
@@ -459,9 +773,9 @@ class LandingWorker(Worker):
             if should_amend_autoformat:
                 # Update the `commit_id` field to reflect the new commit SHA after
                 # applying autoformatting changes.
-                revision = job.revisions.first()
-                revision.commit_id = replacements[0]
-                revision.save()
+                Revision.objects.filter(
+                    id=Subquery(job.revisions.values("id")[:1])
+                ).update(commit_id=replacements[0])
 
         return
 
@@ -473,7 +787,7 @@ class LandingWorker(Worker):
         should_amend_autoformat: bool,
     ) -> list[str] | None:
         try:
-            self.format_stack(landoini_config, scm.path)
+            self.format_stack(landoini_config, scm)
         except AutoformattingException as exc:
             logger.warning("Failed to format the stack.")
             logger.exception(exc)
@@ -492,21 +806,40 @@ class LandingWorker(Worker):
         return replacements
 
     def format_stack(
-        self, landoini_config: configparser.ConfigParser, repo_path: str
+        self, landoini_config: configparser.ConfigParser | None, scm: AbstractSCM
     ) -> None:
-        """Format the patch stack for landing.
+        """Format the files changed by the patch stack for landing.
 
-        Return a list of `str` commit hashes where autoformatting was applied,
-        or `None` if autoformatting was skipped. Raise `AutoformattingException`
-        if autoformatting failed for the current job.
+        Only the formatters whose patterns match the changed files are run, and
+        `mach` isn't run at all if none do. Formatting results are cached by tree
+        hash, so that landing the same stack again doesn't run the formatters.
+        Raise `AutoformattingException` if autoformatting failed for the current job.
         """
         # If `mach` is not at the root of the repo, we can't autoformat.
-        if not self.mach_path(repo_path):
+        if not self.mach_path(scm.path):
             logger.info("No `./mach` in the repo - skipping autoformat.")
             return None
 
         try:
-            self.run_code_formatters(repo_path)
+            formatters, paths = self.select_formatters(landoini_config, scm)
+        except SCMException as exc:
+            raise AutoformattingException(
+                "Failed to find the files to format.", details=exc.err
+            ) from exc
+
+        if not paths:
+            logger.info("No changed files to format - skipping autoformat.")
+            return None
+
+        cache_key = self.autoformat_cache_key(scm.tree_hash(), formatters, paths)
+        if (formatted := cache.get(cache_key)) is not None:
+            logger.info(f"Reusing formatting of {len(paths)} files from a prior run.")
+            self.write_checkout_files(scm.path, formatted)
+            return None
+
+        original = self.read_checkout_files(scm.path, paths)
+        try:
+            self.run_code_formatters(scm.path, paths, formatters)
         except subprocess.CalledProcessError as exc:
             logger.warning("Failed to run automated code formatters.")
             logger.exception(exc)
@@ -516,14 +849,72 @@ class LandingWorker(Worker):
                 details=exc.stdout,
             )
 
-    def run_code_formatters(self, path: str) -> str:
+        formatted = {
+            path: content
+            for path, content in self.read_checkout_files(scm.path, paths).items()
+            if content != original[path]
+        }
+        cache.set(cache_key, formatted, settings.AUTOFORMAT_CACHE_TTL)
+
+    def select_formatters(
+        self, landoini_config: configparser.ConfigParser | None, scm: AbstractSCM
+    ) -> tuple[list[str], list[str]]:
+        """Return the formatters to run, and the changed files to run them on.
+
+        An empty list of formatters means that all of them should run, which is the
+        case when `.lando.ini` doesn't set formatter patterns.
+        """
+        paths = [
+            path for path in scm.changed_paths() if (Path(scm.path) / path).is_file()
+        ]
+
+        patterns = read_autoformat_patterns(landoini_config) if landoini_config else {}
+        if not patterns:
+            return [], paths
+
+        def matches(path: str, formatter: str) -> bool:
+            return any(fnmatch.fnmatchcase(path, p) for p in patterns[formatter])
+
+        formatters = [
+            formatter
+            for formatter in sorted(patterns)
+            if any(matches(path, formatter) for path in paths)
+        ]
+        paths = [path for path in paths if any(matches(path, f) for f in formatters)]
+        return formatters, paths
+
+    @staticmethod
+    def autoformat_cache_key(
+        tree_hash: str, formatters: list[str], paths: list[str]
+    ) -> str:
+        """Return the cache key for the formatting of `paths` in a tree."""
+        digest = hashlib.sha256(
+            json.dumps([tree_hash, formatters, sorted(paths)]).encode("utf-8")
+        ).hexdigest()
+        return f"autoformat:{digest}"
+
+    @staticmethod
+    def read_checkout_files(path: str, files: list[str]) -> dict[str, bytes]:
+        return {file: (Path(path) / file).read_bytes() for file in files}
+
+    @staticmethod
+    def write_checkout_files(path: str, contents: dict[str, bytes]):
+        for file, content in contents.items():
+            (Path(path) / file).write_bytes(content)
+
+    def run_code_formatters(
+        self, path: str, files: list[str], formatters: list[str]
+    ) -> str:
         """Run automated code formatters, returning the output of the process.
 
-        Changes made by code formatters are applied to the working directory and
-        are not committed into version control.
+        Only the given `formatters` are run, or all of them if it is empty, on the
+        given `files`. Changes made by code formatters are applied to the working
+        directory and are not committed into version control.
         """
+        linter_args = [arg for formatter in formatters for arg in ("-l", formatter)]
         return self.run_mach_command(
-            path, ["format", "--fix", "--outgoing", "--verbose", "--skip-android"]
+            path,
+            ["format", "--fix", "--verbose", "--skip-android", *linter_args, *files],
         )
 
     def run_mach_command(self, path: str, args: list[str]) -> str:
@@ -590,9 +981,14 @@ class LandingWorker(Worker):
         return scm.format_stack_tip(AUTOFORMAT_COMMIT_MESSAGE.format(bugs=bug_string))
 
     def bootstrap_repos(self):
-        """Optional method to bootstrap repositories in the the work directory."""
+        """Optional method to bootstrap repositories in the the work directory.
+
+        Repos are bootstrapped concurrently, up to
+        `LANDING_WORKER_REPO_BOOTSTRAP_CONCURRENCY` at a time. Failures are logged
+        but don't prevent the worker from starting.
+        """
         logger.info("Bootstrapping applicable repos...")
-        repos = self.worker_instance.enabled_repos.filter(autoformat_enabled=True)
+        repos = list(self.worker_instance.enabled_repos.filter(autoformat_enabled=True))
         command = [
             "bootstrap",
             "--no-system-changes",
@@ -600,14 +996,20 @@ class LandingWorker(Worker):
             "browser",
         ]
 
-        for repo in repos:
-            try:
-                self.run_mach_command(repo.path, command)
-            except subprocess.CalledProcessError as exc:
+        failures = run_for_repos(
+            lambda repo: self.run_mach_command(repo.path, command),
+            repos,
+            description="bootstrapping",
+            max_workers=settings.LANDING_WORKER_REPO_BOOTSTRAP_CONCURRENCY,
+            max_attempts=settings.LANDING_WORKER_REPO_PREPARE_ATTEMPTS,
+        )
+
+        for repo, exc in failures.items():
+            if isinstance(exc, subprocess.CalledProcessError):
                 logger.warning(
                     f"Error `running mach` bootstrap for repo {repo.name}: {exc}"
                 )
-            except Exception as exc:
+            else:
                 sentry_sdk.capture_exception(exc)
                 logger.warning(
                     f"Unexpected error running `mach bootstrap` for repo {repo.name}: {exc}"
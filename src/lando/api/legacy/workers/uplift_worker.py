@@ -88,9 +88,9 @@ class UpliftWorker(Worker):
             Cherry-pick a commit to the tip of the target train,
             or apply patches as fallback.
             """
-            commit_id = revision.get_latest_landing_commit_id()
+            commit_id = landing_commit_ids[revision.id]
 
-            if commit_id and scm.commit_exists(commit_id):
+            if commit_id and existing_commits[commit_id]:
                 logger.debug(f"Cherry-picking {revision} with commit_id: {commit_id}")
                 try:
                     scm.cherry_pick_commit(commit_id)
@@ -121,7 +121,15 @@ class UpliftWorker(Worker):
         # Update to the latest commit in the target train.
         base_revision = self.update_repo(repo, job, scm, target_cset=None)
 
-        for uplift_revision in job.revisions.all():
+        uplift_revisions = list(job.revisions.all())
+        landing_commit_ids = {
+            revision.id: revision.get_latest_landing_commit_id()
+            for revision in uplift_revisions
+        }
+        # Check all the landing commits at once, rather than once per revision.
+        existing_commits = scm.commits_exist(filter(None, landing_commit_ids.values()))
+
+        for uplift_revision in uplift_revisions:
             self.handle_new_commit_failures(
                 apply_uplift_revision, repo, job, scm, uplift_revision
             )
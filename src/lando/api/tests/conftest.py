@@ -1,5 +1,6 @@
 import json
 import os
+import threading
 from pathlib import Path
 from typing import Callable
 from unittest import mock
@@ -23,7 +24,7 @@ from lando.api.legacy.workers.landing_worker import LandingWorker
 from lando.api.legacy.workers.uplift_worker import (
     UpliftWorker,
 )
-from lando.api.tests.mocks import PhabricatorDouble
+from lando.api.tests.mocks import FakeConduitServer, PhabricatorDouble
 from lando.main.models import JobStatus, Repo, Revision
 from lando.main.models.uplift import (
     RevisionUpliftJob,
@@ -135,6 +136,17 @@ def request_mocker():
         yield m
 
 
+@pytest.fixture
+def fake_conduit():
+    """Run a local conduit server, see `FakeConduitServer`."""
+    server = FakeConduitServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
 @pytest.fixture
 def phabdouble(monkeypatch):
     """Mock the Phabricator service and build fake response objects."""
@@ -1,7 +1,11 @@
 import hashlib
 import json
+import threading
+import time
 from collections import defaultdict
 from copy import deepcopy
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs
 
 from typing_extensions import Any
 
@@ -167,7 +171,7 @@ class PhabricatorDouble:
         self._edges = []
         self._handlers = self._build_handlers()
 
-        monkeypatch.setattr(PhabricatorClient, "call_conduit", self.call_conduit)
+        monkeypatch.setattr(PhabricatorClient, "request_conduit", self.call_conduit)
 
     def call_conduit(self, method, **kwargs):
         handler = self._handlers.get(method)
@@ -1917,3 +1921,86 @@ class TreeStatusDouble:
 
     def get_treestatus_client(self):
         return TreeStatus(url=self.url)
+
+
+class FakeConduitServer(ThreadingHTTPServer):
+    """A local conduit server, with injectable latency and failures.
+
+    Search methods return one item per PHID of their `phids` constraint, in pages of
+    100 items. PHIDs must end with the ID of the item. Each entry of `failures` is
+    consumed by one request, and makes it either `"unavailable"` (HTTP 503) or
+    `"slow"` (answered after 2 seconds).
+    """
+
+    daemon_threads = True
+    block_on_close = False
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), FakeConduitHandler)
+        self.lock = threading.Lock()
+        self.latency = 0
+        self.failures = []
+        self.requests = []
+        self.connections = set()
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}/"
+
+
+class FakeConduitHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        server = self.server
+        length = int(self.headers["Content-Length"])
+        params = json.loads(parse_qs(self.rfile.read(length).decode())["params"][0])
+        method = self.path.rsplit("/", 1)[-1]
+
+        with server.lock:
+            server.requests.append((method, params))
+            server.connections.add(self.client_address)
+            server.in_flight += 1
+            server.max_in_flight = max(server.max_in_flight, server.in_flight)
+            failure = server.failures.pop(0) if server.failures else None
+
+        try:
+            time.sleep(2 if failure == "slow" else server.latency)
+            if failure == "unavailable":
+                self.respond(503, b"Service Unavailable")
+            else:
+                self.respond(200, json.dumps(self.result(method, params)).encode())
+        finally:
+            with server.lock:
+                server.in_flight -= 1
+
+    def result(self, method: str, params: dict) -> dict:
+        if not method.endswith(".search"):
+            return {"result": {}, "error_code": None, "error_info": None}
+
+        phids = params.get("constraints", {}).get("phids", [])
+        start = int(params.get("after") or 0)
+        end = start + 100
+        return {
+            "result": {
+                "data": [
+                    {"id": int(phid.rsplit("-", 1)[1]), "phid": phid}
+                    for phid in phids[start:end]
+                ],
+                "cursor": {"after": str(end) if end < len(phids) else None},
+            },
+            "error_code": None,
+            "error_info": None,
+        }
+
+    def respond(self, status: int, body: bytes):
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args):
+        pass
@@ -591,6 +591,34 @@ def test_HgSCM_describe_commit(hg_clone):
     assert "README" in prev_commit.files
 
 
+def test_HgSCM_last_commits_for_paths_and_commits_exist(hg_clone):
+    scm = HgSCM(str(hg_clone))
+
+    with scm.for_pull():
+        commit = scm.describe_commit()
+        prev_commit = scm.describe_commit("-2")
+
+        last_commits = scm.last_commits_for_paths(
+            ["README", "test.txt", "does-not-exist.txt"]
+        )
+        commits_exist = scm.commits_exist(
+            [commit.hash, prev_commit.hash[:12], 5 * "deadbeef", "default"]
+        )
+
+    assert last_commits == {
+        "README": prev_commit.hash,
+        "test.txt": commit.hash,
+        "does-not-exist.txt": "",
+    }
+    assert commits_exist == {
+        commit.hash: True,
+        prev_commit.hash[:12]: True,
+        5 * "deadbeef": False,
+        # Only changeset IDs are considered.
+        "default": False,
+    }
+
+
 def test_HgSCM_describe_local_changes(
     # XXX: this is a py.path, but we want to use pathlib.Path moving forwards
     hg_clone,
@@ -1,8 +1,12 @@
 import json
 
 import pytest
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
 
-from lando.main.models import JobStatus, LandingJob, Repo
+from lando.main.models import JobStatus, LandingJob, PatchBlob, Repo, Revision
+from lando.main.models.landing_job import add_job_with_revisions
+from lando.main.models.revision import RevisionLandingJob
 from lando.main.scm import SCMType
 
 
@@ -183,3 +187,201 @@ def test_landing_job_acquire_job_job_queue_query(mocked_repo_config):
     assert queue_items[0].id == jobs[2].id
     assert queue_items[1].id == jobs[0].id
     assert jobs[1] not in queue_items
+
+
+@pytest.mark.django_db
+def test_landing_job_jobs_ahead_query(mocked_repo_config):
+    repo = Repo.objects.create(name="test-repo", scm_type=SCMType.GIT)
+    jobs = [
+        LandingJob.objects.create(
+            status=JobStatus.SUBMITTED,
+            requester_email="test@example.com",
+            target_repo=repo,
+            priority=priority,
+        )
+        for priority in (0, 0, 5, 0)
+    ]
+    jobs[3].status = JobStatus.IN_PROGRESS
+    jobs[3].save()
+
+    queue = list(LandingJob.job_queue_query(repositories=[repo], grace_seconds=0))
+    for index, job in enumerate(queue):
+        ahead = job.jobs_ahead_query(repositories=[repo], grace_seconds=0)
+        assert list(ahead) == queue[:index], "Jobs ahead should match queue order."
+        assert job.queue_position(repositories=[repo], grace_seconds=0) == index
+
+    # IN_PROGRESS first, then by priority, then by creation time.
+    assert [job.id for job in queue] == [
+        jobs[3].id,
+        jobs[2].id,
+        jobs[0].id,
+        jobs[1].id,
+    ]
+
+    # Jobs which are not pending are behind the whole queue.
+    jobs[0].status = JobStatus.LANDED
+    jobs[0].save()
+    assert jobs[0].queue_position(repositories=[repo], grace_seconds=0) == 3
+
+
+@pytest.mark.django_db
+def test_landing_job_queue_api(client, landing_job):
+    first_job = landing_job(JobStatus.SUBMITTED)
+    second_job = landing_job(JobStatus.SUBMITTED)
+    second_job.target_repo = first_job.target_repo
+    second_job.save()
+
+    response = client.get(f"/landing_jobs/{second_job.id}/queue/")
+
+    assert response.status_code == 200
+    assert response.json() == {
+        "id": second_job.id,
+        "status": JobStatus.SUBMITTED.value,
+        "position": 1,
+        "ahead": [first_job.id],
+    }
+
+    second_job.status = JobStatus.LANDED
+    second_job.save()
+    response = client.get(f"/landing_jobs/{second_job.id}/queue/")
+
+    assert response.status_code == 200
+    assert response.json()["position"] is None
+
+    response = client.get("/landing_jobs/0/queue/")
+    assert response.status_code == 404
+
+
+@pytest.mark.django_db
+def test_landing_job_revision_bookkeeping_queries_independent_of_stack_size(repo_mc):
+    repo = repo_mc(scm_type=SCMType.GIT)
+
+    query_counts = {}
+    for stack_size in (1, 50):
+        revisions = Revision.objects.bulk_create(
+            Revision(
+                revision_id=stack_size * 100 + i,
+                diff_id=stack_size * 100 + i,
+                commit_id=f"{stack_size * 100 + i:040x}",
+            )
+            for i in range(stack_size)
+        )
+
+        with CaptureQueriesContext(connection) as queries:
+            job = add_job_with_revisions(
+                revisions,
+                status=JobStatus.SUBMITTED,
+                requester_email="test@example.com",
+                target_repo=repo,
+            )
+            job.sort_revisions(revisions[::-1])
+            job.set_landed_revision_diffs()
+            job.set_landed_commit_ids()
+        query_counts[stack_size] = len(queries)
+
+        revision_jobs = RevisionLandingJob.objects.filter(landing_job=job)
+        assert [
+            (revision_job.revision_id, revision_job.diff_id, revision_job.commit_id)
+            for revision_job in revision_jobs.order_by("index")
+        ] == [
+            (revision.id, revision.diff_id, revision.commit_id)
+            for revision in revisions[::-1]
+        ]
+
+    assert (
+        query_counts[1] == query_counts[50]
+    ), "Bookkeeping should use a constant number of queries, whatever the stack size."
+
+
+@pytest.mark.benchmark
+@pytest.mark.django_db
+def test_benchmark_landing_job_next_job(mocked_repo_config, benchmark_timer):
+    repos = [
+        Repo.objects.create(name=f"bench-repo-{i}", scm_type=SCMType.GIT)
+        for i in range(5)
+    ]
+    final_statuses = JobStatus.final()
+    pending_statuses = [JobStatus.SUBMITTED] * 8 + [JobStatus.DEFERRED] * 2
+
+    LandingJob.objects.bulk_create(
+        (
+            LandingJob(
+                status=final_statuses[i % len(final_statuses)],
+                requester_email="test@example.com",
+                target_repo=repos[i % len(repos)],
+            )
+            for i in range(100_000)
+        ),
+        batch_size=5_000,
+    )
+    LandingJob.objects.bulk_create(
+        LandingJob(
+            status=pending_statuses[i % len(pending_statuses)],
+            requester_email="test@example.com",
+            target_repo=repos[i % len(repos)],
+            priority=i % 3,
+        )
+        for i in range(1_000)
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(f"ANALYZE {LandingJob._meta.db_table}")
+
+    def next_job():
+        with transaction.atomic():
+            assert LandingJob.next_job(repositories=repos[:1], grace_seconds=0).first()
+
+    benchmark_timer("next_job, 100k historical/1k pending", next_job, rounds=50)
+
+
+@pytest.mark.benchmark
+@pytest.mark.django_db
+def test_benchmark_landing_job_list_with_patches(
+    request, mocked_repo_config, benchmark_timer
+):
+    repo = Repo.objects.get(name="mozilla-central")
+    diff_lines = "".join(f"+line {i} of a fairly typical patch\n" for i in range(5_000))
+
+    patch_size = 0
+    for i in range(200):
+        # Every other job resubmits the same diff, as try pushes and uplifts do.
+        diff = (
+            f"diff --git a/file{i // 2}.txt b/file{i // 2}.txt\n"
+            f"--- a/file{i // 2}.txt\n"
+            f"+++ b/file{i // 2}.txt\n"
+            "@@ -0,0 +1,5000 @@\n"
+            f"{diff_lines}"
+        )
+        revision = Revision.new_from_patch(
+            raw_diff=diff,
+            patch_data={
+                "author_name": "A. Uthor",
+                "author_email": "author@moz.test",
+                "commit_message": f"Bug {i // 2} - Benchmark patch",
+                "timestamp": "0",
+            },
+        )
+        patch_size += len(revision.patch_bytes)
+        add_job_with_revisions(
+            [revision],
+            status=JobStatus.LANDED,
+            requester_email="test@example.com",
+            target_repo=repo,
+        )
+
+    with connection.cursor() as cursor:
+        for model in (Revision, PatchBlob):
+            cursor.execute("SELECT pg_total_relation_size(%s)", [model._meta.db_table])
+            request.node.user_properties.append(
+                (f"size:{model._meta.db_table}", f"{cursor.fetchone()[0]} bytes")
+            )
+    request.node.user_properties.append(
+        ("size:uncompressed patches", f"{patch_size} bytes")
+    )
+
+    def list_jobs():
+        jobs = LandingJob.objects.filter(target_repo=repo).prefetch_related(
+            "unsorted_revisions"
+        )
+        assert sum(len(job.unsorted_revisions.all()) for job in jobs) == 200
+
+    benchmark_timer("landing job list, 200 jobs with 180KB patches", list_jobs)
@@ -1,14 +1,19 @@
 import io
 import itertools
 import re
+import time
 import unittest.mock as mock
 from datetime import datetime
+from pathlib import Path
 from typing import Callable
 
 import pytest
+from django.core.cache import cache
+from django.test import override_settings
 
 from lando.api.legacy.workers.landing_worker import (
     AUTOFORMAT_COMMIT_MESSAGE,
+    PreparedJob,
 )
 from lando.api.tests.mocks import TreeStatusDouble
 from lando.conftest import FAILING_CHECK_TYPES
@@ -19,7 +24,11 @@ from lando.main.models import (
     RevisionLandingJob,
 )
 from lando.main.scm import SCMType
-from lando.main.scm.exceptions import SCMInternalServerError
+from lando.main.scm.exceptions import (
+    SCMException,
+    SCMInternalServerError,
+    SCMLostPushRace,
+)
 from lando.main.scm.helpers import HgPatchHelper
 from lando.main.scm.hg import LostPushRace
 from lando.pushlog.models.commit import Commit
@@ -183,6 +192,26 @@ new file mode 100755
 
 """.lstrip()
 
+PATCH_FORMATTING_PATTERN_TXT = PATCH_FORMATTING_PATTERN_PASS.replace(
+    "+enabled = True\n+\n", "+enabled = True\n+mocking:pattern = *.txt\n"
+)
+
+PATCH_UNFORMATTED = r"""
+# HG changeset patch
+# User Test User <test@example.com>
+# Date 0 0
+#      Thu Jan 01 00:00:00 1970 +0000
+# Diff Start Line 7
+bug 123: add a file no formatter handles
+
+diff --git a/notes.md b/notes.md
+new file mode 100644
+--- /dev/null
++++ b/notes.md
+@@ -0,0 +1,1 @@
++Not formatted
+""".lstrip()
+
 PATCH_FORMATTED_1 = r"""
 # HG changeset patch
 # User Test User <test@example.com>
@@ -1114,6 +1143,61 @@ def test_format_single_success_changed(
     ), "Autoformat via amending should only land a single commit."
 
 
+@pytest.mark.django_db
+def test_format_single_success_changed_target_commit_hash(
+    repo_mc,
+    treestatusdouble,
+    mock_phab_trigger_repo_update_apply_async,
+    create_patch_revision,
+    make_landing_job,
+    get_landing_worker,
+):
+    """Test formatting a commit landed on top of a specific commit.
+
+    The work branch is then created from a commit, and has no upstream branch.
+    """
+    repo = repo_mc(SCMType.GIT, autoformat_enabled=True)
+    treestatusdouble.open_tree(repo.name)
+    scm = repo.scm
+
+    # Push the `mach` formatting patch.
+    with scm.for_push("test@example.com"):
+        ph = HgPatchHelper.from_string_io(io.StringIO(PATCH_FORMATTING_PATTERN_PASS))
+        scm.apply_patch(
+            ph.get_diff(),
+            ph.get_commit_description(),
+            ph.get_header("User"),
+            ph.get_header("Date"),
+        )
+        scm.push(repo.push_path)
+        pre_landing_tip = scm.describe_commit().hash
+
+    job = make_landing_job(
+        revisions=[create_patch_revision(2, patch=PATCH_FORMATTED_1)],
+        status=JobStatus.IN_PROGRESS,
+        requester_email="test@example.com",
+        target_repo=repo,
+        target_commit_hash=pre_landing_tip,
+        attempts=1,
+    )
+
+    worker = get_landing_worker(SCMType.GIT)
+    assert worker.run_job(job), "`run_job` should return `True` on a successful run."
+
+    assert (
+        job.status == JobStatus.LANDED
+    ), "Successful landing should set `LANDED` status."
+
+    with scm.for_push(job.requester_email):
+        tip_content = scm.read_checkout_file("test.txt").encode("utf-8")
+        parent_rev = scm.describe_commit().parents[0]
+
+    assert tip_content == TESTTXT_FORMATTED_1, "`test.txt` is incorrect in base commit."
+    assert (
+        parent_rev == pre_landing_tip
+    ), "The landing should be based on the target commit."
+
+
 @pytest.mark.parametrize(
     "repo_type",
     [
@@ -1303,6 +1387,623 @@ def test_format_patch_no_landoini(
     ), "Successful landing should trigger Phab repo update."
 
 
+def _push_patch(repo: Repo, patch: str):
+    """Apply an Hg-formatted patch and push it to the repo."""
+    scm = repo.scm
+    with scm.for_push("test@example.com"):
+        ph = HgPatchHelper.from_string_io(io.StringIO(patch))
+        scm.apply_patch(
+            ph.get_diff(),
+            ph.get_commit_description(),
+            ph.get_header("User"),
+            ph.get_header("Date"),
+        )
+        scm.push(repo.push_path)
+
+
+@pytest.mark.parametrize(
+    "repo_type",
+    [
+        SCMType.GIT,
+        SCMType.HG,
+    ],
+)
+@pytest.mark.django_db
+def test_format_skipped_without_matching_formatter(
+    repo_mc,
+    treestatusdouble,
+    mock_phab_trigger_repo_update_apply_async,
+    create_patch_revision,
+    make_landing_job,
+    get_landing_worker,
+    repo_type: str,
+):
+    """Test that `mach` isn't run when no formatter handles the changed files."""
+    repo = repo_mc(repo_type, autoformat_enabled=True)
+    treestatusdouble.open_tree(repo.name)
+    _push_patch(repo, PATCH_FORMATTING_PATTERN_TXT)
+
+    job = make_landing_job(
+        revisions=[create_patch_revision(2, patch=PATCH_UNFORMATTED)],
+        status=JobStatus.IN_PROGRESS,
+        requester_email="test@example.com",
+        target_repo=repo,
+        attempts=1,
+    )
+
+    worker = get_landing_worker(repo_type)
+    with mock.patch.object(worker, "run_mach_command") as mock_mach:
+        assert worker.run_job(
+            job
+        ), "`run_job` should return `True` on a successful run."
+
+    assert (
+        job.status == JobStatus.LANDED
+    ), "Successful landing should set `LANDED` status."
+    assert (
+        mock_mach.call_count == 0
+    ), "`mach` should not run when no formatter matches the changed files."
+
+
+@pytest.mark.parametrize(
+    "repo_type",
+    [
+        SCMType.GIT,
+        SCMType.HG,
+    ],
+)
+@pytest.mark.django_db
+def test_format_runs_matching_formatters_on_changed_files(
+    repo_mc,
+    treestatusdouble,
+    mock_phab_trigger_repo_update_apply_async,
+    create_patch_revision,
+    make_landing_job,
+    get_landing_worker,
+    repo_type: str,
+):
+    """Test that only the matching formatters run, on the matching changed files."""
+    repo = repo_mc(repo_type, autoformat_enabled=True)
+    treestatusdouble.open_tree(repo.name)
+    _push_patch(repo, PATCH_FORMATTING_PATTERN_TXT)
+
+    job = make_landing_job(
+        revisions=[
+            create_patch_revision(2, patch=PATCH_FORMATTED_1),
+            create_patch_revision(3, patch=PATCH_UNFORMATTED),
+        ],
+        status=JobStatus.IN_PROGRESS,
+        requester_email="test@example.com",
+        target_repo=repo,
+        attempts=1,
+    )
+
+    worker = get_landing_worker(repo_type)
+    with mock.patch.object(
+        worker, "run_mach_command", wraps=worker.run_mach_command
+    ) as mock_mach:
+        assert worker.run_job(
+            job
+        ), "`run_job` should return `True` on a successful run."
+
+    mock_mach.assert_called_once_with(
+        repo.path,
+        ["format", "--fix", "--verbose", "--skip-android", "-l", "mocking", "test.txt"],
+    )
+
+    with repo.scm.for_push(job.requester_email):
+        tip_content = repo.scm.read_checkout_file("test.txt").encode("utf-8")
+    assert tip_content == TESTTXT_FORMATTED_1, "`test.txt` should have been formatted."
+
+
+@override_settings(
+    CACHES={
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "test-autoformat-cache",
+        }
+    }
+)
+@pytest.mark.parametrize(
+    "repo_type",
+    [
+        SCMType.GIT,
+        SCMType.HG,
+    ],
+)
+@pytest.mark.django_db
+def test_format_reused_when_retrying_job(
+    monkeypatch,
+    repo_mc,
+    treestatusdouble,
+    mock_phab_trigger_repo_update_apply_async,
+    create_patch_revision,
+    make_landing_job,
+    get_landing_worker,
+    repo_type: str,
+):
+    """Test that landing the same stack again reuses the prior formatting."""
+    cache.clear()
+    repo = repo_mc(repo_type, autoformat_enabled=True)
+    treestatusdouble.open_tree(repo.name)
+    scm = repo.scm
+    _push_patch(repo, PATCH_FORMATTING_PATTERN_TXT)
+
+    job = make_landing_job(
+        revisions=[create_patch_revision(2, patch=PATCH_FORMATTED_1)],
+        status=JobStatus.IN_PROGRESS,
+        requester_email="test@example.com",
+        target_repo=repo,
+        attempts=1,
+    )
+
+    # Lose the push race on the first attempt only.
+    push = scm.push
+
+    def lose_first_push(*args, **kwargs):
+        if mock_push.call_count == 1:
+            raise SCMLostPushRace("Lost push race", "", "")
+        return push(*args, **kwargs)
+
+    mock_push = mock.MagicMock(side_effect=lose_first_push)
+    monkeypatch.setattr(scm, "push", mock_push)
+
+    worker = get_landing_worker(repo_type)
+    with mock.patch.object(
+        worker, "run_code_formatters", wraps=worker.run_code_formatters
+    ) as mock_formatters:
+        assert not worker.run_job(job), "The first attempt should lose the push race."
+        assert job.status == JobStatus.DEFERRED
+
+        assert worker.run_job(
+            job
+        ), "`run_job` should return `True` on a successful run."
+
+    assert (
+        job.status == JobStatus.LANDED
+    ), "Successful landing should set `LANDED` status."
+    assert (
+        mock_formatters.call_count == 1
+    ), "Formatters should not run again for the same tree."
+
+    with scm.for_push(job.requester_email):
+        tip_content = scm.read_checkout_file("test.txt").encode("utf-8")
+    assert (
+        tip_content == TESTTXT_FORMATTED_1
+    ), "Cached formatting should be applied to `test.txt`."
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("strategy", ["all-formatters", "narrowed-cached"])
+@pytest.mark.django_db
+def test_benchmark_autoformat_mixed_workload(
+    repo_mc,
+    treestatusdouble,
+    create_patch_revision,
+    make_landing_job,
+    get_landing_worker,
+    benchmark_timer,
+    settings,
+    strategy: str,
+):
+    """Time the autoformat phase of landings over a mix of stacks.
+
+    The workload alternates between a stack touching formatted files, a stack only
+    touching files no formatter handles, and a retry of the first stack. The fake
+    `mach` starts much faster than the real one, so this understates the savings.
+    """
+    repo = repo_mc(SCMType.GIT, autoformat_enabled=True)
+    treestatusdouble.open_tree(repo.name)
+    scm = repo.scm
+
+    if strategy == "narrowed-cached":
+        settings.CACHES = {
+            "default": {
+                "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+                "LOCATION": "benchmark-autoformat-cache",
+            }
+        }
+        cache.clear()
+        _push_patch(repo, PATCH_FORMATTING_PATTERN_TXT)
+    else:
+        _push_patch(repo, PATCH_FORMATTING_PATTERN_PASS)
+
+    jobs = [
+        make_landing_job(
+            revisions=[create_patch_revision(number, patch=patch)],
+            status=JobStatus.IN_PROGRESS,
+            requester_email="test@example.com",
+            target_repo=repo,
+        )
+        for number, patch in ((2, PATCH_FORMATTED_1), (3, PATCH_UNFORMATTED))
+    ]
+    workload = itertools.cycle([jobs[0], jobs[1], jobs[0]])
+    worker = get_landing_worker(SCMType.GIT)
+    current_job = None
+
+    def apply_next_job():
+        nonlocal current_job
+        current_job = next(workload)
+        scm.update_repo(repo.pull_path)
+        for revision in current_job.revisions.all():
+            scm.apply_patch(
+                revision.diff,
+                revision.commit_message,
+                revision.author,
+                revision.timestamp,
+            )
+
+    def autoformat():
+        assert not worker.autoformat(
+            current_job, scm, ["123"], scm.changeset_descriptions()
+        ), "Autoformatting should succeed."
+
+    with scm.for_push("test@example.com"):
+        benchmark_timer(
+            f"autoformat phase ({strategy})",
+            autoformat,
+            rounds=12,
+            setup=apply_next_job,
+        )
+
+
+def _new_file_patch(number: int, filename: str) -> str:
+    """Return an Hg-formatted patch adding `filename`."""
+    return rf"""
+# HG changeset patch
+# User Test User <test@example.com>
+# Date 0 0
+#      Thu Jan 01 00:00:00 1970 +0000
+# Diff Start Line 7
+bug {number}: add {filename}
+
+diff --git a/{filename} b/{filename}
+new file mode 100644
+--- /dev/null
++++ b/{filename}
+@@ -0,0 +1,1 @@
++{filename}
+""".lstrip()
+
+
+@pytest.mark.django_db
+def test_pipelined_landing_reuses_prepared_commits(
+    repo_mc,
+    treestatusdouble,
+    mock_phab_trigger_repo_update_apply_async,
+    create_patch_revision,
+    make_landing_job,
+    get_landing_worker,
+    settings,
+):
+    settings.LANDING_WORKER_PIPELINE_JOBS = True
+    repo = repo_mc(SCMType.GIT, autoformat_enabled=False)
+    treestatusdouble.open_tree(repo.name)
+    scm = repo.scm
+
+    first_job = make_landing_job(
+        revisions=[create_patch_revision(1, patch=_new_file_patch(1, "first.txt"))],
+        status=JobStatus.IN_PROGRESS,
+        target_repo=repo,
+    )
+    next_job = make_landing_job(
+        revisions=[
+            create_patch_revision(2, patch=_new_file_patch(2, "second.txt")),
+            create_patch_revision(3, patch=_new_file_patch(3, "third.txt")),
+        ],
+        status=JobStatus.SUBMITTED,
+        target_repo=repo,
+    )
+
+    worker = get_landing_worker(SCMType.GIT)
+    assert worker.run_job(
+        first_job
+    ), "`run_job` should return `True` on a successful run."
+    assert first_job.status == JobStatus.LANDED
+
+    prepared = worker.prepared_job
+    assert prepared, "The next job should have been prepared while pushing."
+    assert prepared.job_id == next_job.id
+    assert len(prepared.commits) == 2, "Each revision should have a prepared commit."
+
+    next_job.status = JobStatus.IN_PROGRESS
+    next_job.save()
+    with mock.patch.object(scm, "apply_patch", wraps=scm.apply_patch) as mock_apply:
+        assert worker.run_job(
+            next_job
+        ), "`run_job` should return `True` on a successful run."
+
+    assert next_job.status == JobStatus.LANDED
+    assert (
+        mock_apply.call_count == 0
+    ), "Prepared commits should be cherry-picked instead of applying patches."
+    assert scm.read_checkout_file("third.txt") == "third.txt\n"
+    assert [r.commit_id for r in next_job.revisions.all()] == [
+        c.hash for c in scm.describe_local_changes(first_job.landed_commit_id)
+    ], "Revisions should record the landed commits."
+    assert worker.prepared_job is None, "Prepared commits should only be used once."
+
+
+@pytest.mark.django_db
+def test_pipelined_landing_falls_back_to_applying_patches(
+    repo_mc,
+    treestatusdouble,
+    mock_phab_trigger_repo_update_apply_async,
+    create_patch_revision,
+    make_landing_job,
+    get_landing_worker,
+    settings,
+):
+    settings.LANDING_WORKER_PIPELINE_JOBS = True
+    repo = repo_mc(SCMType.GIT, autoformat_enabled=False)
+    treestatusdouble.open_tree(repo.name)
+    scm = repo.scm
+
+    revision = create_patch_revision(1, patch=_new_file_patch(1, "first.txt"))
+    job = make_landing_job(
+        revisions=[revision], status=JobStatus.IN_PROGRESS, target_repo=repo
+    )
+
+    worker = get_landing_worker(SCMType.GIT)
+    worker.prepared_job = PreparedJob(job.id, [revision.id], ["0" * 40])
+    with mock.patch.object(scm, "apply_patch", wraps=scm.apply_patch) as mock_apply:
+        assert worker.run_job(
+            job
+        ), "`run_job` should return `True` on a successful run."
+
+    assert job.status == JobStatus.LANDED
+    assert (
+        mock_apply.call_count == 1
+    ), "Patches should be applied when prepared commits can't be used."
+    assert scm.read_checkout_file("first.txt") == "first.txt\n"
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("pipelined", [False, True], ids=["serial", "pipelined"])
+@pytest.mark.django_db
+def test_benchmark_landing_throughput_with_slow_push(
+    monkeypatch,
+    repo_mc,
+    treestatusdouble,
+    mock_phab_trigger_repo_update_apply_async,
+    create_patch_revision,
+    make_landing_job,
+    get_landing_worker,
+    benchmark_timer,
+    request,
+    settings,
+    pipelined: bool,
+):
+    """Measure jobs/hour for a queue of stacks, when each push takes a while."""
+    settings.LANDING_WORKER_PIPELINE_JOBS = pipelined
+    repo = repo_mc(SCMType.GIT, autoformat_enabled=False)
+    treestatusdouble.open_tree(repo.name)
+    scm = repo.scm
+
+    push = scm.push
+
+    def slow_push(*args, **kwargs):
+        # Simulate the network round trip and server-side hooks.
+        time.sleep(0.5)
+        return push(*args, **kwargs)
+
+    monkeypatch.setattr(scm, "push", slow_push)
+
+    job_count = 8
+    revisions_per_job = 5
+    jobs = [
+        make_landing_job(
+            revisions=[
+                create_patch_revision(
+                    number, patch=_new_file_patch(number, f"file-{number}.txt")
+                )
+                for number in range(
+                    job * revisions_per_job + 1, (job + 1) * revisions_per_job + 1
+                )
+            ],
+            status=JobStatus.SUBMITTED,
+            target_repo=repo,
+        )
+        for job in range(job_count)
+    ]
+    worker = get_landing_worker(SCMType.GIT)
+
+    def land_queue():
+        for job in jobs:
+            job.status = JobStatus.IN_PROGRESS
+            job.save()
+            assert worker.run_job(job), f"{job} should have landed."
+
+    duration = benchmark_timer(
+        f"land {job_count} jobs ({request.node.callspec.id})", land_queue, rounds=1
+    )
+    request.node.user_properties.append(
+        (
+            f"benchmark:jobs/hour ({request.node.callspec.id})",
+            f"{job_count / duration * 3600:.0f}",
+        )
+    )
+
+
+@pytest.mark.django_db
+def test_push_train_lands_jobs_in_one_push(
+    repo_mc,
+    treestatusdouble,
+    mock_phab_trigger_repo_update_apply_async,
+    create_patch_revision,
+    make_landing_job,
+    get_landing_worker,
+    settings,
+):
+    settings.LANDING_WORKER_PUSH_TRAIN_SIZE = 3
+    repo = repo_mc(SCMType.GIT, autoformat_enabled=False)
+    treestatusdouble.open_tree(repo.name)
+    scm = repo.scm
+
+    jobs = [
+        make_landing_job(
+            revisions=[
+                create_patch_revision(number, patch=_new_file_patch(number, filename))
+            ],
+            status=JobStatus.IN_PROGRESS if number == 1 else JobStatus.SUBMITTED,
+            requester_email=f"user{number}@example.com",
+            target_repo=repo,
+        )
+        for number, filename in ((1, "first.txt"), (2, "second.txt"), (3, "third.txt"))
+    ]
+
+    worker = get_landing_worker(SCMType.GIT)
+    with mock.patch.object(scm, "push", wraps=scm.push) as mock_push:
+        assert worker.run_job(
+            jobs[0]
+        ), "`run_job` should return `True` on a successful run."
+
+    assert mock_push.call_count == 1, "All jobs should have been pushed at once."
+    for job in jobs:
+        job.refresh_from_db()
+        assert job.status == JobStatus.LANDED, f"{job} should have landed."
+
+    pushes = Push.objects.filter(repo=repo).order_by("push_id")
+    assert [push.user for push in pushes] == [
+        job.requester_email for job in jobs
+    ], "Each job should have its own pushlog entry, in order."
+    assert [push.commits.get().hash for push in pushes] == [
+        job.landed_commit_id for job in jobs
+    ]
+    assert jobs[2].landed_commit_id == scm.head_ref()
+
+
+@pytest.mark.django_db
+def test_push_train_bisects_rejected_push(
+    monkeypatch,
+    repo_mc,
+    treestatusdouble,
+    mock_phab_trigger_repo_update_apply_async,
+    create_patch_revision,
+    make_landing_job,
+    get_landing_worker,
+    settings,
+):
+    settings.LANDING_WORKER_PUSH_TRAIN_SIZE = 3
+    repo = repo_mc(SCMType.GIT, autoformat_enabled=False)
+    treestatusdouble.open_tree(repo.name)
+    scm = repo.scm
+
+    jobs = [
+        make_landing_job(
+            revisions=[
+                create_patch_revision(number, patch=_new_file_patch(number, filename))
+            ],
+            status=JobStatus.IN_PROGRESS if number == 1 else JobStatus.SUBMITTED,
+            target_repo=repo,
+        )
+        for number, filename in (
+            (1, "first.txt"),
+            (2, "rejected.txt"),
+            (3, "third.txt"),
+        )
+    ]
+
+    # Reject any push containing `rejected.txt`, as a server-side hook would.
+    push = scm.push
+
+    def push_with_hook(*args, **kwargs):
+        if (Path(scm.path) / "rejected.txt").exists():
+            raise SCMException("Rejected by hook", "", "pre-receive hook declined")
+        return push(*args, **kwargs)
+
+    mock_push = mock.MagicMock(side_effect=push_with_hook)
+    monkeypatch.setattr(scm, "push", mock_push)
+
+    mock_notify = mock.MagicMock()
+    monkeypatch.setattr(
+        "lando.api.legacy.workers.landing_worker.notify_user_of_landing_failure",
+        mock_notify,
+    )
+
+    worker = get_landing_worker(SCMType.GIT)
+    assert worker.run_job(
+        jobs[0]
+    ), "`run_job` should return `True` on a successful run."
+
+    for job in jobs:
+        job.refresh_from_db()
+    assert (
+        jobs[0].status == JobStatus.LANDED
+    ), "Jobs before the rejected one should land."
+    assert (
+        jobs[1].status == JobStatus.FAILED
+    ), "The rejected job should fail on its own."
+    assert "Rejected by hook" in jobs[1].error
+    assert (
+        jobs[2].status == JobStatus.DEFERRED
+    ), "Jobs after the rejected one should be retried."
+
+    mock_notify.assert_called_once()
+    assert mock_notify.call_args.args[3] == jobs[1].id
+    assert Push.objects.filter(repo=repo).count() == 1
+    assert (
+        mock_push.call_count == 4
+    ), "The train, then [first], [rejected, third] and [rejected] should be pushed."
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("train_size", [1, 4])
+@pytest.mark.django_db
+def test_benchmark_push_train_throughput(
+    git_repo,
+    repo_mc,
+    treestatusdouble,
+    mock_phab_trigger_repo_update_apply_async,
+    create_patch_revision,
+    make_landing_job,
+    get_landing_worker,
+    benchmark_timer,
+    request,
+    settings,
+    train_size: int,
+):
+    """Measure jobs/hour for a queue of jobs, against a remote with a slow hook."""
+    settings.LANDING_WORKER_PUSH_TRAIN_SIZE = train_size
+    repo = repo_mc(SCMType.GIT, autoformat_enabled=False)
+    treestatusdouble.open_tree(repo.name)
+
+    pre_receive = git_repo / ".git" / "hooks" / "pre-receive"
+    pre_receive.write_text("#!/bin/sh\nsleep 0.5\n")
+    pre_receive.chmod(0o755)
+
+    job_count = 12
+    for number in range(1, job_count + 1):
+        make_landing_job(
+            revisions=[
+                create_patch_revision(
+                    number, patch=_new_file_patch(number, f"file-{number}.txt")
+                )
+            ],
+            status=JobStatus.SUBMITTED,
+            target_repo=repo,
+        )
+    worker = get_landing_worker(SCMType.GIT)
+
+    def land_queue():
+        queue = LandingJob.job_queue_query(repositories=[repo])
+        while job := queue.filter(status=JobStatus.SUBMITTED).first():
+            job.status = JobStatus.IN_PROGRESS
+            job.save()
+            assert worker.run_job(job), f"{job} should have landed."
+
+    label = f"train size {train_size}"
+    duration = benchmark_timer(f"land {job_count} jobs ({label})", land_queue, rounds=1)
+    request.node.user_properties.append(
+        (f"benchmark:jobs/hour ({label})", f"{job_count / duration * 3600:.0f}")
+    )
+
+    assert (
+        LandingJob.objects.filter(target_repo=repo, status=JobStatus.LANDED).count()
+        == job_count
+    )
+
+
 @pytest.mark.django_db
 def test_landing_job_revisions_sorting(
     create_patch_revision,
@@ -2,14 +2,24 @@
 Tests for the PhabricatorClient
 """
 
+import threading
+import time
 import unittest.mock as mock
 
 import pytest
 import requests
 import requests_mock
+from django.conf import settings
+from django.core.cache import cache
+from django.test import override_settings
 
 from lando.api.tests.utils import phab_url
-from lando.utils.phabricator import PhabricatorAPIException
+from lando.utils.phabricator import (
+    PhabricatorAPIException,
+    PhabricatorClient,
+    PhabricatorCommunicationException,
+    clear_api_token_cache,
+)
 
 pytestmark = pytest.mark.usefixtures("docker_env_vars")
 
@@ -120,3 +130,200 @@ def test_phabricator__call_conduit_collated(get_phab_client, monkeypatch, limit)
         assert len(test["data"]) == 200
         assert test["data"][:100] == first_batch
         assert test["data"][100:] == second_batch
+
+
+@override_settings(
+    CACHES={
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "test-phabricator-cache",
+        }
+    }
+)
+def test_phabricator__whoami_is_cached(get_phab_client):
+    cache.clear()
+    phab = get_phab_client(api_key="api-key")
+    user_data = {"phid": "PHID-USER-1", "primaryEmail": "user@example.com"}
+
+    with requests_mock.mock() as m:
+        m.post(
+            phab_url("user.whoami"),
+            status_code=200,
+            json={"result": user_data, "error_code": None, "error_info": None},
+        )
+        assert phab.whoami() == user_data
+        assert phab.verify_api_token()
+        assert get_phab_client(api_key="api-key").verify_api_token()
+        assert m.call_count == 1, "Token lookups should be served from the cache"
+
+        clear_api_token_cache("api-key")
+        assert phab.verify_api_token()
+        assert m.call_count == 2, "Clearing the cache should force a new lookup"
+
+
+@override_settings(
+    CACHES={
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "test-phabricator-cache",
+        }
+    }
+)
+def test_phabricator__whoami_invalid_token_not_cached(get_phab_client):
+    cache.clear()
+    phab = get_phab_client(api_key="api-invalid")
+
+    with requests_mock.mock() as m:
+        m.post(
+            phab_url("user.whoami"),
+            status_code=200,
+            json={
+                "result": None,
+                "error_code": "ERR-INVALID-AUTH",
+                "error_info": "API token is not valid.",
+            },
+        )
+        assert phab.whoami() is None
+        assert not phab.verify_api_token()
+        assert m.call_count == 2, "Invalid tokens should not be cached"
+
+
+def test_phabricator__collated_search_fetches_chunks_concurrently(fake_conduit):
+    fake_conduit.latency = 0.2
+    phab = PhabricatorClient(fake_conduit.url, "api-key")
+    phids = [f"PHID-DREV-{i}" for i in range(250)]
+
+    result = phab.call_conduit_collated(
+        "differential.revision.search", constraints={"phids": phids}
+    )
+
+    assert [item["phid"] for item in result["data"]] == phids
+    assert [
+        len(params["constraints"]["phids"]) for _method, params in fake_conduit.requests
+    ] == [100, 100, 50], "The PHIDs should be searched in chunks of 100."
+    assert fake_conduit.max_in_flight > 1, "Chunks should be fetched concurrently."
+
+
+def test_phabricator__collated_search_follows_cursor_without_chunking(fake_conduit):
+    phab = PhabricatorClient(fake_conduit.url, "api-key")
+    phids = [f"PHID-DREV-{i}" for i in range(250)]
+
+    result = phab.call_conduit_collated(
+        "differential.revision.search", constraints={"phids": phids[:100]}
+    )
+    assert len(result["data"]) == 100
+    assert len(fake_conduit.requests) == 1
+
+    # Other constraints aren't split, and are paged through with the cursor.
+    result = phab.call_conduit_collated(
+        "differential.revision.search", constraints={"phids": phids, "other": [1]}
+    )
+    assert len(result["data"]) == 250
+
+
+def test_phabricator__connections_are_reused(fake_conduit):
+    phab = PhabricatorClient(fake_conduit.url, "api-key")
+
+    phab.call_conduit("conduit.ping")
+    PhabricatorClient(fake_conduit.url, "other-api-key").call_conduit("conduit.ping")
+
+    assert len(fake_conduit.requests) == 2
+    assert (
+        len(fake_conduit.connections) == 1
+    ), "Clients should share a keep-alive connection."
+
+
+def test_phabricator__read_only_calls_are_retried(fake_conduit, settings):
+    settings.PHABRICATOR_READ_TIMEOUT = 1
+    fake_conduit.failures = ["unavailable", "slow"]
+    phab = PhabricatorClient(fake_conduit.url, "api-key")
+
+    assert phab.call_conduit("differential.revision.search", constraints={}) == {
+        "data": [],
+        "cursor": {"after": None},
+    }
+    assert len(fake_conduit.requests) == 3
+
+    fake_conduit.failures = ["unavailable"] * 3
+    with pytest.raises(PhabricatorCommunicationException):
+        phab.call_conduit("user.whoami")
+    assert len(fake_conduit.requests) == 6, "A call should be retried at most twice."
+
+
+def test_phabricator__write_calls_are_not_retried(fake_conduit):
+    fake_conduit.failures = ["unavailable"]
+    phab = PhabricatorClient(fake_conduit.url, "api-key")
+
+    with pytest.raises(PhabricatorCommunicationException):
+        phab.call_conduit("differential.revision.edit", transactions=[])
+    assert len(fake_conduit.requests) == 1
+
+
+def test_phabricator__searches_are_coalesced(phabdouble, monkeypatch):
+    users = [phabdouble.user(username=f"user{i}") for i in range(3)]
+    project = phabdouble.project("a-project")
+    searches = []
+
+    def counting_request_conduit(self, method, **kwargs):
+        searches.append((method, kwargs["constraints"]))
+        return phabdouble.call_conduit(method, **kwargs)
+
+    monkeypatch.setattr(PhabricatorClient, "request_conduit", counting_request_conduit)
+    phab = PhabricatorClient(
+        settings.PHABRICATOR_URL, "api-key", coalesce_searches=True
+    )
+
+    result = phab.call_conduit(
+        "user.search", constraints={"phids": [users[0]["phid"], users[1]["phid"]]}
+    )
+    assert len(result["data"]) == 2
+
+    result = phab.call_conduit(
+        "user.search",
+        constraints={"phids": [users[1]["phid"], users[2]["phid"], project["phid"]]},
+    )
+    assert [user["phid"] for user in result["data"]] == [
+        users[2]["phid"],
+        users[1]["phid"],
+    ], "Results should be returned newest first."
+    assert searches == [
+        ("user.search", {"phids": [users[0]["phid"], users[1]["phid"]]}),
+        ("user.search", {"phids": [users[2]["phid"]]}),
+    ], "Only users which weren't found already should be searched."
+
+    result = phab.call_conduit("user.search", constraints={"ids": [users[0]["id"]]})
+    assert result["data"][0]["phid"] == users[0]["phid"]
+    assert len(searches) == 2, "Users found by PHID should also be found by ID."
+
+    phab.call_conduit("user.search", constraints={"usernames": ["user0"]})
+    PhabricatorClient(settings.PHABRICATOR_URL, "api-key").call_conduit(
+        "user.search", constraints={"phids": [users[0]["phid"]]}
+    )
+    assert len(searches) == 4, "Other searches and clients should not be coalesced."
+
+
+def test_phabricator__concurrent_searches_share_requests(fake_conduit):
+    fake_conduit.latency = 0.3
+    phab = PhabricatorClient(fake_conduit.url, "api-key", coalesce_searches=True)
+    phids = [f"PHID-DREV-{i}" for i in range(90)]
+    results = {}
+
+    def search(name: str, search_phids: list[str]):
+        results[name] = phab.call_conduit(
+            "differential.revision.search", constraints={"phids": search_phids}
+        )
+
+    first = threading.Thread(target=search, args=("first", phids[:60]))
+    first.start()
+    time.sleep(0.1)
+    search("second", phids[30:])
+    first.join()
+
+    assert [
+        params["constraints"]["phids"] for _method, params in fake_conduit.requests
+    ] == [
+        phids[:60],
+        phids[60:],
+    ], "PHIDs already being searched for should not be requested again."
+    assert {item["phid"] for item in results["first"]["data"]} == set(phids[:60])
+    assert {item["phid"] for item in results["second"]["data"]} == set(phids[30:])
@@ -1,3 +1,6 @@
+import json
+from collections import Counter
+
 import pytest
 from django.http import Http404
 
@@ -13,7 +16,7 @@ from lando.api.legacy.transplants import (
     run_landing_checks,
 )
 from lando.main.models import Repo
-from lando.utils.phabricator import PhabricatorRevisionStatus
+from lando.utils.phabricator import PhabricatorClient, PhabricatorRevisionStatus
 
 
 def test_build_stack_graph_single_node(phabdouble):
@@ -922,6 +925,53 @@ def test_integrated_stack_response_mismatch_returns_404(
     assert len(result["revisions"]) == 1
 
 
+@pytest.mark.django_db
+def test_revision_page_requests_stack_data_once(
+    monkeypatch,
+    authenticated_client,
+    phabdouble,
+    mocked_repo_config,
+    release_management_project,
+    needs_data_classification_project,
+    sec_approval_project,
+    secure_project,
+):
+    repo = phabdouble.repo()
+    reviewer = phabdouble.user(username="reviewer")
+    d1 = phabdouble.diff()
+    r1 = phabdouble.revision(diff=d1, repo=repo)
+    d2 = phabdouble.diff()
+    r2 = phabdouble.revision(diff=d2, repo=repo, depends_on=[r1])
+    phabdouble.reviewer(r1, reviewer)
+    phabdouble.reviewer(r2, reviewer)
+
+    conduit_calls = Counter()
+
+    def counting_call_conduit(self, method, **kwargs):
+        conduit_calls[(method, json.dumps(kwargs, sort_keys=True))] += 1
+        return phabdouble.call_conduit(method, **kwargs)
+
+    monkeypatch.setattr(PhabricatorClient, "call_conduit", counting_call_conduit)
+
+    response = authenticated_client.get(f"/D{r2['id']}/")
+
+    assert response.status_code == 200
+    assert (
+        response.context_data["dryrun"] is not None
+    ), "The revision page should run a landing dry run."
+
+    repeated_calls = {call: count for call, count in conduit_calls.items() if count > 1}
+    assert (
+        not repeated_calls
+    ), "Each conduit request should be made once per revision page render."
+    assert {method for method, _kwargs in conduit_calls} >= {
+        "differential.revision.search",
+        "differential.diff.search",
+        "differential.getrawdiff",
+        "user.search",
+    }
+
+
 def test_revisionstack_single():
     nodes = {"123"}
     edges = set()
@@ -1015,3 +1065,91 @@ def test_revisionstack_iter_stack_no_valid_path_raises():
         ValueError, match="Could not walk from a root node to nonexistent"
     ):
         list(stack.iter_stack_from_root("nonexistent"))
+
+
+def test_revisionstack_landable_paths_diamond():
+    """Test landable paths are walked depth-first, in the order of the edges.
+
+    Graph structure, where D is the tip revision:
+        D
+        |\
+        B C
+        |/
+        A   E
+    """
+    nodes = {"A", "B", "C", "D", "E"}
+    edges = [("B", "A"), ("C", "A"), ("D", "B"), ("D", "C")]
+
+    stack = RevisionStack(nodes, edges)
+
+    assert stack.landable_paths()[:2] == [["A", "B", "D"], ["A", "C", "D"]]
+    assert ["E"] in stack.landable_paths(), "A single revision is a landable path."
+    assert list(stack.predecessors("D")) == ["B", "C"]
+
+    assert stack.is_path(["A", "C", "D"])
+    assert not stack.is_path(["A", "D"]), "A path must follow the edges."
+    assert not stack.is_path([]), "An empty path isn't a path."
+
+    assert stack.is_landable_path_prefix(["A", "B"])
+    assert not stack.is_landable_path_prefix(
+        ["B", "D"]
+    ), "A landable path must start at a root revision."
+
+    stack.remove_node("B")
+    assert stack.landable_paths()[0] == ["A", "C", "D"]
+    assert not stack.is_landable_path_prefix(["A", "B"])
+
+
+def _synthetic_stack(shape: str, size: int) -> tuple[set[str], set[tuple[str, str]]]:
+    """Return the nodes and edges of a stack of the given shape.
+
+    - `deep` is a single chain of `size` revisions.
+    - `wide` is a root revision with `size` children.
+    - `diamond` is a chain of `size` diamonds, each made of a revision with two
+      children that are both parents of the next revision.
+    """
+    if shape == "deep":
+        nodes = {f"PHID-DREV-{i}" for i in range(size)}
+        edges = {(f"PHID-DREV-{i + 1}", f"PHID-DREV-{i}") for i in range(size - 1)}
+    elif shape == "wide":
+        nodes = {f"PHID-DREV-{i}" for i in range(size + 1)}
+        edges = {(f"PHID-DREV-{i + 1}", "PHID-DREV-0") for i in range(size)}
+    else:
+        nodes = {"PHID-DREV-0"}
+        edges = set()
+        for i in range(size):
+            base, tip = f"PHID-DREV-{i * 3}", f"PHID-DREV-{i * 3 + 3}"
+            for side in (f"PHID-DREV-{i * 3 + 1}", f"PHID-DREV-{i * 3 + 2}"):
+                edges |= {(side, base), (tip, side)}
+            nodes |= {f"PHID-DREV-{i * 3 + j}" for j in (1, 2, 3)}
+    return nodes, edges
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize(
+    "shape,size,expected_paths",
+    (("deep", 1000, 1), ("wide", 1000, 1000), ("diamond", 12, 2**12)),
+)
+def test_benchmark_revisionstack_paths(
+    benchmark_timer, request, shape: str, size: int, expected_paths: int
+):
+    nodes, edges = _synthetic_stack(shape, size)
+    stack = RevisionStack(nodes, edges)
+    tip = next(stack.leaf_revisions())
+
+    landable_paths = stack.landable_paths()
+    assert len(landable_paths) == expected_paths
+    assert list(stack.iter_stack_from_root(tip)) in landable_paths
+
+    benchmark_timer(f"{shape} stack: landable paths", stack.landable_paths)
+    benchmark_timer(
+        f"{shape} stack: walk from root to tip",
+        lambda: list(stack.iter_stack_from_root(tip)),
+    )
+    benchmark_timer(
+        f"{shape} stack: landing path check",
+        lambda: stack.is_landable_path_prefix(landable_paths[-1]),
+    )
+    request.node.user_properties.append(
+        (f"benchmark:{shape} stack revisions", len(stack))
+    )
@@ -4,7 +4,11 @@ from lando.utils.phabricator import (
     PhabricatorAPIException,
     PhabricatorCommunicationException,
 )
-from lando.utils.tasks import admin_remove_phab_project
+from lando.utils.tasks import (
+    admin_remove_phab_project,
+    mark_phab_repo_update_pending,
+    phab_trigger_repo_update,
+)
 
 
 def test_admin_remove_phab_project_succeeds(phabdouble, app):
@@ -26,3 +30,30 @@ def test_admin_remove_phab_project_throws_exception_for_missing_revision(
     assert isinstance(excinfo.value, PhabricatorAPIException)
     assert not isinstance(excinfo.value, PhabricatorCommunicationException)
     assert "does not identify a valid object" in excinfo.value.error_info
+
+
+@pytest.mark.django_db
+def test_phab_trigger_repo_update_debounces_landings(settings, fake_conduit, make_repo):
+    settings.CACHES = {
+        "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+    }
+    settings.PHABRICATOR_URL = fake_conduit.url
+    first, second = [make_repo(seqno).phab_identifier for seqno in range(2)]
+
+    # Only the first landing of a burst queues a task.
+    queued = [
+        mark_phab_repo_update_pending(identifier)
+        for identifier in (first, second, first, second)
+    ]
+    assert queued == [True, False, False, False]
+
+    phab_trigger_repo_update(first)
+    assert [
+        (method, params["repositories"]) for method, params in fake_conduit.requests
+    ] == [("diffusion.looksoon", sorted([first, second]))]
+
+    # Repositories which were already updated aren't sent again.
+    assert mark_phab_repo_update_pending(second)
+    phab_trigger_repo_update(second)
+    assert len(fake_conduit.requests) == 2
+    assert fake_conduit.requests[1][1]["repositories"] == [second]
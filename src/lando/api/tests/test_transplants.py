@@ -1,11 +1,15 @@
 import json
+import time
 from typing import Any, Callable
 from unittest import mock
 from unittest.mock import MagicMock
 
 import pytest
 from django.contrib.auth.models import Permission
+from django.core.cache import cache
+from django.test import override_settings
 
+from lando.api.legacy import transplants as legacy_transplants
 from lando.api.legacy.api import transplants as legacy_api_transplants
 from lando.api.legacy.transplants import (
     RevisionWarning,
@@ -34,7 +38,11 @@ from lando.main.models import (
 from lando.main.models.revision import Revision
 from lando.main.scm import SCMType
 from lando.main.support import LegacyAPIException
-from lando.utils.phabricator import PhabricatorRevisionStatus, ReviewerStatus
+from lando.utils.phabricator import (
+    PhabricatorClient,
+    PhabricatorRevisionStatus,
+    ReviewerStatus,
+)
 from lando.utils.tasks import admin_remove_phab_project
 
 
@@ -252,6 +260,167 @@ def test_dryrun_reviewers_warns(
     assert result["confirmation_token"] is not None
 
 
+@override_settings(
+    CACHES={
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "test-stack-assessment-cache",
+        }
+    }
+)
+@pytest.mark.django_db(transaction=True)
+def test_dryrun_reuses_assessment_until_stack_changes(
+    user,
+    phabdouble,
+    make_landing_job,
+    mocked_repo_config,
+    release_management_project,
+    needs_data_classification_project,
+    monkeypatch,
+):
+    cache.clear()
+    d1 = phabdouble.diff()
+    r1 = phabdouble.revision(diff=d1, repo=phabdouble.repo())
+    phabdouble.reviewer(
+        r1, phabdouble.user(username="reviewer"), status=ReviewerStatus.REJECTED
+    )
+    phab = phabdouble.get_phabricator_client()
+    request_data = {
+        "landing_path": [{"revision_id": "D{}".format(r1["id"]), "diff_id": d1["id"]}]
+    }
+
+    result = legacy_api_transplants.dryrun(phab, user, request_data)
+
+    checks = mock.Mock(wraps=legacy_transplants.run_landing_checks)
+    monkeypatch.setattr(legacy_transplants, "run_landing_checks", checks)
+
+    assert (
+        legacy_api_transplants.dryrun(phab, user, request_data) == result
+    ), "An unchanged stack should have the same assessment."
+    assert not checks.called, "The assessment of an unchanged stack should be reused."
+
+    make_landing_job(
+        landing_path=[(r1["id"], d1["id"])],
+        status=JobStatus.SUBMITTED,
+    )
+
+    result = legacy_api_transplants.dryrun(phab, user, request_data)
+
+    assert checks.called, "A new landing job should invalidate the assessment."
+    assert result["blocker"] == (
+        "A landing for revisions in this stack is already in progress."
+    )
+
+
+@pytest.mark.benchmark
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.parametrize("cached", (False, True))
+def test_benchmark_dryrun_20_revision_stack(
+    user,
+    phabdouble,
+    mocked_repo_config,
+    release_management_project,
+    needs_data_classification_project,
+    benchmark_timer,
+    settings,
+    cached: bool,
+):
+    if cached:
+        settings.CACHES = {
+            "default": {
+                "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+                "LOCATION": "benchmark-stack-assessment-cache",
+            }
+        }
+        cache.clear()
+
+    repo = phabdouble.repo()
+    reviewer = phabdouble.user(username="reviewer")
+    landing_path = []
+    revision = None
+    for _i in range(20):
+        diff = phabdouble.diff()
+        revision = phabdouble.revision(
+            diff=diff, repo=repo, depends_on=[revision] if revision else []
+        )
+        phabdouble.reviewer(revision, reviewer)
+        landing_path.append(
+            {"revision_id": "D{}".format(revision["id"]), "diff_id": diff["id"]}
+        )
+    phab = phabdouble.get_phabricator_client()
+
+    def dryrun():
+        result = legacy_api_transplants.dryrun(
+            phab, user, {"landing_path": landing_path}
+        )
+        assert result["blocker"] is None
+
+    benchmark_timer(
+        f"dry run of a 20 revision stack, {'cached' if cached else 'uncached'}",
+        dryrun,
+    )
+
+
+@pytest.mark.benchmark
+@pytest.mark.django_db(transaction=True)
+def test_benchmark_dryrun_coalesced_conduit_calls(
+    user,
+    phabdouble,
+    mocked_repo_config,
+    release_management_project,
+    needs_data_classification_project,
+    benchmark_timer,
+    monkeypatch,
+    request,
+):
+    repo = phabdouble.repo()
+    reviewer = phabdouble.user(username="reviewer")
+    landing_path = []
+    revision = None
+    for _i in range(20):
+        diff = phabdouble.diff()
+        revision = phabdouble.revision(
+            diff=diff, repo=repo, depends_on=[revision] if revision else []
+        )
+        phabdouble.reviewer(revision, reviewer)
+        landing_path.append(
+            {"revision_id": "D{}".format(revision["id"]), "diff_id": diff["id"]}
+        )
+
+    conduit_calls = []
+
+    def slow_request_conduit(self, method, **kwargs):
+        conduit_calls.append(method)
+        # Simulate the round trip to Phabricator.
+        time.sleep(0.005)
+        return phabdouble.call_conduit(method, **kwargs)
+
+    monkeypatch.setattr(PhabricatorClient, "request_conduit", slow_request_conduit)
+
+    calls = {}
+    for coalesce_searches in (False, True):
+        label = "coalesced" if coalesce_searches else "uncoalesced"
+
+        def dryrun(coalesce_searches: bool = coalesce_searches):
+            phab = PhabricatorClient(
+                "https://localhost", "api-key", coalesce_searches=coalesce_searches
+            )
+            result = legacy_api_transplants.dryrun(
+                phab, user, {"landing_path": landing_path}
+            )
+            assert result["blocker"] is None
+
+        conduit_calls.clear()
+        dryrun()
+        calls[label] = len(conduit_calls)
+        request.node.user_properties.append(
+            (f"benchmark:dry run conduit calls, {label}", calls[label])
+        )
+        benchmark_timer(f"dry run of a 20 revision stack, {label}", dryrun)
+
+    assert calls["coalesced"] < calls["uncoalesced"]
+
+
 # auth related issue, blockers empty.
 @pytest.mark.xfail
 @pytest.mark.parametrize(
@@ -709,6 +878,60 @@ def test_integrated_transplant_simple_partial_stack_saves_data_in_db(
     assert job.landed_phabricator_revisions == {1: 1, 2: 2}
 
 
+@pytest.mark.django_db(transaction=True)
+def test_integrated_transplant_records_stack_for_landing_job_history(
+    user,
+    mocked_repo_config,
+    phabdouble,
+    release_management_project,
+    needs_data_classification_project,
+    register_codefreeze_uri,
+):
+    phabrepo = phabdouble.repo(name="mozilla-central")
+    reviewer = phabdouble.user(username="reviewer")
+
+    d1 = phabdouble.diff()
+    r1 = phabdouble.revision(diff=d1, repo=phabrepo)
+    phabdouble.reviewer(r1, reviewer)
+
+    d2 = phabdouble.diff()
+    r2 = phabdouble.revision(diff=d2, repo=phabrepo, depends_on=[r1])
+    phabdouble.reviewer(r2, reviewer)
+
+    d3 = phabdouble.diff()
+    r3 = phabdouble.revision(diff=d3, repo=phabrepo, depends_on=[r2])
+    phabdouble.reviewer(r3, reviewer)
+
+    phab = phabdouble.get_phabricator_client()
+    result, status_code = legacy_api_transplants.post(
+        phab,
+        user,
+        {
+            "landing_path": [
+                {"revision_id": "D{}".format(r1["id"]), "diff_id": d1["id"]},
+                {"revision_id": "D{}".format(r2["id"]), "diff_id": d2["id"]},
+            ]
+        },
+    )
+    assert status_code == 202
+
+    job = LandingJob.objects.get(pk=result["id"])
+    assert [revision.revision_phid for revision in job.revisions] == [
+        r1["phid"],
+        r2["phid"],
+    ]
+    assert all(
+        revision.stack_revision_ids == [r1["id"], r2["id"], r3["id"]]
+        for revision in job.revisions
+    ), "All revisions of the stack should be recorded."
+
+    # The landing job history of the stack, including for revisions which weren't
+    # landed, should now be found without asking Phabricator.
+    phabdouble._revisions = []
+
+    assert list(legacy_api_transplants.get_list(phab, f"D{r3['id']}")) == [job]
+
+
 @pytest.mark.django_db
 def test_integrated_transplant_records_approvers_peers_and_owners(
     user,
@@ -1,6 +1,16 @@
+import hashlib
+import hmac
+import json
+from typing import Callable
 from unittest import mock
 
 import pytest
+from django.conf import settings
+from django.http import HttpResponse
+from django.test import override_settings
+
+from lando.main.models import PullRequestSnapshot
+from lando.main.scm import SCMType
 
 
 @pytest.mark.django_db(transaction=True)
@@ -95,3 +105,197 @@ def test__views__phabricator_auth_backend_invalid_token(
     headers = {"X-Phabricator-API-Key": "INVALID_TOKEN"}
     test = client.get("/__version__", headers=headers)
     assert not test.wsgi_request.user.is_authenticated
+
+
+WEBHOOK_SECRET = "webhook-secret"
+
+
+def _load_json(*path: str) -> dict:
+    with open(settings.BASE_DIR.joinpath(*path)) as f:
+        return json.load(f)
+
+
+@pytest.fixture
+def github_webhook_payload() -> Callable:
+    def _github_webhook_payload(name: str) -> dict:
+        return _load_json("api", "tests", "data", f"github_webhook_{name}.json")
+
+    return _github_webhook_payload
+
+
+@pytest.fixture
+def post_github_webhook(client) -> Callable:
+    def _post_github_webhook(
+        event: str, payload: dict, secret: str = WEBHOOK_SECRET
+    ) -> HttpResponse:
+        body = json.dumps(payload).encode()
+        signature = hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
+        with override_settings(GITHUB_WEBHOOK_SECRET=WEBHOOK_SECRET):
+            return client.post(
+                "/api/github/webhook",
+                data=body,
+                content_type="application/json",
+                headers={
+                    "X-GitHub-Event": event,
+                    "X-Hub-Signature-256": f"sha256={signature}",
+                },
+            )
+
+    return _post_github_webhook
+
+
+@pytest.fixture
+def pull_request_snapshot_client() -> mock.Mock:
+    """A GitHubAPIClient mock returning the snapshot of mozilla-conduit/test-repo#1."""
+    client = mock.Mock(repo_owner="mozilla-conduit", repo_name="test-repo")
+    client.get_pull_request_snapshot.return_value = {
+        "pull_request": _load_json(
+            "utils", "tests", "data", "github_api_response_pull.json"
+        ),
+        "commits": [],
+        "comments": [],
+        "reviews": [],
+        "review_threads": [],
+    }
+    return client
+
+
+@pytest.mark.django_db
+def test__views__GitHubWebhookAPIView_invalid_signature(
+    post_github_webhook, github_webhook_payload
+):
+    response = post_github_webhook(
+        "pull_request",
+        github_webhook_payload("pull_request_labeled"),
+        secret="not-the-secret",
+    )
+    assert response.status_code == 403
+
+
+@pytest.mark.django_db
+def test__views__GitHubWebhookAPIView_no_secret(client, github_webhook_payload):
+    response = client.post(
+        "/api/github/webhook",
+        data=github_webhook_payload("pull_request_labeled"),
+        content_type="application/json",
+        headers={"X-GitHub-Event": "pull_request", "X-Hub-Signature-256": "sha256="},
+    )
+    assert response.status_code == 403
+
+
+@pytest.mark.django_db
+def test_pull_request_snapshot_reused(pull_request_snapshot_client: mock.Mock):
+    for _ in range(3):
+        pull_request = PullRequestSnapshot.get_pull_request(
+            pull_request_snapshot_client, 1
+        )
+        assert pull_request.number == 1
+
+    assert (
+        pull_request_snapshot_client.get_pull_request_snapshot.call_count == 1
+    ), "Snapshot should only be fetched once while fresh"
+
+    PullRequestSnapshot.get_pull_request(pull_request_snapshot_client, 1, refresh=True)
+    assert (
+        pull_request_snapshot_client.get_pull_request_snapshot.call_count == 2
+    ), "Snapshot should be fetched again when a refresh is requested"
+
+
+@pytest.mark.django_db
+def test__views__LandingJobPullRequestAPIView_refreshes_snapshot(
+    authenticated_client,
+    monkeypatch: pytest.MonkeyPatch,
+    pull_request_snapshot_client: mock.Mock,
+    repo_mc: Callable,
+):
+    repo = repo_mc(SCMType.GIT)
+    monkeypatch.setattr(
+        "lando.api.views.GitHubAPIClient",
+        mock.Mock(return_value=pull_request_snapshot_client),
+    )
+    monkeypatch.setattr(
+        "lando.api.views.generate_warnings_and_blockers",
+        mock.Mock(return_value={"blockers": ["Checks are failing."]}),
+    )
+    PullRequestSnapshot.get_pull_request(pull_request_snapshot_client, 1)
+
+    response = authenticated_client.post(
+        f"/api/pulls/{repo.name}/1/landing_jobs",
+        data={"head_sha": PullRequestSnapshot.objects.get().head_sha},
+        content_type="application/json",
+    )
+
+    assert response.status_code == 400
+    assert response.json() == {"errors": ["Checks are failing."]}
+    assert (
+        pull_request_snapshot_client.get_pull_request_snapshot.call_count == 2
+    ), "Landing should not rely on a snapshot, even if it is fresh"
+
+
+@pytest.mark.django_db
+def test__views__GitHubWebhookAPIView_applies_metadata(
+    post_github_webhook,
+    github_webhook_payload,
+    pull_request_snapshot_client: mock.Mock,
+):
+    PullRequestSnapshot.get_pull_request(pull_request_snapshot_client, 1)
+
+    response = post_github_webhook(
+        "pull_request", github_webhook_payload("pull_request_labeled")
+    )
+    assert response.status_code == 200
+    assert response.json() == {"event": "pull_request", "updated": 1}
+
+    pull_request = PullRequestSnapshot.get_pull_request(pull_request_snapshot_client, 1)
+    assert pull_request_snapshot_client.get_pull_request_snapshot.call_count == 1
+    assert [label["name"] for label in pull_request.labels] == [
+        "needs-data-classification",
+        "testing-approved",
+    ]
+    assert (
+        pull_request.mergeable_state == "clean"
+    ), "Unknown mergeability from the webhook shouldn't override the snapshot"
+
+
+@pytest.mark.parametrize(
+    "event, payload_name",
+    (
+        ("pull_request", "pull_request_synchronize"),
+        ("pull_request_review", "pull_request_review_submitted"),
+        ("check_suite", "check_suite_completed"),
+    ),
+)
+@pytest.mark.django_db
+def test__views__GitHubWebhookAPIView_marks_stale(
+    post_github_webhook,
+    github_webhook_payload,
+    pull_request_snapshot_client: mock.Mock,
+    event: str,
+    payload_name: str,
+):
+    PullRequestSnapshot.get_pull_request(pull_request_snapshot_client, 1)
+
+    response = post_github_webhook(event, github_webhook_payload(payload_name))
+    assert response.status_code == 200
+    assert response.json()["updated"] == 1
+
+    snapshot = PullRequestSnapshot.objects.get(pull_number=1)
+    assert snapshot.is_stale
+
+    PullRequestSnapshot.get_pull_request(pull_request_snapshot_client, 1)
+    PullRequestSnapshot.get_pull_request(pull_request_snapshot_client, 1)
+    assert (
+        pull_request_snapshot_client.get_pull_request_snapshot.call_count == 2
+    ), "Stale snapshot should be fetched again, once"
+
+
+@pytest.mark.django_db
+def test__views__GitHubWebhookAPIView_unknown_pull_request(
+    post_github_webhook, github_webhook_payload
+):
+    response = post_github_webhook(
+        "pull_request", github_webhook_payload("pull_request_labeled")
+    )
+    assert response.status_code == 200
+    assert response.json()["updated"] == 0
+    assert not PullRequestSnapshot.objects.exists()
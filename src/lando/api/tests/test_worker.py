@@ -1,10 +1,25 @@
 import os
+import shutil
+import subprocess
+import threading
+from collections import Counter
+from collections.abc import Callable
+from pathlib import Path
 from unittest import mock
 
 import pytest
+from django.core.management.base import CommandError
 
+from lando.api.legacy.workers.base import RepoPrefetcher
 from lando.api.legacy.workers.landing_worker import LandingWorker
+from lando.main.management.commands.start_worker import (
+    Command as StartWorkerCommand,
+)
+from lando.main.models import SCM_LEVEL_3, Repo
+from lando.main.models import Worker as WorkerModel
 from lando.main.scm import SCMType
+from lando.main.scm.exceptions import SCMException
+from lando.main.scm.git import GitSCM
 
 
 @pytest.mark.parametrize(
@@ -29,3 +44,130 @@ def test_Worker__no_SSH_PRIVATE_KEY(
 
     # It should complain, but continue.
     assert LandingWorker.SSH_PRIVATE_KEY_ENV_KEY in caplog.text
+
+
+@pytest.fixture
+def make_cold_start_worker(git_repo: Path, tmp_path: Path) -> Callable:
+    """Return a function creating a worker with uncloned repos from local bare repos."""
+
+    def _make_worker(repo_count: int) -> WorkerModel:
+        repos = []
+        for i in range(repo_count):
+            bare_repo = tmp_path / f"upstream-{i}.git"
+            subprocess.run(
+                ["git", "clone", "--bare", str(git_repo), str(bare_repo)], check=True
+            )
+            repos.append(
+                Repo.objects.create(
+                    name=f"cold-start-{i}",
+                    scm_type=SCMType.GIT,
+                    pull_path=str(bare_repo),
+                    push_path=str(bare_repo),
+                    url=str(bare_repo),
+                    required_permission=SCM_LEVEL_3,
+                    system_path=str(tmp_path / "repos" / f"cold-start-{i}"),
+                )
+            )
+
+        worker = WorkerModel.objects.create(
+            name="cold-start-worker", sleep_seconds=0, scm=SCMType.GIT
+        )
+        worker.applicable_repos.set(repos)
+        return worker
+
+    return _make_worker
+
+
+@pytest.mark.django_db
+def test_start_worker_prepare_repos_retries_each_repo(
+    make_cold_start_worker: Callable, monkeypatch: pytest.MonkeyPatch, settings
+):
+    settings.LANDING_WORKER_REPO_PREPARE_CONCURRENCY = 4
+    worker = make_cold_start_worker(3)
+    flaky_repo = worker.enabled_repos.get(name="cold-start-1")
+
+    prepare_repo = GitSCM.prepare_repo
+    attempts = Counter()
+
+    def flaky_prepare_repo(self, pull_path: str):
+        attempts[self.path] += 1
+        if self.path == flaky_repo.path and attempts[self.path] == 1:
+            raise SCMException("Connection reset", "", "")
+        prepare_repo(self, pull_path)
+
+    monkeypatch.setattr(GitSCM, "prepare_repo", flaky_prepare_repo)
+
+    StartWorkerCommand()._prepare_repos(worker)
+
+    assert all(
+        repo.scm.repo_is_initialized for repo in worker.enabled_repos
+    ), "All repos should have been prepared."
+    assert attempts == {
+        repo.path: 2 if repo == flaky_repo else 1 for repo in worker.enabled_repos
+    }, "Only the failing repo should have been retried."
+
+
+@pytest.mark.django_db
+def test_start_worker_prepare_repos_reports_failed_repos(
+    make_cold_start_worker: Callable, settings
+):
+    settings.LANDING_WORKER_REPO_PREPARE_ATTEMPTS = 2
+    worker = make_cold_start_worker(2)
+    broken_repo = worker.enabled_repos.get(name="cold-start-0")
+    broken_repo.pull_path = "/non-existent-path"
+    broken_repo.save()
+
+    with pytest.raises(CommandError):
+        StartWorkerCommand()._prepare_repos(worker)
+
+    repos = {repo.name: repo for repo in worker.enabled_repos}
+    assert not repos["cold-start-0"].scm.repo_is_initialized
+    assert repos[
+        "cold-start-1"
+    ].scm.repo_is_initialized, "Other repos should be prepared despite the failure."
+
+
+def test_RepoPrefetcher_prefetch_holds_lock_and_continues_on_error():
+    lock = threading.Lock()
+    locked_during_prefetch = []
+
+    def prefetch(pull_path: str):
+        locked_during_prefetch.append(lock.locked())
+        if pull_path == "broken":
+            raise SCMException("Connection reset", "", "")
+
+    repos = []
+    for pull_path in ("broken", "working"):
+        repo = mock.MagicMock(pull_path=pull_path)
+        repo.scm.prefetch.side_effect = prefetch
+        repos.append(repo)
+
+    RepoPrefetcher(repos, interval=60, lock=lock).prefetch()
+
+    for repo in repos:
+        repo.scm.prefetch.assert_called_once_with(repo.pull_path)
+    assert locked_during_prefetch == [
+        True,
+        True,
+    ], "The lock should be held while prefetching."
+    assert not lock.locked()
+
+
+@pytest.mark.benchmark
+@pytest.mark.django_db
+def test_benchmark_start_worker_prepare_repos(
+    make_cold_start_worker: Callable, benchmark_timer: Callable, settings
+):
+    worker = make_cold_start_worker(8)
+
+    for concurrency in (1, 4):
+        settings.LANDING_WORKER_REPO_PREPARE_CONCURRENCY = concurrency
+
+        def prepare_repos():
+            for repo in worker.enabled_repos:
+                shutil.rmtree(repo.path, ignore_errors=True)
+            StartWorkerCommand()._prepare_repos(worker)
+
+        benchmark_timer(
+            f"cold start, 8 repos, concurrency {concurrency}", prepare_repos, rounds=3
+        )
@@ -17,6 +17,7 @@ from lando.main.models import (
     CommitMap,
     JobStatus,
     LandingJob,
+    PullRequestSnapshot,
     Repo,
     Revision,
     add_revisions_to_job,
@@ -24,7 +25,12 @@ from lando.main.models import (
 from lando.main.models.landing_job import get_jobs_for_pull
 from lando.main.models.revision import DiffWarning, DiffWarningStatus
 from lando.main.scm import SCMType
-from lando.utils.github import GitHubAPIClient, PullRequest, PullRequestPatchHelper
+from lando.utils.github import (
+    GitHubAPIClient,
+    PullRequest,
+    PullRequestPatchHelper,
+    verify_webhook_signature,
+)
 from lando.utils.github_checks import (
     ALL_PULL_REQUEST_BLOCKERS,
     ALL_PULL_REQUEST_WARNINGS,
@@ -239,7 +245,12 @@ class LandingJobPullRequestAPIView(View):
         target_repo = Repo.objects.get(name=repo_name)
         client = GitHubAPIClient(target_repo.url)
         ldap_username = request.user.email
-        pull_request = client.build_pull_request(pull_number)
+        form = Form(json.loads(request.body))
+        # Blockers and reviewers may have changed without the head changing, so don't
+        # land from a snapshot.
+        pull_request = PullRequestSnapshot.get_pull_request(
+            client, pull_number, refresh=True
+        )
 
         blockers = generate_warnings_and_blockers(target_repo, pull_request, request)[
             "blockers"
@@ -249,8 +260,6 @@ class LandingJobPullRequestAPIView(View):
             # Pull request has blockers that prevent it from landing.
             return JsonResponse({"errors": blockers}, status=400)
 
-        form = Form(json.loads(request.body))
-
         if not form.is_valid():
             return JsonResponse(form.errors, 400)
 
@@ -297,7 +306,7 @@ class PullRequestChecksAPIView(APIView):
     def get(self, request: WSGIRequest, repo_name: str, number: int) -> JsonResponse:
         target_repo = Repo.objects.get(name=repo_name)
         client = GitHubAPIClient(target_repo.url)
-        pull_request = client.build_pull_request(number)
+        pull_request = PullRequestSnapshot.get_pull_request(client, number)
         try:
             warnings_and_blockers = generate_warnings_and_blockers(
                 target_repo, pull_request, request
@@ -322,6 +331,7 @@ class PullRequestTryPushAPIView(APIView):
         target_repo = Repo.objects.get(name=repo_name)
         client = GitHubAPIClient(target_repo.url)
         ldap_username = request.user.email
+        # The head SHA is recorded alongside the live patch, so get fresh data.
         pull_request = client.build_pull_request(pull_number)
 
         job = LandingJob.objects.create(
@@ -353,3 +363,24 @@ class PullRequestTryPushAPIView(APIView):
         job.save()
 
         return JsonResponse({"id": job.id}, status=201)
+
+
+@method_decorator(csrf_exempt, name="dispatch")
+class GitHubWebhookAPIView(APIView):
+    """Receive GitHub webhook deliveries to keep pull request snapshots current."""
+
+    def post(self, request: WSGIRequest) -> JsonResponse:
+        if not verify_webhook_signature(
+            request.body, request.headers.get("X-Hub-Signature-256")
+        ):
+            return JsonResponse({"errors": ["Invalid signature."]}, status=403)
+
+        event = request.headers.get("X-GitHub-Event", "")
+        try:
+            payload = json.loads(request.body)
+        except json.JSONDecodeError:
+            return JsonResponse({"errors": ["Invalid payload."]}, status=400)
+
+        updated = PullRequestSnapshot.apply_webhook_event(event, payload)
+
+        return JsonResponse({"event": event, "updated": updated})
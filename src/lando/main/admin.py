@@ -277,6 +277,8 @@ class RevisionAdmin(admin.ModelAdmin):
     readonly_fields = (
         "created_at",
         "updated_at",
+        "patch_blob",
+        "patches_blob",
     )
     search_fields = ("revision_id",)
 
@@ -1,18 +1,23 @@
 import functools
+import hashlib
 import logging
+import time
 from typing import (
     Callable,
 )
 
+# requests is a transitive dependency of mozilla-django-oidc.
+import requests
 from django.conf import settings
 from django.contrib.auth.backends import BaseBackend
 from django.contrib.auth.models import User
+from django.core.cache import cache
 from django.core.exceptions import PermissionDenied, SuspiciousOperation
 from django.core.handlers.wsgi import WSGIRequest
 from django.http import HttpResponse
+from jose import JWTError, jwt
 from mozilla_django_oidc.auth import OIDCAuthenticationBackend
 
-# requests is a transitive dependency of mozilla-django-oidc.
 from lando.environments import Environment
 from lando.main.models.profile import Profile, filter_claims
 from lando.utils.phabricator import PhabricatorClient
@@ -27,11 +32,7 @@ class PhabricatorTokenAuthenticationBackend(BaseBackend):
     def get_phab_user(phabricator_token: str) -> dict[str:str]:
         """Verify phabricator token and return the user data."""
         phab = PhabricatorClient(settings.PHABRICATOR_URL, phabricator_token)
-
-        if not phab.verify_api_token():
-            return
-
-        return phab.call_conduit("user.whoami")
+        return phab.whoami()
 
     @staticmethod
     def get_phab_email(user_data: dict[str:str]) -> str:
@@ -127,8 +128,66 @@ class AccessTokenLandoOIDCAuthenticationBackend(LandoOIDCAuthenticationBackend):
     """Authenticates a user based on a Bearer access_token.
 
     Note, this is a shim replacement of the mozilla_django_oidc.auth.TokenOIDCAuthenticationBackend.
+
+    Userinfo claims returned for an access token are cached until the token expires,
+    or for `OIDC_ACCESS_TOKEN_CACHE_TTL` seconds, whichever comes first. The user
+    profile and permissions are only updated when the claims differ from the stored
+    ones.
     """
 
+    @staticmethod
+    def userinfo_cache_key(access_token: str) -> str:
+        """Return the cache key for the claims associated with the access token."""
+        token_hash = hashlib.sha256(access_token.encode("utf-8")).hexdigest()
+        return f"oidc-access-token-userinfo-{token_hash}"
+
+    @staticmethod
+    def userinfo_cache_timeout(access_token: str) -> int:
+        """Return how long the claims for the access token may be cached, in seconds.
+
+        Opaque tokens are cached for `OIDC_ACCESS_TOKEN_CACHE_TTL`. If the token is a
+        JWT, the cache entry will not outlive the token's `exp` claim.
+        """
+        timeout = settings.OIDC_ACCESS_TOKEN_CACHE_TTL
+
+        try:
+            expiration = jwt.get_unverified_claims(access_token).get("exp")
+        except JWTError:
+            expiration = None
+
+        if expiration is not None:
+            timeout = min(timeout, int(expiration - time.time()))
+
+        return max(timeout, 0)
+
+    def get_userinfo(self, access_token: str, id_token: str, payload: dict) -> dict:
+        """Return the userinfo claims for the access token, using the cache if possible."""
+        cache_key = self.userinfo_cache_key(access_token)
+
+        user_info = cache.get(cache_key)
+        if user_info is not None:
+            return user_info
+
+        user_info = super().get_userinfo(access_token, id_token, payload)
+
+        timeout = self.userinfo_cache_timeout(access_token)
+        if timeout:
+            cache.set(cache_key, user_info, timeout)
+
+        return user_info
+
+    def post_auth_hook(self, user: User, claims: dict):
+        """Update the user profile, unless the claims have not changed since last time."""
+        try:
+            user_profile = user.profile
+        except User.profile.RelatedObjectDoesNotExist:
+            user_profile = None
+
+        if user_profile and user_profile.userinfo == filter_claims(claims):
+            return
+
+        super().post_auth_hook(user, claims)
+
     def authenticate(self, request: WSGIRequest, **kwargs) -> User | None:
         # If a bearer token is present in the request, use it to authenticate the user.
         if authorization := request.META.get("HTTP_AUTHORIZATION"):
@@ -137,7 +196,7 @@ class AccessTokenLandoOIDCAuthenticationBackend(LandoOIDCAuthenticationBackend):
                 try:
                     # get_or_create_user and get_userinfo uses neither id_token nor payload.
                     return self.get_or_create_user(token, None, None)
-                except SuspiciousOperation as exc:
+                except (SuspiciousOperation, requests.HTTPError) as exc:
                     logger.warning("failed to get or create user: %s", exc)
                     return None
 
@@ -217,7 +276,7 @@ class require_phabricator_api_key:
     will be used. If an API key is provided it will still be verified.
 
     If `provide_client=True`, the first argument is a PhabricatorClient using
-    this API Key.
+    this API Key, which coalesces its searches for the duration of the request.
     """
 
     def __init__(self, optional: bool = False, provide_client: bool = True):
@@ -243,6 +302,7 @@ class require_phabricator_api_key:
             phab = PhabricatorClient(
                 settings.PHABRICATOR_URL,
                 api_key or settings.PHABRICATOR_UNPRIVILEGED_API_KEY,
+                coalesce_searches=True,
             )
             if api_key is not None and not phab.verify_api_token():
                 return HttpResponse("Phabricator API key is invalid", status=403)
@@ -1,9 +1,10 @@
 import logging
 from argparse import ArgumentParser
 
+from django.conf import settings
 from django.core.management.base import BaseCommand, CommandError
 
-from lando.api.legacy.workers.base import Worker
+from lando.api.legacy.workers.base import Worker, run_for_repos
 from lando.api.legacy.workers.landing_worker import LandingWorker
 from lando.main.models import Worker as WorkerModel
 from lando.main.scm import SCMType
@@ -47,32 +48,35 @@ class Command(BaseCommand):
             repo.raise_for_unsupported_repo_scm(repo_type)
 
     def _prepare_repos(self, worker: WorkerModel):
-        for repo in worker.enabled_repos:
-            if not repo.scm.repo_is_initialized:
-                logger.info(f"Repo {repo} not prepared, preparing...")
-                repo.scm.prepare_repo(repo.pull_path)
+        """Clone all the repos of the worker which aren't initialized yet.
+
+        Repos are prepared concurrently, and each repo is retried separately.
+        """
+        repos = [
+            repo for repo in worker.enabled_repos if not repo.scm.repo_is_initialized
+        ]
+        logger.info(f"Preparing {len(repos)} repos for {worker}...")
+
+        failures = run_for_repos(
+            lambda repo: repo.scm.prepare_repo(repo.pull_path),
+            repos,
+            description="preparing",
+            max_workers=settings.LANDING_WORKER_REPO_PREPARE_CONCURRENCY,
+            max_attempts=settings.LANDING_WORKER_REPO_PREPARE_ATTEMPTS,
+        )
 
-    def _handle(self, worker: WorkerModel, repo_type: str):
-        self._check_for_unsupported_repos(worker, repo_type)
-        max_attempts = 5
-        all_repos_cloned = False
-        for attempt in range(max_attempts):
-            logger.info(f"Attempting to prepare repos (attempt #{attempt}).")
-            try:
-                self._prepare_repos(worker)
-            except Exception as e:
-                logger.error("Encountered error while preparing repos.")
-                logger.exception(e)
-                continue
-            else:
-                all_repos_cloned = True
-                break
-
-        if not all_repos_cloned:
+        for repo, exc in failures.items():
+            logger.error(f"Encountered error while preparing {repo}.", exc_info=exc)
+
+        if failures:
             raise CommandError(
                 "Could not prepare all repos. Check logs for more details."
             )
 
+    def _handle(self, worker: WorkerModel, repo_type: str):
+        self._check_for_unsupported_repos(worker, repo_type)
+        self._prepare_repos(worker)
+
         # Continue with starting the worker.
         try:
             landing_worker = self.worker_class(worker)
@@ -0,0 +1,99 @@
+# Generated by Django 6.0.2 on 2026-10-19 09:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("main", "0047_remove_repo_product_details_url"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="landingjob",
+            name="status_order",
+            field=models.GeneratedField(
+                db_persist=True,
+                expression=models.Case(
+                    models.When(status="SUBMITTED", then=1),
+                    models.When(status="IN_PROGRESS", then=2),
+                    models.When(status="DEFERRED", then=3),
+                    models.When(status="FAILED", then=4),
+                    models.When(status="LANDED", then=5),
+                    models.When(status="CANCELLED", then=6),
+                    models.When(status="CREATED", then=7),
+                    default=0,
+                    output_field=models.IntegerField(),
+                ),
+                output_field=models.IntegerField(),
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="landingjob",
+            index=models.Index(
+                condition=models.Q(
+                    ("status__in", ["SUBMITTED", "IN_PROGRESS", "DEFERRED"])
+                ),
+                fields=[
+                    "target_repo",
+                    "-status_order",
+                    "-priority",
+                    "created_at",
+                    "id",
+                ],
+                name="landingjob_queue_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="landingjob",
+            index=models.Index(
+                condition=models.Q(
+                    ("status__in", ["SUBMITTED", "IN_PROGRESS", "DEFERRED"])
+                ),
+                fields=[
+                    "handover_repo",
+                    "-status_order",
+                    "-priority",
+                    "created_at",
+                    "id",
+                ],
+                name="landingjob_handover_queue_idx",
+            ),
+        ),
+        migrations.AddField(
+            model_name="upliftjob",
+            name="status_order",
+            field=models.GeneratedField(
+                db_persist=True,
+                expression=models.Case(
+                    models.When(status="SUBMITTED", then=1),
+                    models.When(status="IN_PROGRESS", then=2),
+                    models.When(status="DEFERRED", then=3),
+                    models.When(status="FAILED", then=4),
+                    models.When(status="LANDED", then=5),
+                    models.When(status="CANCELLED", then=6),
+                    models.When(status="CREATED", then=7),
+                    default=0,
+                    output_field=models.IntegerField(),
+                ),
+                output_field=models.IntegerField(),
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="upliftjob",
+            index=models.Index(
+                condition=models.Q(
+                    ("status__in", ["SUBMITTED", "IN_PROGRESS", "DEFERRED"])
+                ),
+                fields=[
+                    "target_repo",
+                    "-status_order",
+                    "-priority",
+                    "created_at",
+                    "id",
+                ],
+                name="upliftjob_queue_idx",
+            ),
+        ),
+    ]
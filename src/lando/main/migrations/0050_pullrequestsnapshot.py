@@ -0,0 +1,43 @@
+# Generated by Django 6.0.2 on 2026-10-19 14:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("main", "0048_landingjob_landingjob_queue_idx_and_more"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PullRequestSnapshot",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                ("repo_owner", models.CharField(max_length=255)),
+                ("repo_name", models.CharField(max_length=255)),
+                ("pull_number", models.IntegerField()),
+                (
+                    "head_sha",
+                    models.CharField(blank=True, default="", max_length=40),
+                ),
+                ("data", models.JSONField(blank=True, default=dict)),
+                ("is_stale", models.BooleanField(default=False)),
+                ("version", models.IntegerField(default=0)),
+                ("fetched_at", models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                "unique_together": {("repo_owner", "repo_name", "pull_number")},
+            },
+        ),
+    ]
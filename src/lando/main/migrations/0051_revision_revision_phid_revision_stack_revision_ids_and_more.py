@@ -0,0 +1,33 @@
+# Generated by Django 6.0.2 on 2026-10-19 14:48
+
+import django.contrib.postgres.fields
+import django.contrib.postgres.indexes
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("main", "0050_pullrequestsnapshot"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="revision",
+            name="revision_phid",
+            field=models.CharField(blank=True, max_length=64, null=True, unique=True),
+        ),
+        migrations.AddField(
+            model_name="revision",
+            name="stack_revision_ids",
+            field=django.contrib.postgres.fields.ArrayField(
+                base_field=models.IntegerField(), blank=True, default=list, size=None
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="revision",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["stack_revision_ids"], name="revision_stack_ids_idx"
+            ),
+        ),
+    ]
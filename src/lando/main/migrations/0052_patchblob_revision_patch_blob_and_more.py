@@ -0,0 +1,110 @@
+# Generated by Django 6.0.2 on 2026-10-19 15:31
+
+import hashlib
+import zlib
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def move_patches_to_blobs(apps, schema_editor):  # noqa: ANN001
+    """Store the patches of existing revisions in deduplicated `PatchBlob`s."""
+    PatchBlob = apps.get_model("main", "PatchBlob")
+    Revision = apps.get_model("main", "Revision")
+
+    blob_ids = {}
+
+    def get_blob_id(text: str) -> int | None:
+        if not text:
+            return None
+
+        content = text.encode("utf-8")
+        digest = hashlib.sha256(content).hexdigest()
+        if digest not in blob_ids:
+            blob, _created = PatchBlob.objects.get_or_create(
+                digest=digest,
+                defaults={"size": len(content), "data": zlib.compress(content)},
+            )
+            blob_ids[digest] = blob.id
+        return blob_ids[digest]
+
+    revisions = Revision.objects.only("id", "patch", "patches").order_by("id")
+    for revision in revisions.iterator(chunk_size=500):
+        Revision.objects.filter(id=revision.id).update(
+            patch_blob_id=get_blob_id(revision.patch),
+            patches_blob_id=get_blob_id(revision.patches),
+        )
+
+
+def move_blobs_to_patches(apps, schema_editor):  # noqa: ANN001
+    """Copy `PatchBlob` content back into the revisions' text fields."""
+    PatchBlob = apps.get_model("main", "PatchBlob")
+    Revision = apps.get_model("main", "Revision")
+
+    def get_text(blob_id: int | None) -> str:
+        if not blob_id:
+            return ""
+        blob = PatchBlob.objects.get(id=blob_id)
+        return zlib.decompress(bytes(blob.data)).decode("utf-8")
+
+    revisions = Revision.objects.only("id", "patch_blob_id", "patches_blob_id")
+    for revision in revisions.order_by("id").iterator(chunk_size=500):
+        Revision.objects.filter(id=revision.id).update(
+            patch=get_text(revision.patch_blob_id),
+            patches=get_text(revision.patches_blob_id),
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("main", "0051_revision_revision_phid_revision_stack_revision_ids_and_more"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PatchBlob",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                ("digest", models.CharField(max_length=64, unique=True)),
+                ("size", models.IntegerField()),
+                ("data", models.BinaryField()),
+            ],
+            options={
+                "abstract": False,
+            },
+        ),
+        migrations.AddField(
+            model_name="revision",
+            name="patch_blob",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.PROTECT,
+                related_name="+",
+                to="main.patchblob",
+            ),
+        ),
+        migrations.AddField(
+            model_name="revision",
+            name="patches_blob",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.PROTECT,
+                related_name="+",
+                to="main.patchblob",
+            ),
+        ),
+        migrations.RunPython(move_patches_to_blobs, move_blobs_to_patches),
+    ]
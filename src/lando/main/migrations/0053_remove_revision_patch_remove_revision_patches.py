@@ -0,0 +1,21 @@
+# Generated by Django 6.0.2 on 2026-10-19 15:31
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("main", "0052_patchblob_revision_patch_blob_and_more"),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name="revision",
+            name="patch",
+        ),
+        migrations.RemoveField(
+            model_name="revision",
+            name="patches",
+        ),
+    ]
@@ -4,6 +4,7 @@ from lando.main.models.configuration import *
 from lando.main.models.jobs import *
 from lando.main.models.landing_job import *
 from lando.main.models.profile import *
+from lando.main.models.pull_request import *
 from lando.main.models.revision import *
 from lando.main.models.repo import *
 from lando.main.models.worker import *
@@ -6,7 +6,7 @@ from datetime import datetime
 from typing import Any, Self
 
 from django.db import models
-from django.db.models import Case, IntegerField, QuerySet, When
+from django.db.models import Case, IntegerField, Q, QuerySet, When
 from django.utils.translation import gettext_lazy
 
 from lando.main.models.base import BaseModel
@@ -51,17 +51,27 @@ class JobStatus(models.TextChoices):
         previously crashed, and that the worker needs to restart processing.
         """
         return Case(
-            When(status=cls.SUBMITTED, then=1),
-            When(status=cls.IN_PROGRESS, then=2),
-            When(status=cls.DEFERRED, then=3),
-            When(status=cls.FAILED, then=4),
-            When(status=cls.LANDED, then=5),
-            When(status=cls.CANCELLED, then=6),
-            When(status=cls.CREATED, then=7),
+            *(
+                When(status=status, then=order)
+                for status, order in cls.order_values().items()
+            ),
             default=0,
             output_field=IntegerField(),
         )
 
+    @classmethod
+    def order_values(cls) -> dict[Self, int]:
+        """Return the mapping of statuses to the values used by `ordering()`."""
+        return {
+            cls.SUBMITTED: 1,
+            cls.IN_PROGRESS: 2,
+            cls.DEFERRED: 3,
+            cls.FAILED: 4,
+            cls.LANDED: 5,
+            cls.CANCELLED: 6,
+            cls.CREATED: 7,
+        }
+
     @classmethod
     def pending(cls) -> list[Self]:
         """Group of Job statuses that may change in the future.
@@ -104,6 +114,21 @@ class BaseJob(BaseModel):
 
     class Meta:
         abstract = True
+        indexes = [
+            # Serve queue lookups from the (small) set of pending jobs only, in
+            # queue order. See job_queue_query().
+            models.Index(
+                fields=[
+                    "target_repo",
+                    "-status_order",
+                    "-priority",
+                    "created_at",
+                    "id",
+                ],
+                condition=Q(status__in=JobStatus.pending()),
+                name="%(class)s_queue_idx",
+            ),
+        ]
 
     # A human-friendly name of this type of job.
     # To be overridden by subclasses.
@@ -119,6 +144,13 @@ class BaseJob(BaseModel):
         default=JobStatus.CREATED,
         db_index=True,
     )
+    # Rank of the status in the queue, stored so that the queue can be served
+    # from an index. See JobStatus.ordering().
+    status_order = models.GeneratedField(
+        expression=JobStatus.ordering(),
+        output_field=models.IntegerField(),
+        db_persist=True,
+    )
     # Text describing errors when status != LANDED.
     error = models.TextField(default="", blank=True)
 
@@ -266,12 +298,48 @@ class BaseJob(BaseModel):
         if repositories:
             q = q.filter(target_repo__in=repositories)
 
-        q = q.annotate(status_order=JobStatus.ordering()).order_by(
-            "-status_order", "-priority", "created_at"
-        )
+        q = q.order_by("-status_order", "-priority", "created_at", "id")
 
         return q
 
+    def jobs_ahead_query(
+        self, repositories: Iterable[str] | None = None, **kwargs
+    ) -> QuerySet:
+        """Return a query which selects the queued jobs ahead of this job.
+
+        Jobs are compared on the same `(status_order, priority, created_at, id)` tuple
+        used to order the queue, so the position is computed by the database. If this
+        job is not pending, all queued jobs are returned.
+
+        Args:
+            repositories (iterable): A list of repository names to use when filtering
+                the job search query.
+
+            **kwargs (dict): Additional arguments passed to `job_queue_query()`.
+        """
+        q = self.job_queue_query(repositories=repositories, **kwargs)
+
+        if self.status not in JobStatus.pending():
+            return q
+
+        status_order = JobStatus.order_values()[self.status]
+        same_status_order = Q(status_order=status_order)
+        same_priority = same_status_order & Q(priority=self.priority)
+        same_created_at = same_priority & Q(created_at=self.created_at)
+
+        return q.filter(
+            Q(status_order__gt=status_order)
+            | (same_status_order & Q(priority__gt=self.priority))
+            | (same_priority & Q(created_at__lt=self.created_at))
+            | (same_created_at & Q(id__lt=self.id))
+        )
+
+    def queue_position(
+        self, repositories: Iterable[str] | None = None, **kwargs
+    ) -> int:
+        """Return the number of queued jobs ahead of this job."""
+        return self.jobs_ahead_query(repositories=repositories, **kwargs).count()
+
     def to_dict(self) -> dict[str, Any]:
         """Return the job details as a dict."""
         job_dict = {
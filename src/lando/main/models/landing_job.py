@@ -6,13 +6,17 @@ from typing import Any
 
 from django.conf import settings
 from django.db import models
-from django.db.models import Q, QuerySet
+from django.db.models import F, Func, OuterRef, Q, QuerySet, Subquery
 from mots.config import FileConfig
 from mots.directory import Directory
 
-from lando.main.models.jobs import BaseJob
+from lando.main.models.jobs import BaseJob, JobStatus
 from lando.main.models.repo import Repo
-from lando.main.models.revision import Revision, RevisionLandingJob
+from lando.main.models.revision import (
+    Revision,
+    RevisionLandingJob,
+    index_by_revision_id,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -20,6 +24,23 @@ logger = logging.getLogger(__name__)
 class LandingJob(BaseJob):
     """A landing job for Phabricator revisions."""
 
+    class Meta(BaseJob.Meta):
+        indexes = [
+            *BaseJob.Meta.indexes,
+            # Jobs are also queued for the repo they are handed over to.
+            models.Index(
+                fields=[
+                    "handover_repo",
+                    "-status_order",
+                    "-priority",
+                    "created_at",
+                    "id",
+                ],
+                condition=Q(status__in=JobStatus.pending()),
+                name="landingjob_handover_queue_idx",
+            ),
+        ]
+
     type: str = "Landing"
 
     # revision_to_diff_id and revision_order are deprecated and kept for historical reasons.
@@ -194,6 +215,29 @@ class LandingJob(BaseJob):
             unsorted_revisions__revision_id__in=revision_ids
         ).distinct()
 
+    @classmethod
+    def revision_stack_query(cls, revision_id: int) -> QuerySet:
+        """Return all landing jobs for the known stacks of a given revision ID.
+
+        Stacks are known from the `stack_revision_ids` recorded on revisions when
+        landing jobs are requested, so this will not find jobs for stacks which Lando
+        hasn't seen yet.
+        """
+        stack_revision_ids = (
+            Revision.objects.filter(stack_revision_ids__contains=[revision_id])
+            .annotate(
+                stack_revision_id=Func(
+                    F("stack_revision_ids"),
+                    function="unnest",
+                    output_field=models.IntegerField(),
+                )
+            )
+            .values("stack_revision_id")
+        )
+        return cls.objects.filter(
+            unsorted_revisions__revision_id__in=stack_revision_ids
+        ).distinct()
+
     def to_dict(self) -> dict[str, Any]:
         job_dict = super().to_dict()
         job_dict["revisions"] = [r.url() for r in self.revisions]
@@ -231,19 +275,17 @@ class LandingJob(BaseJob):
 
     def add_revisions(self, revisions: list[Revision]):
         """Associate a list of revisions with job."""
-        for revision in revisions:
-            self.unsorted_revisions.add(revision)
+        self.unsorted_revisions.add(*revisions)
 
     def sort_revisions(self, revisions: list[Revision]):
         """Sort the associated revisions based on provided list."""
-        if len(revisions) != len(self.unsorted_revisions.all()):
+        if len(revisions) != self.unsorted_revisions.count():
             raise ValueError("List of revisions does not match associated revisions")
 
         # Update association table records with correct index values.
-        for index, revision in enumerate(revisions):
-            RevisionLandingJob.objects.filter(
-                revision=revision, landing_job=self
-            ).update(index=index)
+        RevisionLandingJob.objects.filter(
+            landing_job=self, revision__in=revisions
+        ).update(index=index_by_revision_id(revisions))
 
     @property
     def revisions(self) -> QuerySet:
@@ -252,26 +294,35 @@ class LandingJob(BaseJob):
     def set_landed_revision_diffs(self):
         """Assign diff_ids, if available, to each association row."""
         # Update association table records with current diff_id values.
-        for revision in self.unsorted_revisions.all():
-            RevisionLandingJob.objects.filter(
-                revision=revision, landing_job=self
-            ).update(diff_id=revision.diff_id)
+        self._copy_revision_field("diff_id")
 
     def set_landed_commit_ids(self):
         """Assign `commit_id`, if available, to each association row."""
-        for revision in self.unsorted_revisions.all():
-            RevisionLandingJob.objects.filter(
-                revision=revision, landing_job=self
-            ).update(commit_id=revision.commit_id)
+        self._copy_revision_field("commit_id")
+
+    def _copy_revision_field(self, field: str):
+        """Copy `field` from each revision to its association row, in one query."""
+        RevisionLandingJob.objects.filter(
+            landing_job=self, revision__isnull=False
+        ).update(
+            **{
+                field: Subquery(
+                    Revision.objects.filter(id=OuterRef("revision_id")).values(field)
+                )
+            }
+        )
 
     def set_landed_reviewers(self, path: Path):
         """Set approving peers and owners at time of landing."""
         directory = Directory(FileConfig(path))
+        revisions = []
         for revision in self.unsorted_revisions.all():
             approved_by = revision.data.get("approved_by")
             if not approved_by:
                 continue
 
+            revisions.append(revision)
+
             if "peers_and_owners" not in revision.data:
                 revision.data["peers_and_owners"] = []
 
@@ -282,7 +333,7 @@ class LandingJob(BaseJob):
                 ):
                     revision.data["peers_and_owners"].append(reviewer)
 
-            revision.save()
+        Revision.objects.bulk_update(revisions, ["data"])
 
 
 def add_job_with_revisions(
@@ -0,0 +1,206 @@
+import logging
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import models, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from lando.main.models.base import BaseModel
+from lando.utils.github import GitHubAPIClient, PullRequest
+
+logger = logging.getLogger(__name__)
+
+
+class PullRequestSnapshot(BaseModel):
+    """A local copy of the state of a GitHub pull request.
+
+    The `data` is what `GitHubAPIClient.get_pull_request_snapshot` returns. It is kept
+    current by GitHub webhooks, so viewing or checking a pull request doesn't need to
+    query GitHub every time. Events that can't be applied from their payload alone
+    mark the snapshot as stale, and it is fetched again on next use.
+    """
+
+    # `pull_request` actions which only change metadata present in the payload.
+    METADATA_ACTIONS = (
+        "assigned",
+        "closed",
+        "edited",
+        "labeled",
+        "reopened",
+        "review_request_removed",
+        "review_requested",
+        "unassigned",
+        "unlabeled",
+    )
+
+    repo_owner = models.CharField(max_length=255)
+    repo_name = models.CharField(max_length=255)
+    pull_number = models.IntegerField()
+
+    head_sha = models.CharField(max_length=40, blank=True, default="")
+    data = models.JSONField(blank=True, default=dict)
+
+    # Set when a webhook reported a change that isn't reflected in `data`.
+    is_stale = models.BooleanField(default=False)
+    # Incremented for every webhook update, so that a snapshot fetched concurrently
+    # doesn't overwrite a more recent event.
+    version = models.IntegerField(default=0)
+    fetched_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        unique_together = (("repo_owner", "repo_name", "pull_number"),)
+
+    def __str__(self) -> str:
+        return f"{self.repo_owner}/{self.repo_name}#{self.pull_number}"
+
+    @property
+    def is_fresh(self) -> bool:
+        """Whether the snapshot can be used without asking GitHub."""
+        if self.is_stale or not self.fetched_at:
+            return False
+
+        max_age = timedelta(seconds=settings.GITHUB_PULL_REQUEST_SNAPSHOT_MAX_AGE)
+        return timezone.now() - self.fetched_at < max_age
+
+    @classmethod
+    def get_pull_request(
+        cls,
+        client: GitHubAPIClient,
+        pull_number: int,
+        refresh: bool = False,
+    ) -> PullRequest:
+        """Build a PullRequest from the local snapshot, refreshing it if needed.
+
+        If `refresh` is set, the pull request is always fetched from GitHub, e.g.
+        before acting on its reviews and checks.
+        """
+        snapshot = cls.one_or_none(
+            repo_owner=client.repo_owner,
+            repo_name=client.repo_name,
+            pull_number=pull_number,
+        )
+
+        if snapshot and snapshot.is_fresh and not refresh:
+            data = snapshot.data
+        else:
+            data = client.get_pull_request_snapshot(pull_number)
+            cls._store(client, pull_number, data, snapshot)
+
+        return PullRequest(client, data["pull_request"], snapshot=data)
+
+    @classmethod
+    def _store(
+        cls,
+        client: GitHubAPIClient,
+        pull_number: int,
+        data: dict,
+        snapshot: "PullRequestSnapshot | None",
+    ):
+        """Save freshly fetched data, unless a webhook updated the snapshot meanwhile."""
+        values = {
+            "data": data,
+            "head_sha": data["pull_request"]["head"]["sha"],
+            "is_stale": False,
+            "fetched_at": timezone.now(),
+        }
+
+        if not snapshot:
+            cls.objects.get_or_create(
+                repo_owner=client.repo_owner,
+                repo_name=client.repo_name,
+                pull_number=pull_number,
+                defaults=values,
+            )
+            return
+
+        cls.objects.filter(pk=snapshot.pk, version=snapshot.version).update(**values)
+
+    @classmethod
+    def apply_webhook_event(cls, event: str, payload: dict) -> int:
+        """Update snapshots following a GitHub webhook event.
+
+        Only snapshots which already exist are updated; others will be fetched when
+        first needed.
+
+        Return:
+            int: the number of snapshots updated.
+        """
+        if "repository" not in payload:
+            return 0
+
+        repo_owner = payload["repository"]["owner"]["login"]
+        repo_name = payload["repository"]["name"]
+
+        if event == "pull_request":
+            pull_request = payload["pull_request"]
+            if payload["action"] in cls.METADATA_ACTIONS and not (
+                payload["action"] == "edited" and "base" in payload.get("changes", {})
+            ):
+                return cls._apply_pull_request_metadata(
+                    repo_owner, repo_name, pull_request
+                )
+            return cls._mark_stale(repo_owner, repo_name, [pull_request["number"]])
+
+        if event == "pull_request_review":
+            return cls._mark_stale(
+                repo_owner, repo_name, [payload["pull_request"]["number"]]
+            )
+
+        if event == "check_suite":
+            # Checks affect the mergeability of all the pull requests for this head.
+            return cls._mark_stale(
+                repo_owner,
+                repo_name,
+                [pr["number"] for pr in payload["check_suite"]["pull_requests"]],
+            )
+
+        logger.debug(f"Ignoring GitHub {event} event.")
+        return 0
+
+    @classmethod
+    def _mark_stale(cls, repo_owner: str, repo_name: str, numbers: list[int]) -> int:
+        return cls.objects.filter(
+            repo_owner=repo_owner, repo_name=repo_name, pull_number__in=numbers
+        ).update(is_stale=True, version=F("version") + 1)
+
+    @classmethod
+    def _apply_pull_request_metadata(
+        cls, repo_owner: str, repo_name: str, pull_request: dict
+    ) -> int:
+        """Replace the pull request metadata of a snapshot with that of the payload."""
+        with transaction.atomic():
+            snapshot = (
+                cls.objects.select_for_update()
+                .filter(
+                    repo_owner=repo_owner,
+                    repo_name=repo_name,
+                    pull_number=pull_request["number"],
+                )
+                .first()
+            )
+            if not snapshot:
+                return 0
+
+            current = snapshot.data.get("pull_request", {})
+            if (
+                snapshot.is_stale
+                or pull_request["head"]["sha"] != snapshot.head_sha
+                or pull_request["updated_at"] < current.get("updated_at", "")
+            ):
+                # The payload can't bring the snapshot up to date, or is older than it.
+                snapshot.is_stale = True
+            else:
+                # Mergeability is computed asynchronously, and webhook payloads don't
+                # usually have it yet.
+                if pull_request.get("mergeable_state") in (None, "unknown"):
+                    pull_request = {
+                        **pull_request,
+                        "mergeable_state": current.get("mergeable_state", "unknown"),
+                    }
+                snapshot.data = {**snapshot.data, "pull_request": pull_request}
+
+            snapshot.version = F("version") + 1
+            snapshot.save()
+
+        return 1
@@ -5,12 +5,17 @@ The `DiffWarning` model provides a warning that is associated with a particular
 Phabricator diff that is associated with a particular revision.
 """
 
+import hashlib
 import logging
 import re
+import zlib
+from collections.abc import Iterable
 from io import StringIO
 from typing import Any, Optional, Self
 
 from django.conf import settings
+from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.indexes import GinIndex
 from django.db import models
 from django.utils.translation import gettext_lazy
 
@@ -33,6 +38,81 @@ class RevisionLandingJob(BaseModel):
     commit_id = models.CharField(max_length=40, null=True, blank=True)
 
 
+def index_by_revision_id(revisions: list["Revision"]) -> models.Case:
+    """Return an expression giving the index of each revision ID in `revisions`.
+
+    This is used to sort the association rows of a job in a single UPDATE.
+    """
+    return models.Case(
+        *(
+            models.When(revision_id=revision.id, then=models.Value(index))
+            for index, revision in enumerate(revisions)
+        ),
+        output_field=models.IntegerField(),
+    )
+
+
+def compress_patch(content: bytes) -> bytes:
+    """Compress patch content for storage in a `PatchBlob`."""
+    return zlib.compress(content)
+
+
+def decompress_patch(data: bytes) -> bytes:
+    """Decompress patch content stored in a `PatchBlob`."""
+    return zlib.decompress(data)
+
+
+class PatchBlob(BaseModel):
+    """Compressed patch content, stored once for all the revisions which use it.
+
+    Blobs are addressed by the SHA-256 digest of their uncompressed content.
+    """
+
+    digest = models.CharField(max_length=64, unique=True)
+
+    # The size of the uncompressed content, in bytes.
+    size = models.IntegerField()
+
+    data = models.BinaryField()
+
+    def __str__(self) -> str:
+        return f"PatchBlob {self.digest[:12]} ({self.size} bytes)"
+
+    @property
+    def content(self) -> bytes:
+        return decompress_patch(bytes(self.data))
+
+    @staticmethod
+    def digest_for(content: bytes) -> str:
+        return hashlib.sha256(content).hexdigest()
+
+    @classmethod
+    def store(cls, content: bytes) -> Self:
+        """Return the blob for `content`, creating it if it doesn't exist yet."""
+        blob, _created = cls.objects.get_or_create(
+            digest=cls.digest_for(content),
+            defaults={"size": len(content), "data": compress_patch(content)},
+        )
+        return blob
+
+    @classmethod
+    def store_many(cls, contents: Iterable[bytes]) -> dict[str, Self]:
+        """Store all `contents` at once, returning the blobs by digest.
+
+        The returned blobs don't have their `data` loaded.
+        """
+        blobs = {}
+        for content in contents:
+            digest = cls.digest_for(content)
+            if digest not in blobs:
+                blobs[digest] = cls(
+                    digest=digest, size=len(content), data=compress_patch(content)
+                )
+
+        cls.objects.bulk_create(blobs.values(), ignore_conflicts=True)
+        return cls.objects.defer("data").in_bulk(blobs, field_name="digest")
+
+
 class Revision(BaseModel):
     """
     A representation of a revision in the database.
@@ -42,6 +122,12 @@ class Revision(BaseModel):
 
     # revision_id and diff_id map to Phabricator IDs (integers).
     revision_id = models.IntegerField(blank=True, null=True, unique=True)
+    revision_phid = models.CharField(max_length=64, blank=True, null=True, unique=True)
+
+    # The IDs of the Phabricator revisions in the stack of this revision, including
+    # itself, at the time of the latest landing request. This allows finding the
+    # landing jobs of a stack without querying Phabricator.
+    stack_revision_ids = ArrayField(models.IntegerField(), blank=True, default=list)
 
     # diff_id is that of the latest diff on the revision at landing request time. It
     # does not track all diffs.
@@ -54,13 +140,25 @@ class Revision(BaseModel):
     pull_head_sha = models.CharField(max_length=40, blank=True, null=True)
     pull_base_sha = models.CharField(max_length=40, blank=True, null=True)
 
-    # The generated patch with Mercurial metadata format.
+    # The generated patch with Mercurial metadata format, see `patch`.
     # This patch is generated by combining a diff and patch metadata.
-    patch = models.TextField(blank=True, default="")
+    patch_blob = models.ForeignKey(
+        PatchBlob,
+        on_delete=models.PROTECT,
+        null=True,
+        blank=True,
+        related_name="+",
+    )
 
-    # Raw patch data that could contain multiple patches.
+    # Raw patch data that could contain multiple patches, see `patches`.
     # These patches are fetched and stored directly (e.g., from GitHub).
-    patches = models.TextField(blank=True, default="")
+    patches_blob = models.ForeignKey(
+        PatchBlob,
+        on_delete=models.PROTECT,
+        null=True,
+        blank=True,
+        related_name="+",
+    )
 
     # Patch metadata, such as
     # - author_name
@@ -78,6 +176,11 @@ class Revision(BaseModel):
 
     _patch_helper: Optional[HgPatchHelper] = None
 
+    class Meta:
+        indexes = [
+            GinIndex(fields=["stack_revision_ids"], name="revision_stack_ids_idx"),
+        ]
+
     def __str__(self) -> str:
         if self.is_phabricator_revision:
             return f"D{self.revision_id} (diff {self.diff_id})"
@@ -111,10 +214,89 @@ class Revision(BaseModel):
         """Indicate if this revision is tied to Phabricator."""
         return self.revision_id is not None
 
+    # Names of the properties whose text is stored in a `PatchBlob`.
+    BLOB_FIELDS = ("patch", "patches")
+
+    @property
+    def patch(self) -> str:
+        return self._get_blob_text("patch")
+
+    @patch.setter
+    def patch(self, value: str):
+        self._set_blob_text("patch", value)
+        self._patch_helper = None
+
+    @property
+    def patches(self) -> str:
+        return self._get_blob_text("patches")
+
+    @patches.setter
+    def patches(self, value: str):
+        self._set_blob_text("patches", value)
+
     @property
     def patch_bytes(self) -> bytes:
+        texts = self.__dict__.get("_blob_texts", {})
+        if "patch" not in texts and self.patch_blob_id:
+            # Avoid decoding the patch when its text isn't needed.
+            return self.patch_blob.content
         return self.patch.encode("utf-8")
 
+    def _get_blob_text(self, name: str) -> str:
+        """Return the text of a blob field, loading it on first use."""
+        texts = self.__dict__.setdefault("_blob_texts", {})
+        if name not in texts:
+            blob = getattr(self, f"{name}_blob")
+            texts[name] = blob.content.decode("utf-8") if blob else ""
+        return texts[name]
+
+    def _set_blob_text(self, name: str, value: str | None):
+        """Set the text of a blob field, to be stored when the revision is saved."""
+        self.__dict__.setdefault("_blob_texts", {})[name] = value or ""
+        self.__dict__.setdefault("_changed_blobs", set()).add(name)
+
+    def save(self, *args, **kwargs):
+        changed_blobs = self.__dict__.pop("_changed_blobs", set())
+        for name in changed_blobs:
+            text = self._get_blob_text(name)
+            blob = PatchBlob.store(text.encode("utf-8")) if text else None
+            setattr(self, f"{name}_blob", blob)
+
+        if update_fields := kwargs.get("update_fields"):
+            kwargs["update_fields"] = [
+                f"{field}_blob" if field in self.BLOB_FIELDS else field
+                for field in update_fields
+            ]
+
+        super().save(*args, **kwargs)
+
+    def refresh_from_db(self, *args, **kwargs):
+        super().refresh_from_db(*args, **kwargs)
+        self.__dict__.pop("_blob_texts", None)
+        self.__dict__.pop("_changed_blobs", None)
+        self._patch_helper = None
+
+    @classmethod
+    def bulk_create_with_patches(cls, revisions: list[Self]) -> list[Self]:
+        """Insert new revisions at once, storing all their patches in bulk.
+
+        This is equivalent to saving each revision, using a constant number of
+        queries.
+        """
+        changed_texts = [
+            (revision, name, revision._get_blob_text(name))
+            for revision in revisions
+            for name in revision.__dict__.pop("_changed_blobs", set())
+        ]
+        blobs = PatchBlob.store_many(
+            text.encode("utf-8") for _revision, _name, text in changed_texts if text
+        )
+        for revision, name, text in changed_texts:
+            blob = blobs[PatchBlob.digest_for(text.encode("utf-8"))] if text else None
+            setattr(revision, f"{name}_blob", blob)
+
+        return cls.objects.bulk_create(revisions)
+
     @classmethod
     def get_from_revision_id(cls, revision_id: int) -> Self | None:
         """Return a Revision object from a given ID."""
@@ -131,11 +313,20 @@ class Revision(BaseModel):
             - commit_message
             - timestamp (unix timestamp as a string)
         """
-        rev = Revision()
-        rev.set_patch(raw_diff, patch_data)
+        rev = cls.build_from_patch(raw_diff, patch_data)
         rev.save()
         return rev
 
+    @classmethod
+    def build_from_patch(cls, raw_diff: str, patch_data: dict[str, str]) -> Self:
+        """Construct a new, unsaved Revision from patch data.
+
+        See `new_from_patch` for the expected `patch_data`.
+        """
+        rev = cls()
+        rev.set_patch(raw_diff, patch_data)
+        return rev
+
     def set_patch(self, raw_diff: str, patch_data: dict[str, str] | None = None):
         """Given a raw_diff and patch data, build the patch and store it."""
         self.patch_data = patch_data or self.patch_data
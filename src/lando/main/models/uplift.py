@@ -9,7 +9,7 @@ from django.urls import reverse
 
 from lando.main.models import BaseModel
 from lando.main.models.jobs import BaseJob, JobStatus
-from lando.main.models.revision import Revision
+from lando.main.models.revision import Revision, index_by_revision_id
 
 # Yes/No constants for re-use in `TextChoices`, since `Enum`
 # can't be subclassed.
@@ -188,19 +188,17 @@ class UpliftJob(BaseJob):
 
     def add_revisions(self, revisions: list[Revision]):
         """Associate a list of revisions with job."""
-        for revision in revisions:
-            self.unsorted_revisions.add(revision)
+        self.unsorted_revisions.add(*revisions)
 
     def sort_revisions(self, revisions: list[Revision]):
         """Sort the associated revisions based on provided list."""
-        if len(revisions) != len(self.unsorted_revisions.all()):
+        if len(revisions) != self.unsorted_revisions.count():
             raise ValueError("List of revisions does not match associated revisions")
 
         # Update association table records with correct index values.
-        for index, revision in enumerate(revisions):
-            RevisionUpliftJob.objects.filter(revision=revision, uplift_job=self).update(
-                index=index
-            )
+        RevisionUpliftJob.objects.filter(
+            uplift_job=self, revision__in=revisions
+        ).update(index=index_by_revision_id(revisions))
 
     @property
     def revisions(self) -> models.QuerySet:
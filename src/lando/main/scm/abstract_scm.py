@@ -81,7 +81,6 @@ class AbstractSCM(ABC):
         `attributes_override` is SCM-dependent.
         """
 
-    @abstractmethod
     def last_commit_for_path(self, path: str) -> str:
         """Find last commit to touch a path.
 
@@ -91,6 +90,41 @@ class AbstractSCM(ABC):
         Returns:
             str: The commit id
         """
+        return self.last_commits_for_paths([path])[path]
+
+    @abstractmethod
+    def last_commits_for_paths(self, paths: Iterable[str]) -> dict[str, str]:
+        """Find the last commit to touch each of the paths, in a single lookup.
+
+        Args:
+            paths (Iterable[str]): The specific paths within the repository.
+
+        Returns:
+            dict[str, str]: The commit id for each path, or an empty string for paths
+            which were never committed.
+        """
+
+    def commit_exists(self, commit_id: str) -> bool:
+        """Check if a commit exists in the repository.
+
+        Args:
+            commit_id: The commit ID to check.
+
+        Returns:
+            `True` if the commit exists, `False` otherwise.
+        """
+        return self.commits_exist([commit_id])[commit_id]
+
+    @abstractmethod
+    def commits_exist(self, commit_ids: Iterable[str]) -> dict[str, bool]:
+        """Check which of the commits exist in the repository, in a single lookup.
+
+        Args:
+            commit_ids (Iterable[str]): The commit IDs to check.
+
+        Returns:
+            dict[str, bool]: Whether each commit exists.
+        """
 
     @abstractmethod
     def apply_patch(
@@ -225,6 +259,17 @@ class AbstractSCM(ABC):
     def head_ref(self) -> str:
         """Get the current revision_id."""
 
+    @abstractmethod
+    def tree_hash(self) -> str:
+        """Return a hash of the files in the current revision.
+
+        Applying the same changes on top of the same base gives the same hash.
+        """
+
+    @abstractmethod
+    def changed_paths(self) -> list[str]:
+        """Return the paths of the files touched by the local changes."""
+
     @abstractmethod
     def changeset_descriptions(self) -> list[str]:
         """Retrieve the descriptions of commits in the repository.
@@ -257,6 +302,40 @@ class AbstractSCM(ABC):
             str: The target changeset
         """
 
+    @abstractmethod
+    def prefetch(self, pull_path: str):
+        """Fetch the default branch from `pull_path` without updating the working copy.
+
+        This is used to keep the repository current between jobs, so that
+        `update_repo` has little left to fetch.
+        """
+
+    # Whether `mark_as_upstream` and `reset_to` are supported, so that several jobs
+    # can be applied on top of each other, and pushed together.
+    supports_push_trains: bool = False
+
+    def mark_as_upstream(self):
+        """Use the current commit as the base of the local changes, as if pushed.
+
+        Changes made afterwards are then considered separately from the previous
+        ones, e.g. by `describe_local_changes` and `clean_repo`, until the next
+        `update_repo`.
+        """
+        raise NotImplementedError
+
+    def reset_to(self, revision: str):
+        """Move the current work branch to `revision`, and check it out."""
+        raise NotImplementedError
+
+    def worktree(self, path: str, revision: str) -> "AbstractSCM | None":
+        """Return an SCM for a separate working copy of this repository at `path`.
+
+        The working copy is checked out at `revision`, and shares its history with
+        this repository, so that changes committed there can be used here. Return
+        None if the SCM doesn't support separate working copies.
+        """
+        return None
+
     def prepare_repo(self, pull_path: str):
         """Either clone or update the repo."""
         if not self.repo_is_initialized:
@@ -1,6 +1,7 @@
 import io
 import logging
 import os
+import posixpath
 import re
 import subprocess
 import tempfile
@@ -8,7 +9,7 @@ import uuid
 from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Callable, TypeVar
+from typing import Any, Callable, Iterable, Iterator, TypeVar
 
 from typing_extensions import override
 
@@ -71,8 +72,17 @@ class GitSCM(AbstractSCM):
         re.MULTILINE,
     )
 
+    COMMIT_SHA_RE = re.compile(r"[0-9a-f]{40}")
+
+    supports_push_trains = True
+
     default_branch: str
 
+    # The commit the work branch was created from by `update_repo`, or moved to by
+    # `mark_as_upstream`. The work branch has no upstream if it was created from a
+    # commit rather than a branch.
+    base_commit: str | None = None
+
     def __init__(self, path: str, default_branch: str = "main", **kwargs):
         self.default_branch = default_branch
         super().__init__(path)
@@ -91,9 +101,24 @@ class GitSCM(AbstractSCM):
 
     @override
     def clone(self, source: str):
-        """Clone a repository from a source."""
-        # When cloning, self.path doesn't exist yet, so we need to use another CWD.
-        self._git_run("clone", source, self.path, cwd="/")
+        """Clone a repository from a source.
+
+        If a previous clone was interrupted, it is resumed from the objects it already
+        fetched.
+        """
+        if (Path(self.path) / ".git").is_dir():
+            logger.info(f"Resuming interrupted clone of {self}.")
+            self._git_run("config", "remote.origin.url", source, cwd=self.path)
+            self._git_run(
+                "config",
+                "remote.origin.fetch",
+                "+refs/heads/*:refs/remotes/origin/*",
+                cwd=self.path,
+            )
+            self._git_run("fetch", "origin", cwd=self.path)
+        else:
+            # When cloning, self.path doesn't exist yet, so we need to use another CWD.
+            self._git_run("clone", source, self.path, cwd="/")
         self._git_run("checkout", self.default_branch, cwd=self.path)
         self._git_setup_user()
 
@@ -134,10 +159,47 @@ class GitSCM(AbstractSCM):
 
         self._git_run(*push_command, cwd=self.path)
 
-    def last_commit_for_path(self, path: str) -> str:
-        """Find last commit to touch a path."""
-        command = ["log", "--max-count=1", "--format=%H", "--", path]
-        return self._git_run(*command, cwd=self.path)
+    @override
+    def last_commits_for_paths(self, paths: Iterable[str]) -> dict[str, str]:
+        """Find the last commit to touch each of the paths, in a single `git log`.
+
+        The history is walked from the most recent commit, and the walk stops as soon
+        as a commit was found for every path.
+        """
+        last_commits = dict.fromkeys(paths, "")
+        remaining = set(last_commits)
+        if not remaining:
+            return last_commits
+
+        # Matching each file against many pathspecs is slow, so the history is limited
+        # to their directories instead, and the files listed are filtered here.
+        pathspecs = {posixpath.dirname(path) or path for path in remaining}
+
+        separator = self._separator()
+        command = [
+            "log",
+            f"--format={separator}%H",
+            "--name-only",
+            # Separate entries with NULs, so that paths are not quoted.
+            "-z",
+            "--",
+            *sorted(pathspecs),
+        ]
+
+        commit = ""
+        for entry in self._git_stream(*command, separator=b"\0"):
+            if entry.startswith(separator):
+                commit = entry.removeprefix(separator)
+                continue
+
+            path = entry.removeprefix("\n")
+            if path in remaining:
+                last_commits[path] = commit
+                remaining.remove(path)
+                if not remaining:
+                    break
+
+        return last_commits
 
     @override
     @detect_patch_conflict
@@ -279,18 +341,15 @@ class GitSCM(AbstractSCM):
 
         failed_paths = self.FAILED_RE.findall(error_message)
 
-        failed_path_commits = [
-            (path, self.last_commit_for_path(path), path_error)
-            for path_error, path in failed_paths
-        ]
+        last_commits = self.last_commits_for_paths(path for _, path in failed_paths)
 
         breakdown["failed_paths"] = [
             {
                 "path": path,
-                "url": f"{pull_path}/tree/{revision}/{path}",
-                "changeset_id": revision,
+                "url": f"{pull_path}/tree/{last_commits[path]}/{path}",
+                "changeset_id": last_commits[path],
             }
-            for (path, revision, _) in failed_path_commits
+            for _, path in failed_paths
         ]
 
         for path_error, path in failed_paths:
@@ -318,13 +377,13 @@ class GitSCM(AbstractSCM):
         return self._describe_commits(revision_id)[0]
 
     @override
-    def describe_local_changes(self, base_cset: str = "@{u}") -> list[CommitData]:
+    def describe_local_changes(self, base_cset: str = "") -> list[CommitData]:
         """Return a list of the Commits only present on this branch.
 
         Use the passed target changeset as the base commit. Otherwise, use the
-        configured upstream branch.
+        base of the work branch.
         """
-        refspec = f"{base_cset}.."
+        refspec = f"{base_cset or self._base_ref}.."
 
         return list(reversed(self._describe_commits(refspec)))
 
@@ -403,12 +462,32 @@ class GitSCM(AbstractSCM):
         """Get the current revision_id"""
         return self._git_run("rev-parse", "HEAD", cwd=self.path)
 
+    @override
+    def tree_hash(self) -> str:
+        """Return the hash of the tree of the current commit."""
+        return self._git_run("rev-parse", "HEAD^{tree}", cwd=self.path)
+
+    @override
+    def changed_paths(self) -> list[str]:
+        """Return the paths of the files changed since the base of the work branch."""
+        return self._git_run(
+            "diff", "--name-only", "--no-renames", self._base_ref, "HEAD", cwd=self.path
+        ).splitlines()
+
     @override
     def changeset_descriptions(self) -> list[str]:
         """Retrieve the descriptions of commits in the repository."""
-        command = ["log", "--format=%s", "@{u}.."]
+        command = ["log", "--format=%s", f"{self._base_ref}.."]
         return self._git_run(*command, cwd=self.path).splitlines()
 
+    @property
+    def _base_ref(self) -> str:
+        """The commit the local changes are based on.
+
+        This falls back to the upstream branch if no work branch has been created.
+        """
+        return self.base_commit or "@{u}"
+
     @override
     def update_repo(
         self,
@@ -427,14 +506,7 @@ class GitSCM(AbstractSCM):
             target_cset = self.default_branch
 
         self.clean_repo(attributes_override=attributes_override)
-        # Fetch all refs at the given pull_path, and overwrite the `origin` references.
-        self._git_run(
-            "fetch",
-            "--prune",
-            pull_path,
-            "+refs/heads/*:refs/remotes/origin/*",
-            cwd=self.path,
-        )
+        self._fetch_target(pull_path, target_cset)
 
         remote_branch = f"origin/{target_cset}"
         if self._git_run("branch", "--list", "--remote", remote_branch, cwd=self.path):
@@ -448,7 +520,88 @@ class GitSCM(AbstractSCM):
         self._git_run(
             "checkout", "--force", "-B", work_branch, target_cset, cwd=self.path
         )
-        return self.head_ref()
+        self.base_commit = self.head_ref()
+        return self.base_commit
+
+    def _fetch_target(self, pull_path: str, target_cset: str):
+        """Fetch what is needed to check out `target_cset` from `pull_path`.
+
+        Only the branch or commit to check out is fetched, rather than negotiating
+        every branch of the repository. All branches are fetched if it can't be
+        found that way.
+        """
+        if self.COMMIT_SHA_RE.fullmatch(target_cset):
+            if self.commit_exists(target_cset):
+                return
+
+            # The target is most likely on the default branch.
+            self._fetch_branch(pull_path, self.default_branch)
+            if self.commit_exists(target_cset):
+                return
+        else:
+            try:
+                self._fetch_branch(pull_path, target_cset)
+                return
+            except SCMException:
+                logger.info(
+                    f"Could not fetch branch {target_cset} of {self}, "
+                    "fetching all branches."
+                )
+
+        # Fetch all refs at the given pull_path, and overwrite the `origin` references.
+        self._git_run(
+            "fetch",
+            "--prune",
+            pull_path,
+            "+refs/heads/*:refs/remotes/origin/*",
+            cwd=self.path,
+        )
+
+    def _fetch_branch(self, pull_path: str, branch: str):
+        """Fetch a single branch from `pull_path`, overwriting its `origin` reference."""
+        self._git_run(
+            "fetch",
+            pull_path,
+            f"+refs/heads/{branch}:refs/remotes/origin/{branch}",
+            cwd=self.path,
+        )
+
+    @override
+    def prefetch(self, pull_path: str):
+        """Fetch the default branch from `pull_path`, leaving the working copy as is."""
+        self._fetch_branch(pull_path, self.default_branch)
+
+    @override
+    def mark_as_upstream(self):
+        """Point the upstream reference of the work branch at the current commit.
+
+        The reference is overwritten by the next fetch.
+        """
+        upstream = self._git_run(
+            "rev-parse", "--symbolic-full-name", "@{u}", cwd=self.path
+        )
+        self._git_run("update-ref", upstream, "HEAD", cwd=self.path)
+        self.base_commit = self.head_ref()
+
+    @override
+    def reset_to(self, revision: str):
+        """Reset the work branch to `revision`."""
+        self._git_run("reset", "--hard", revision, cwd=self.path)
+
+    @override
+    def worktree(self, path: str, revision: str) -> "GitSCM":
+        """Return a GitSCM for a linked worktree at `path`, detached at `revision`.
+
+        The worktree is created if needed, and reused otherwise.
+        """
+        if Path(path).exists():
+            self._git_run("checkout", "--detach", "--force", revision, cwd=path)
+            self._git_run("clean", "-fdx", cwd=path)
+        else:
+            self._git_run("worktree", "prune", cwd=self.path)
+            self._git_run("worktree", "add", "--detach", path, revision, cwd=self.path)
+
+        return GitSCM(path, default_branch=self.default_branch)
 
     @override
     def clean_repo(
@@ -512,6 +665,8 @@ class GitSCM(AbstractSCM):
 
         try:
             result = self._git_run("rev-parse", "--is-inside-work-tree", cwd=self.path)
+            # An interrupted clone has a repository, but nothing checked out.
+            self._git_run("rev-parse", "--verify", "HEAD", cwd=self.path)
         except SCMException:
             return False
 
@@ -529,7 +684,13 @@ class GitSCM(AbstractSCM):
         return True
 
     @classmethod
-    def _git_run(cls, *args, cwd: str | None = None, rstrip: bool = True) -> str:
+    def _git_run(
+        cls,
+        *args,
+        cwd: str | None = None,
+        rstrip: bool = True,
+        input: str | None = None,
+    ) -> str:
         """Run a git command and return full output.
 
         Parameters:
@@ -540,6 +701,9 @@ class GitSCM(AbstractSCM):
         cwd: str
             Optional path to work in, default to '/'
 
+        input: str
+            Optional data to send to the standard input of the command
+
         Returns:
             str: the standard output of the command
         """
@@ -559,17 +723,14 @@ class GitSCM(AbstractSCM):
         )
 
         result = subprocess.run(
-            command, cwd=path, capture_output=True, env=cls._git_env()
+            command,
+            cwd=path,
+            capture_output=True,
+            env=cls._git_env(),
+            input=input.encode("utf-8") if input is not None else None,
         )
 
-        try:
-            # Try decoding with utf-8 first.
-            out = result.stdout.decode("utf-8")
-        except UnicodeDecodeError:
-            # Try again with latin-1.
-            out = result.stdout.decode("latin-1")
-
-        out = out.lstrip()
+        out = cls._decode_output(result.stdout).lstrip()
         if rstrip:
             out = out.rstrip()
 
@@ -595,6 +756,64 @@ class GitSCM(AbstractSCM):
 
         return out
 
+    def _git_stream(self, *args, separator: bytes) -> Iterator[str]:
+        """Run a git command in the repository, and yield its output as it comes.
+
+        The output is split into entries on `separator`. The command is stopped if the
+        caller stops iterating early.
+        """
+        correlation_id = str(uuid.uuid4())
+        command = ["git"] + list(args)
+        sanitised_command = [self._redact_url_userinfo(a) for a in command]
+        logger.info(
+            "running git command #%s: %s",
+            correlation_id,
+            sanitised_command,
+            extra={
+                "command": sanitised_command,
+                "command_id": correlation_id,
+                "path": self.path,
+            },
+        )
+
+        with subprocess.Popen(
+            command,
+            cwd=self.path,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            env=self._git_env(),
+        ) as process:
+            try:
+                pending = b""
+                while chunk := process.stdout.read1():
+                    *entries, pending = (pending + chunk).split(separator)
+                    for entry in entries:
+                        yield self._decode_output(entry)
+                if pending:
+                    yield self._decode_output(pending)
+
+                stderr = process.stderr.read()
+                if process.wait():
+                    redacted_stderr = self._redact_url_userinfo(stderr.decode("utf-8"))
+                    raise SCMInternalServerError(
+                        f"Error running git command; {sanitised_command=}, "
+                        f"path={self.path!r}, {redacted_stderr}",
+                        "",
+                        redacted_stderr,
+                    )
+            finally:
+                if process.poll() is None:
+                    process.kill()
+
+    @staticmethod
+    def _decode_output(output: bytes) -> str:
+        try:
+            # Try decoding with utf-8 first.
+            return output.decode("utf-8")
+        except UnicodeDecodeError:
+            # Try again with latin-1.
+            return output.decode("latin-1")
+
     @staticmethod
     def _redact_url_userinfo(url: str) -> str:
         return re.sub(URL_USERINFO_RE, "[REDACTED]@", url)
@@ -609,37 +828,28 @@ class GitSCM(AbstractSCM):
         """Return the currently active branch."""
         return self._git_run("branch", "--show-current", cwd=self.path)
 
-    def commit_exists(self, commit_id: str) -> bool:
-        """Check if a commit exists in the repository.
-
-        Args:
-            commit_id: The commit ID to check.
+    @override
+    def commits_exist(self, commit_ids: Iterable[str]) -> dict[str, bool]:
+        """Check which of the commits exist in the repository, in a single
+        `git cat-file`."""
+        exists = dict.fromkeys(commit_ids, False)
 
-        Returns:
-            `True` if the commit exists, `False` otherwise.
-        """
-        try:
-            result = self._git_run("cat-file", "-t", commit_id, cwd=self.path)
-            return result == "commit"
-        except SCMException as exc:
-            # Check if this is the expected "object doesn't exist" error.
-            if any(
-                err in exc.err
-                for err in (
-                    "Not a valid object name",
-                    "bad object",
-                    "could not get object info",
-                )
-            ):
-                logger.debug(f"Commit {commit_id} does not exist in repository")
-                return False
+        # `--batch-check` reads one object name per line.
+        names = [name for name in exists if name and not re.search(r"\s", name)]
+        if not names:
+            return exists
 
-            logger.warning(
-                f"Unexpected error while checking if commit {commit_id} exists",
-                exc_info=exc,
-            )
+        # Each line of output is either the type of the object, or `<name> missing`.
+        output = self._git_run(
+            "cat-file",
+            "--batch-check=%(objecttype)",
+            cwd=self.path,
+            input="".join(f"{name}\n" for name in names),
+        )
+        for name, object_type in zip(names, output.splitlines(), strict=True):
+            exists[name] = object_type == "commit"
 
-            raise exc
+        return exists
 
     @override
     def merge_onto(
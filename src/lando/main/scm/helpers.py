@@ -1,3 +1,4 @@
+import binascii
 import email
 import enum
 import io
@@ -24,6 +25,8 @@ HG_HEADER_NAMES = (
     "Fail HG Import",
 )
 DIFF_LINE_RE = re.compile(r"^diff\s+\S+\s+\S+")
+# Characters ignored when decoding base64, such as line breaks.
+NON_BASE64_RE = re.compile(r"[^A-Za-z0-9+/=]")
 
 _HG_EXPORT_PATCH_TEMPLATE = """
 {header}
@@ -108,6 +111,31 @@ def get_timestamp_from_hg_date_header(date_header: str) -> str:
     return date_header.split(" ")[0]
 
 
+def decode_base64_patch(data: str, chunk_size: int = 1 << 20) -> io.BytesIO:
+    """Decode a base64 encoded patch into a `BytesIO`.
+
+    The data is decoded `chunk_size` characters at a time, so no intermediate copy
+    of the whole patch is made. As with `base64.b64decode`, characters outside of
+    the base64 alphabet, such as line breaks, are ignored. `binascii.Error` is
+    raised if the data isn't valid base64.
+    """
+    decoded = io.BytesIO()
+    pending = ""
+    for start in range(0, len(data), chunk_size):
+        chunk = pending + NON_BASE64_RE.sub("", data[start : start + chunk_size])
+        # Decode whole groups of 4 characters, so only the last group can be padded.
+        end = len(chunk) - len(chunk) % 4
+        decoded.write(binascii.a2b_base64(chunk[:end]))
+        pending = chunk[end:]
+
+    if pending:
+        # Raises an error, as the data isn't a whole number of groups.
+        binascii.a2b_base64(pending)
+
+    decoded.seek(0)
+    return decoded
+
+
 class PatchHelper(ABC):
     """Base class for parsing patches/exports."""
 
@@ -185,7 +213,7 @@ class PatchHelper(ABC):
 class HgPatchHelper(PatchHelper):
     """Helper class for parsing Mercurial patches/exports."""
 
-    patch: io.StringIO
+    patch: io.TextIOBase
     header_end_line_no: int
     diff_start_line: int | None = None
 
@@ -196,10 +224,11 @@ class HgPatchHelper(PatchHelper):
 
     @classmethod
     @override
-    def from_bytes_io(cls, bytes_io: io.BytesIO) -> "PatchHelper":
-        raise NotImplementedError("`from_bytes_io` not implemented for HgPatchHelper.")
+    def from_bytes_io(cls, bytes_io: io.BytesIO) -> "HgPatchHelper":
+        # Lines are decoded as they are read, rather than copying the whole patch.
+        return cls(io.TextIOWrapper(bytes_io, encoding="utf-8", newline="\n"))
 
-    def __init__(self, fileobj: io.StringIO):
+    def __init__(self, fileobj: io.TextIOBase):
         super().__init__()
         self.patch = fileobj
         self.header_end_line_no = 0
@@ -1,4 +1,5 @@
 import copy
+import hashlib
 import io
 import logging
 import os
@@ -15,6 +16,7 @@ from pathlib import Path
 from typing import (
     IO,
     Any,
+    Iterable,
     Self,
 )
 
@@ -166,6 +168,9 @@ class HgSCM(AbstractSCM):
         "extensions.rebase": "",
     }
 
+    # Full or short changeset IDs.
+    NODE_RE = re.compile(r"[0-9a-f]{12,40}")
+
     config: dict
 
     hg_repo: hglib.client.hgclient
@@ -217,20 +222,42 @@ class HgSCM(AbstractSCM):
                 ]
             )
 
-    def last_commit_for_path(self, path: str) -> str:
-        """Find last commit to touch a path."""
-        return self.run_hg(
-            [
-                "log",
-                "--cwd",
-                self.path,
-                "--template",
-                "{node}",
-                "-l",
-                "1",
-                path,
-            ]
-        ).decode()
+    @override
+    def last_commits_for_paths(self, paths: Iterable[str]) -> dict[str, str]:
+        """Find the last commit to touch each of the paths, in a single revset."""
+        last_commits = dict.fromkeys(paths, "")
+        if not last_commits:
+            return last_commits
+
+        # Plain paths are looked up directly in their filelog, relative to the `--cwd`.
+        revset = " + ".join(
+            f"max(filelog({self._revset_string(path)}))" for path in last_commits
+        )
+
+        commit_separator = self._separator()
+        file_separator = self._separator()
+        template = (
+            f"{commit_separator}{{node}}{file_separator}"
+            f"{{join(files, '{file_separator}')}}"
+        )
+        output = self.run_hg(
+            ["log", "--cwd", self.path, "-r", f"sort({revset}, -rev)", "-T", template]
+        ).decode(self.ENCODING)
+
+        # Changesets are listed from the most recent.
+        for commit_output in output.split(commit_separator)[1:]:
+            node, *files = commit_output.split(file_separator)
+            for path in files:
+                if path in last_commits and not last_commits[path]:
+                    last_commits[path] = node
+
+        return last_commits
+
+    @staticmethod
+    def _revset_string(value: str) -> str:
+        """Quote a value for use as a string in a revset."""
+        escaped = value.replace("\\", "\\\\").replace("'", "\\'")
+        return f"'{escaped}'"
 
     @override
     def apply_patch(
@@ -382,9 +409,7 @@ class HgSCM(AbstractSCM):
         failed_paths, rejects_paths = self._extract_error_data(error_message)
 
         # Find last commits to touch each failed path.
-        failed_path_changesets = [
-            (path, self.last_commit_for_path(path)) for path in failed_paths
-        ]
+        last_commits = self.last_commits_for_paths(failed_paths)
 
         breakdown = {
             "revision_id": revision_id,
@@ -394,10 +419,10 @@ class HgSCM(AbstractSCM):
         breakdown["failed_paths"] = [
             {
                 "path": path,
-                "url": f"{pull_path}/file/{revision}/{path}",
-                "changeset_id": revision,
+                "url": f"{pull_path}/file/{last_commits[path]}/{path}",
+                "changeset_id": last_commits[path],
             }
-            for (path, revision) in failed_path_changesets
+            for path in failed_paths
         ]
         breakdown["rejects_paths"] = {}
         for path in rejects_paths:
@@ -521,6 +546,20 @@ class HgSCM(AbstractSCM):
         """Get the current revision_id."""
         return self.run_hg(["log", "-r", ".", "-T", "{node}"]).decode("utf-8")
 
+    @override
+    def tree_hash(self) -> str:
+        """Return a hash of the manifest of the current revision."""
+        manifest = self.run_hg(["manifest", "--debug", "-r", "."])
+        return hashlib.sha256(manifest).hexdigest()
+
+    @override
+    def changed_paths(self) -> list[str]:
+        """Return the paths of the files changed in the draft ancestors."""
+        output = self.run_hg(
+            ["log", "-r", "::. and draft()", "-T", "{join(files, '\\n')}\n"]
+        ).decode("utf-8")
+        return sorted({path for path in output.splitlines() if path})
+
     @override
     def changeset_descriptions(self) -> list[str]:
         """Get a description for all the patches to be applied."""
@@ -555,12 +594,13 @@ class HgSCM(AbstractSCM):
 
     def _update_from_upstream(self, source: str, remote_rev: str):
         """Update the repository to the specified changeset (not optional)."""
-        # Pull and update to remote tip.
         cmds = [
-            ["pull", source],
             ["rebase", "--abort"],
             ["update", "--clean", "-r", remote_rev],
         ]
+        if not self._has_changeset(remote_rev):
+            # Only pull the target changeset and its ancestors.
+            cmds.insert(0, ["pull", "-r", remote_rev, source])
 
         for cmd in cmds:
             try:
@@ -571,6 +611,38 @@ class HgSCM(AbstractSCM):
                     continue
                 raise e
 
+    def _has_changeset(self, rev: str | bytes) -> bool:
+        """Return whether `rev` is a changeset ID already present locally."""
+        if isinstance(rev, bytes):
+            rev = rev.decode(self.ENCODING)
+
+        return self.commit_exists(rev)
+
+    @override
+    def commits_exist(self, commit_ids: Iterable[str]) -> dict[str, bool]:
+        """Check which of the changeset IDs are present locally, in a single revset."""
+        exists = dict.fromkeys(commit_ids, False)
+
+        # Other revision identifiers, like branch names, may resolve to a stale
+        # changeset.
+        nodes = [node for node in exists if self.NODE_RE.fullmatch(node)]
+        if not nodes:
+            return exists
+
+        # `id()` is empty for unknown, hidden or ambiguous IDs, rather than an error.
+        revset = " + ".join(f"id({node})" for node in nodes)
+        found = self.run_hg(["log", "-r", revset, "-T", "{node}\n"]).decode().split()
+        for node in nodes:
+            exists[node] = any(found_node.startswith(node) for found_node in found)
+
+        return exists
+
+    @override
+    def prefetch(self, pull_path: str):
+        """Pull the default branch from `pull_path`, leaving the working copy as is."""
+        with self.for_pull():
+            self.run_hg(["pull", "-r", "default", pull_path])
+
     def _get_remote_head(self, source: str) -> bytes:
         """Obtain remote head. We assume there is only a single head."""
         cset = self.run_hg(["identify", source, "-r", "default", "--id"]).strip()
@@ -76,6 +76,26 @@ def test_GitSCM_clone(
     ).exists(), f"New git clone {clone_path} doesn't contain a .git directory"
 
 
+def test_GitSCM_prepare_repo_resumes_interrupted_clone(
+    git_repo: Path,
+    request: pytest.FixtureRequest,
+    tmp_path: Path,
+):
+    clone_path = tmp_path / request.node.name
+    # An interrupted clone leaves a repository without anything checked out.
+    subprocess.run(["git", "init", str(clone_path)], check=True)
+    scm = GitSCM(str(clone_path))
+    assert not scm.repo_is_initialized, "An interrupted clone isn't initialized."
+
+    scm.prepare_repo(str(git_repo))
+
+    assert scm.repo_is_initialized
+    upstream_head = subprocess.run(
+        ["git", "rev-parse", "HEAD"], cwd=git_repo, capture_output=True, text=True
+    ).stdout.strip()
+    assert scm.head_ref() == upstream_head
+
+
 @pytest.mark.parametrize(
     "strip_non_public_commits",
     [True, False],
@@ -595,17 +615,205 @@ def test_GitSCM_update_repo(
         ), f".gitattributes override not in {gitattributes}"
 
 
-@pytest.mark.parametrize(
-    "on_parent",
-    [
-        False,
-        # XXX: changeset_descriptions doesn't work when update_repo has been used with a commit rev
-        # as the target_cs. This is generally used when grafting a revision for Try, which
-        # doesn't use changeset_descriptions, so we tolerate this for now.
-        #
-        # True,
-    ],
-)
+def _git_rev_parse(path: Path, rev: str) -> str:
+    return (
+        subprocess.run(
+            ["git", "rev-parse", rev], cwd=str(path), capture_output=True, check=True
+        )
+        .stdout.decode("utf-8")
+        .strip()
+    )
+
+
+def test_GitSCM_update_repo_fetches_only_target_branch(
+    git_repo: Path,
+    git_setup_user: Callable,
+    request: pytest.FixtureRequest,
+    tmp_path: Path,
+    create_git_commit: Callable,
+):
+    clone_path = tmp_path / request.node.name
+    clone_path.mkdir()
+    scm = GitSCM(str(clone_path))
+    scm.clone(str(git_repo))
+    git_setup_user(str(clone_path))
+
+    create_git_commit(git_repo)
+    subprocess.run(["git", "checkout", "dev"], cwd=str(git_repo), check=True)
+    create_git_commit(git_repo)
+    subprocess.run(["git", "checkout", "main"], cwd=str(git_repo), check=True)
+
+    scm.update_repo(str(git_repo))
+
+    assert scm.head_ref() == _git_rev_parse(
+        git_repo, "main"
+    ), "update_repo should check out the latest upstream main"
+    assert _git_rev_parse(clone_path, "origin/dev") != _git_rev_parse(
+        git_repo, "dev"
+    ), "update_repo should not have fetched the dev branch"
+
+
+def test_GitSCM_update_repo_commit_target(
+    git_repo: Path,
+    git_setup_user: Callable,
+    request: pytest.FixtureRequest,
+    tmp_path: Path,
+    create_git_commit: Callable,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    clone_path = tmp_path / request.node.name
+    clone_path.mkdir()
+    scm = GitSCM(str(clone_path))
+    scm.clone(str(git_repo))
+    git_setup_user(str(clone_path))
+
+    mock_git_run = _monkeypatch_scm(monkeypatch, scm, "_git_run")
+
+    # A commit which is already known locally doesn't need fetching.
+    local_commit = scm.head_ref()
+    scm.update_repo(str(git_repo), local_commit)
+
+    assert scm.head_ref() == local_commit
+    assert not [
+        c for c in mock_git_run.call_args_list if c.args[0] == "fetch"
+    ], "No fetch expected for a commit already present locally"
+
+    # A new upstream commit is found on the default branch.
+    create_git_commit(git_repo)
+    upstream_commit = _git_rev_parse(git_repo, "main")
+    scm.update_repo(str(git_repo), upstream_commit)
+
+    assert scm.head_ref() == upstream_commit
+    fetches = [c for c in mock_git_run.call_args_list if c.args[0] == "fetch"]
+    assert len(fetches) == 1, f"Only the default branch should be fetched: {fetches}"
+    assert fetches[0].args[-1] == "+refs/heads/main:refs/remotes/origin/main"
+
+
+def test_GitSCM_update_repo_falls_back_to_fetching_all_branches(
+    git_repo: Path,
+    git_setup_user: Callable,
+    request: pytest.FixtureRequest,
+    tmp_path: Path,
+    create_git_commit: Callable,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    clone_path = tmp_path / request.node.name
+    clone_path.mkdir()
+    scm = GitSCM(str(clone_path))
+    scm.clone(str(git_repo))
+    git_setup_user(str(clone_path))
+
+    create_git_commit(git_repo)
+    monkeypatch.setattr(
+        scm, "_fetch_branch", MagicMock(side_effect=SCMException("", "", ""))
+    )
+
+    scm.update_repo(str(git_repo))
+
+    assert scm.head_ref() == _git_rev_parse(git_repo, "main")
+
+
+def test_GitSCM_prefetch(
+    git_repo: Path,
+    git_setup_user: Callable,
+    request: pytest.FixtureRequest,
+    tmp_path: Path,
+    create_git_commit: Callable,
+):
+    clone_path = tmp_path / request.node.name
+    clone_path.mkdir()
+    scm = GitSCM(str(clone_path))
+    scm.clone(str(git_repo))
+    git_setup_user(str(clone_path))
+
+    original_commit = scm.head_ref()
+    create_git_commit(git_repo)
+
+    scm.prefetch(str(git_repo))
+
+    assert _git_rev_parse(clone_path, "origin/main") == _git_rev_parse(
+        git_repo, "main"
+    ), "prefetch should update the default branch reference"
+    assert scm.head_ref() == original_commit, "prefetch should not move HEAD"
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("strategy", ["all-branches", "target-branch", "prefetched"])
+def test_benchmark_GitSCM_update_repo_time_to_first_apply(
+    git_repo: Path,
+    git_setup_user: Callable,
+    git_patch: Callable,
+    tmp_path: Path,
+    create_git_commit: Callable,
+    monkeypatch: pytest.MonkeyPatch,
+    benchmark_timer: Callable,
+    strategy: str,
+):
+    """Time from receiving a job to having its patch applied, while upstream moves.
+
+    The upstream repository has many branches, and gets a new commit on main before
+    every round, as a busy repository would.
+    """
+    upstream = tmp_path / "upstream.git"
+    subprocess.run(["git", "clone", "--bare", str(git_repo), str(upstream)], check=True)
+
+    main_commit = _git_rev_parse(upstream, "main")
+    stream = []
+    for i in range(500):
+        message = f"branch {i}"
+        stream.append(
+            f"commit refs/heads/branch-{i}\n"
+            "committer Py Test <pytest@lando.example.net> 0 +0000\n"
+            f"data {len(message)}\n{message}\n"
+            f"from {main_commit}\n"
+            f"M 644 inline branch-{i}\n"
+            f"data {len(str(i))}\n{i}\n\n"
+        )
+    subprocess.run(
+        ["git", "fast-import", "--quiet"],
+        cwd=str(upstream),
+        input="".join(stream).encode("utf-8"),
+        check=True,
+    )
+
+    pusher_path = tmp_path / "pusher"
+    subprocess.run(["git", "clone", str(upstream), str(pusher_path)], check=True)
+    git_setup_user(pusher_path)
+
+    clone_path = tmp_path / "worker"
+    clone_path.mkdir()
+    scm = GitSCM(str(clone_path))
+    scm.clone(str(upstream))
+    git_setup_user(clone_path)
+
+    if strategy == "all-branches":
+        monkeypatch.setattr(
+            scm, "_fetch_branch", MagicMock(side_effect=SCMException("", "", ""))
+        )
+
+    def advance_upstream():
+        create_git_commit(pusher_path)
+        subprocess.run(
+            ["git", "push", "origin", "HEAD:main"], cwd=str(pusher_path), check=True
+        )
+        if strategy == "prefetched":
+            # What the background prefetcher would have done between jobs.
+            scm.prefetch(str(upstream))
+
+    patch = git_patch().encode("utf-8")
+
+    def first_apply():
+        scm.update_repo(str(upstream))
+        scm.apply_patch_git(patch)
+
+    benchmark_timer(
+        f"update_repo and apply ({strategy})",
+        first_apply,
+        setup=advance_upstream,
+    )
+
+
+@pytest.mark.parametrize("on_parent", [False, True])
 def test_GitSCM_changeset_descriptions_on_workbranch(
     git_repo: Path,
     git_setup_user: Callable,
@@ -627,11 +835,13 @@ def test_GitSCM_changeset_descriptions_on_workbranch(
 
     scm.update_repo(str(git_repo), target_cs)
 
-    create_git_commit(clone_path)
+    new_file = create_git_commit(clone_path)
 
     assert (
         len(scm.changeset_descriptions()) == 1
     ), "Incorrect number of commit from the local changeset"
+    assert len(scm.describe_local_changes()) == 1
+    assert scm.changed_paths() == [new_file.name]
 
 
 @pytest.mark.parametrize("push_target", [None, "main", "dev"])
@@ -1061,6 +1271,122 @@ def test_GitSCM_process_merge_conflict_no_reject(
     ), "Missing default message from `content` in rejects_paths for that-other-file.txt"
 
 
+def _git_import_touched_files(path: Path, file_count: int) -> list[str]:
+    """Add a commit per file to the main branch of `path`, with `git fast-import`.
+
+    Return the paths of the files.
+    """
+    paths = [f"conflicts/file-{i}.txt" for i in range(file_count)]
+    # Following commits are added on top of the first one.
+    stream = [f"reset refs/heads/main\nfrom {_git_rev_parse(path, 'main')}\n\n"]
+    for i, file_path in enumerate(paths):
+        message = f"touch {file_path}"
+        stream.append(
+            "commit refs/heads/main\n"
+            "committer Py Test <pytest@lando.example.net> 0 +0000\n"
+            f"data {len(message)}\n{message}\n"
+            f"M 644 inline {file_path}\n"
+            f"data {len(str(i))}\n{i}\n\n"
+        )
+    subprocess.run(
+        ["git", "fast-import", "--quiet"],
+        cwd=str(path),
+        input="".join(stream).encode("utf-8"),
+        check=True,
+    )
+    return paths
+
+
+def test_GitSCM_last_commits_for_paths(
+    git_repo: Path,
+    git_setup_user: Callable,
+    request: pytest.FixtureRequest,
+    tmp_path: Path,
+    create_git_commit: Callable,
+):
+    clone_path = tmp_path / request.node.name
+    clone_path.mkdir()
+
+    scm = GitSCM(str(clone_path))
+    scm.clone(str(git_repo))
+    git_setup_user(str(clone_path))
+
+    first_file = create_git_commit(clone_path)
+    first_commit = scm.head_ref()
+    second_file = create_git_commit(clone_path)
+    second_commit = scm.head_ref()
+
+    with mock.patch.object(subprocess, "Popen", wraps=subprocess.Popen) as popen:
+        last_commits = scm.last_commits_for_paths(
+            [first_file.name, second_file.name, "does-not-exist.txt"]
+        )
+
+    assert last_commits == {
+        first_file.name: first_commit,
+        second_file.name: second_commit,
+        "does-not-exist.txt": "",
+    }
+    assert popen.call_count == 1, "All paths should be looked up in a single walk."
+
+    assert scm.last_commit_for_path(first_file.name) == first_commit
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("strategy", ["per-path", "batched"])
+def test_benchmark_GitSCM_process_merge_conflict(
+    git_repo: Path,
+    git_setup_user: Callable,
+    request: pytest.FixtureRequest,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    benchmark_timer: Callable,
+    strategy: str,
+):
+    """Time the breakdown of a conflict in 500 files, each last touched separately."""
+    clone_path = tmp_path / request.node.name
+    clone_path.mkdir()
+
+    scm = GitSCM(str(clone_path))
+    scm.clone(str(git_repo))
+    git_setup_user(str(clone_path))
+
+    paths = _git_import_touched_files(clone_path, 500)
+    for path in paths:
+        reject_path = clone_path / f"{path}.rej"
+        reject_path.parent.mkdir(parents=True, exist_ok=True)
+        reject_path.write_text(f"--- {path}\n+++ {path}\n", encoding="utf-8")
+    conflict_message = "\n".join(
+        f"error: patch failed: {path}:1\nRejected hunk #1." for path in paths
+    )
+
+    if strategy == "per-path":
+        # One `git log` per path, as before batching.
+        monkeypatch.setattr(
+            scm,
+            "last_commits_for_paths",
+            lambda paths: {
+                path: GitSCM.last_commits_for_paths(scm, [path])[path] for path in paths
+            },
+        )
+
+    breakdown = {}
+
+    def process_merge_conflict():
+        breakdown.update(scm.process_merge_conflict("wherever", 42, conflict_message))
+
+    benchmark_timer(
+        f"process_merge_conflict, 500 files ({strategy})",
+        process_merge_conflict,
+        rounds=3,
+    )
+
+    assert len(breakdown["failed_paths"]) == 500
+    assert breakdown["failed_paths"][-1]["changeset_id"] == scm.head_ref()
+    assert breakdown["failed_paths"][0]["changeset_id"] == _git_rev_parse(
+        clone_path, "HEAD~499"
+    )
+
+
 def test_GitSCM_add_diff_from_patches(
     git_patch: Callable,
     git_repo: Path,
@@ -1207,3 +1533,13 @@ def test_GitSCM_commit_exists(
     assert not scm.commit_exists(
         "this-is-not-a-valid-commit"
     ), "`commit_exists` should return `False` for invalid commit reference."
+
+    assert scm.commits_exist(
+        [existing_commit, new_commit, fake_commit, "this-is-not-a-valid-commit", ""]
+    ) == {
+        existing_commit: True,
+        new_commit: True,
+        fake_commit: False,
+        "this-is-not-a-valid-commit": False,
+        "": False,
+    }, "`commits_exist` should check all commits at once."
@@ -5,9 +5,11 @@ from unittest.mock import MagicMock, patch
 import pytest
 from django.conf import settings
 from django.core.exceptions import ValidationError
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 
 from lando.main.models import CommitMap, Repo
-from lando.main.models.revision import Revision
+from lando.main.models.revision import PatchBlob, Revision
 from lando.main.scm import SCMType
 from lando.utils.landing_checks import (
     ALL_CHECKS,
@@ -247,6 +249,68 @@ def test__models__Revision__metadata():
     assert r.diff == DIFF_ONLY
 
 
+@pytest.mark.django_db()
+def test__models__Revision__patch_stored_in_shared_blob():
+    patch_data = {
+        "author_name": "A. Uthor",
+        "author_email": "author@moz.test",
+        "commit_message": "Commit message",
+        "timestamp": "0",
+    }
+    r1 = Revision.new_from_patch(raw_diff=DIFF_ONLY, patch_data=patch_data)
+    r2 = Revision.new_from_patch(raw_diff=DIFF_ONLY, patch_data=patch_data)
+
+    assert r1.patch_blob_id, "The patch should be stored in a blob."
+    assert (
+        r1.patch_blob_id == r2.patch_blob_id
+    ), "Identical patches should share a blob."
+    assert PatchBlob.objects.count() == 1
+    assert r1.patch_blob.size == len(r1.patch_bytes)
+    assert r1.patch_blob.content == r1.patch_bytes
+
+    revision = Revision.objects.get(id=r2.id)
+    with CaptureQueriesContext(connection) as queries:
+        assert revision.diff == DIFF_ONLY
+    assert len(queries) == 1, "The patch should be loaded on first use."
+    assert revision.patch == r1.patch
+    assert revision.patches == "", "Unset patches should not be stored."
+    assert not revision.patches_blob_id
+
+    revision.patch = ""
+    revision.save()
+    revision.refresh_from_db()
+    assert not revision.patch_blob_id
+    assert revision.patch == ""
+
+
+@pytest.mark.django_db()
+def test__models__Revision__bulk_create_with_patches():
+    revisions = [
+        Revision.build_from_patch(
+            raw_diff=DIFF_ONLY,
+            patch_data={
+                "author_name": "A. Uthor",
+                "author_email": "author@moz.test",
+                "commit_message": f"Commit message {i % 5}",
+                "timestamp": "0",
+            },
+        )
+        for i in range(20)
+    ]
+    Revision.new_from_patch(raw_diff=DIFF_ONLY, patch_data=revisions[0].patch_data)
+
+    with CaptureQueriesContext(connection) as queries:
+        Revision.bulk_create_with_patches(revisions)
+
+    assert (
+        len(queries) == 3
+    ), "Blobs and revisions should be inserted with a constant number of queries."
+    assert all(revision.id for revision in revisions)
+    assert PatchBlob.objects.count() == 5, "Identical patches should share a blob."
+    for revision in revisions:
+        assert Revision.objects.get(id=revision.id).patch == revision.patch
+
+
 @pytest.mark.parametrize(
     "branch,expected_branch", [(None, "main"), ("non-default", "non-default")]
 )
@@ -1,3 +1,5 @@
+import base64
+import binascii
 import io
 import os
 from pathlib import Path
@@ -11,6 +13,7 @@ from lando.main.scm.helpers import (
     GitPatchHelper,
     HgPatchHelper,
     build_patch_for_revision,
+    decode_base64_patch,
 )
 from lando.main.scm.hg import HgSCM
 
@@ -323,6 +326,44 @@ diff --git a/autoland/autoland/transplant.py b/autoland/autoland/transplant.py
     assert patch.get_commit_description() == "WIP transplant and diff-start-line"
 
 
+def test_patchhelper_from_bytes_io():
+    patch = HgPatchHelper.from_bytes_io(io.BytesIO(HG_PATCH.encode("utf-8")))
+    expected = HgPatchHelper.from_string_io(io.StringIO(HG_PATCH))
+
+    assert patch.headers == expected.headers
+    assert patch.get_commit_description() == expected.get_commit_description()
+    assert patch.get_diff() == expected.get_diff()
+
+
+@pytest.mark.parametrize("chunk_size", (4, 6, 1024))
+def test_decode_base64_patch(chunk_size: int):
+    encoded = base64.b64encode(HG_PATCH.encode("utf-8")).decode("ascii")
+
+    decoded = decode_base64_patch(encoded, chunk_size=chunk_size)
+
+    assert decoded.read() == HG_PATCH.encode(
+        "utf-8"
+    ), "Decoding in chunks should return the original patch."
+
+
+@pytest.mark.parametrize("chunk_size", (4, 6, 1024))
+def test_decode_base64_patch_wrapped(chunk_size: int):
+    encoded = base64.encodebytes(HG_PATCH.encode("utf-8")).decode("ascii")
+    assert "\n" in encoded[:-1], "The encoded patch should be wrapped."
+
+    decoded = decode_base64_patch(encoded, chunk_size=chunk_size)
+
+    assert decoded.read() == base64.b64decode(
+        encoded
+    ), "Wrapped base64 should be decoded as `b64decode` does."
+
+
+@pytest.mark.parametrize("data", ("notbase64butlookslikeit", "bm90\nYmFzZTY"))
+def test_decode_base64_patch_invalid(data: str):
+    with pytest.raises(binascii.Error):
+        decode_base64_patch(data, chunk_size=8)
+
+
 def test_patchhelper_start_line():
     patch = HgPatchHelper.from_string_io(io.StringIO("""
 # HG changeset patch
@@ -635,6 +676,12 @@ def test_preserves_diff_crlf():
         hg_helper.get_diff() == "\n" + GIT_DIFF_CRLF
     ), "`get_diff()` should preserve CRLF."
 
+    hg_helper = HgPatchHelper.from_bytes_io(io.BytesIO(hg_patch.encode("utf-8")))
+
+    assert (
+        hg_helper.get_diff() == "\n" + GIT_DIFF_CRLF
+    ), "`get_diff()` should preserve CRLF when parsing bytes."
+
     git_helper = GitPatchHelper.from_string_io(io.StringIO(f"""\
 From: Connor Sheehan <sheehan@mozilla.com>
 Date: Wed, 6 Jul 2022 16:36:09 -0400
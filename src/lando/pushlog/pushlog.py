@@ -149,6 +149,17 @@ class NoOpPushLog(PushLog):
         pass
 
 
+def new_pushlog(repo: Repo, user: str, branch: str | None = None) -> PushLog:
+    """Return a PushLog for the repo, or a no-op one if its pushlog is disabled.
+
+    The push must be confirmed and recorded by the caller. Prefer PushLogForRepo
+    when a single push is being built.
+    """
+    if repo.pushlog_disabled:
+        return NoOpPushLog(repo, user)
+    return PushLog(repo, user, branch=branch)
+
+
 @contextmanager
 def PushLogForRepo(
     repo: Repo, user: str, branch: str | None = None
@@ -160,10 +171,7 @@ def PushLogForRepo(
     WARNING: Do not use record_push() on the returned PushLog, as the context manager
     will take care of it automatically. Calling it multiple times will raise a RuntimeError.
     """
-    if repo.pushlog_disabled:
-        pushlog = NoOpPushLog(repo, user)
-    else:
-        pushlog = PushLog(repo, user, branch=branch)
+    pushlog = new_pushlog(repo, user, branch)
 
     try:
         yield pushlog
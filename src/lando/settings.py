@@ -240,6 +240,9 @@ OIDC_RP_CLIENT_ID = os.getenv("OIDC_RP_CLIENT_ID")
 OIDC_RP_CLIENT_SECRET = os.getenv("OIDC_RP_CLIENT_SECRET")
 OIDC_RP_SCOPES = "openid lando profile email"
 
+# Maximum time, in seconds, for which the claims of a bearer access token are cached.
+OIDC_ACCESS_TOKEN_CACHE_TTL = int(os.getenv("OIDC_ACCESS_TOKEN_CACHE_TTL", 60 * 5))
+
 BUGZILLA_URL = os.getenv("BUGZILLA_URL", "http://bmo.test")
 BUGZILLA_API_KEY = os.getenv("BUGZILLA_API_KEY", "")
 
@@ -254,6 +257,33 @@ PHABRICATOR_URL = os.getenv("PHABRICATOR_URL", "http://phabricator.test")
 PHABRICATOR_ADMIN_API_KEY = os.getenv("PHABRICATOR_ADMIN_API_KEY", "")
 PHABRICATOR_UNPRIVILEGED_API_KEY = os.getenv("PHABRICATOR_UNPRIVILEGED_API_KEY", "")
 
+# Time, in seconds, for which the Phabricator user behind an API key is cached.
+PHABRICATOR_API_TOKEN_CACHE_TTL = int(os.getenv("PHABRICATOR_API_TOKEN_CACHE_TTL", 60))
+
+# Connect and read timeouts, in seconds, of requests to Phabricator.
+PHABRICATOR_CONNECT_TIMEOUT = int(os.getenv("PHABRICATOR_CONNECT_TIMEOUT", 5))
+PHABRICATOR_READ_TIMEOUT = int(os.getenv("PHABRICATOR_READ_TIMEOUT", 30))
+
+# Number of times a read-only conduit call is retried after a connection error, a
+# timeout or an unavailable server, and the base delay in milliseconds between retries.
+PHABRICATOR_RETRIES = int(os.getenv("PHABRICATOR_RETRIES", 2))
+PHABRICATOR_RETRY_BACKOFF = int(os.getenv("PHABRICATOR_RETRY_BACKOFF", 250))
+
+# Number of connections to Phabricator kept open by each process. This should be at
+# least the number of uwsgi threads.
+PHABRICATOR_POOL_SIZE = int(os.getenv("PHABRICATOR_POOL_SIZE", 8))
+
+# Number of chunks of a search over a list of IDs or PHIDs that are fetched at once.
+PHABRICATOR_SEARCH_CONCURRENCY = int(os.getenv("PHABRICATOR_SEARCH_CONCURRENCY", 4))
+
+# Delay, in seconds, before Phabricator is asked to update a repository after a landing.
+# Repositories with landings during that delay are all updated with the same request.
+PHABRICATOR_REPO_UPDATE_DELAY = int(os.getenv("PHABRICATOR_REPO_UPDATE_DELAY", 10))
+
+# Time, in seconds, for which the result of a stack assessment is reused. Results are
+# keyed on all the inputs of the assessment, so this only bounds the cache size.
+STACK_ASSESSMENT_CACHE_TTL = int(os.getenv("STACK_ASSESSMENT_CACHE_TTL", 60 * 60))
+
 TREEHERDER_URL = os.getenv("TREEHERDER_URL", "https://treeherder.mozilla.org")
 
 TREESTATUS_URL = os.getenv("TREESTATUS_URL", "http://treestatus.test")
@@ -288,6 +318,42 @@ LANDING_WORKER_DEFAULT_GRACE_SECONDS = int(
     os.environ.get("DEFAULT_GRACE_SECONDS", 60 * 2)
 )
 
+# Repositories are cloned and bootstrapped concurrently when a worker starts.
+# `mach bootstrap` shares state between repositories, so it isn't concurrent by default.
+LANDING_WORKER_REPO_PREPARE_CONCURRENCY = int(
+    os.getenv("LANDING_WORKER_REPO_PREPARE_CONCURRENCY", 4)
+)
+LANDING_WORKER_REPO_BOOTSTRAP_CONCURRENCY = int(
+    os.getenv("LANDING_WORKER_REPO_BOOTSTRAP_CONCURRENCY", 1)
+)
+LANDING_WORKER_REPO_PREPARE_ATTEMPTS = int(
+    os.getenv("LANDING_WORKER_REPO_PREPARE_ATTEMPTS", 5)
+)
+
+# Whether landing workers apply the next job for a repository in a separate worktree
+# while pushing the current one. Only supported for Git repositories.
+LANDING_WORKER_PIPELINE_JOBS = os.getenv(
+    "LANDING_WORKER_PIPELINE_JOBS", ""
+).lower() in (
+    "true",
+    "1",
+)
+
+# Maximum number of queued jobs for the same repository which landing workers push
+# together. Push trains are disabled when set to 1, and only supported for Git.
+LANDING_WORKER_PUSH_TRAIN_SIZE = int(os.getenv("LANDING_WORKER_PUSH_TRAIN_SIZE", 1))
+
+# Time, in seconds, for which the formatting of a tree is kept, so that landing the
+# same stack again doesn't run the formatters.
+AUTOFORMAT_CACHE_TTL = int(os.getenv("AUTOFORMAT_CACHE_TTL", 60 * 60 * 24))
+
+# Interval, in seconds, at which workers fetch the default branch of their
+# repositories between jobs. Prefetching is disabled when set to 0.
+LANDING_WORKER_PREFETCH_INTERVAL = int(os.getenv("LANDING_WORKER_PREFETCH_INTERVAL", 0))
+
+# Patches submitted to Try are parsed and checked by this many threads.
+TRY_PATCH_PARSE_CONCURRENCY = int(os.getenv("TRY_PATCH_PARSE_CONCURRENCY", 4))
+
 EMAIL_BACKEND = "django.core.mail.backends.console.EmailBackend"
 
 COMMITTER_NAME = os.getenv("LANDO_COMMITTER_NAME", LANDO_USER_NAME)
@@ -295,12 +361,31 @@ COMMITTER_EMAIL = os.getenv("LANDO_COMMITTER_EMAIL", LANDO_USER_EMAIL)
 
 GITHUB_APP_ID = os.getenv("GITHUB_APP_ID")
 GITHUB_APP_PRIVKEY = os.getenv("GITHUB_APP_PRIVKEY")
+# Share GitHub App installation tokens between processes via the cache.
+GITHUB_TOKEN_SHARED_CACHE = os.getenv("GITHUB_TOKEN_SHARED_CACHE", "").lower() in (
+    "true",
+    "1",
+)
+# Connect and read timeouts, in seconds, of requests to mint GitHub App tokens.
+GITHUB_CONNECT_TIMEOUT = int(os.getenv("GITHUB_CONNECT_TIMEOUT", 5))
+GITHUB_READ_TIMEOUT = int(os.getenv("GITHUB_READ_TIMEOUT", 30))
+# How long to keep GitHub API responses for conditional requests.
+GITHUB_ETAG_STORE_TTL = int(os.getenv("GITHUB_ETAG_STORE_TTL", 60 * 60 * 24))
+# Secret used to sign GitHub webhook payloads.
+GITHUB_WEBHOOK_SECRET = os.getenv("GITHUB_WEBHOOK_SECRET")
+# How long a webhook-maintained pull request snapshot can be used before it's
+# fetched again, in case some events were missed.
+GITHUB_PULL_REQUEST_SNAPSHOT_MAX_AGE = int(
+    os.getenv("GITHUB_PULL_REQUEST_SNAPSHOT_MAX_AGE", 60 * 60)
+)
 
 HTTP_USER_AGENT = f"Lando/{version} ({ENVIRONMENT})"
 
 AUDITLOG_INCLUDE_ALL_MODELS = True
 AUDITLOG_EXCLUDE_TRACKING_MODELS = (
     "main.CommitMap",
+    "main.PatchBlob",
+    "main.PullRequestSnapshot",
     "main.Revision",
     "pushlog",
     "headless_api.AutomationAction",
@@ -309,4 +394,6 @@ AUDITLOG_EXCLUDE_TRACKING_MODELS = (
 AUDITLOG_EXCLUDE_TRACKING_FIELDS = (
     "created_at",
     "updated_at",
+    # Generated from the job status.
+    "status_order",
 )
@@ -13,6 +13,7 @@ OIDC_IDENTIFIER = (
 PHABRICATOR_URL = "http://phabricator.test"
 PHABRICATOR_ADMIN_API_KEY = "api-thiskeymustbe32characterslen"
 PHABRICATOR_UNPRIVILEGED_API_KEY = "api-thiskeymustbe32characterslen"
+PHABRICATOR_RETRY_BACKOFF = 0
 CELERY_TASK_ALWAYS_EAGER = True
 ENVIRONMENT = Environment.test
 
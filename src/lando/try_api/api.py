@@ -1,9 +1,9 @@
-import base64
-import binascii
-import io
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from itertools import count, repeat
 from typing import Annotated
 
+from django.conf import settings
 from django.core.exceptions import PermissionDenied
 from django.core.handlers.wsgi import WSGIRequest
 from django.http import HttpResponse, HttpResponsePermanentRedirect
@@ -17,7 +17,12 @@ from lando.main.models.jobs import JobStatus
 from lando.main.models.landing_job import LandingJob, add_revisions_to_job
 from lando.main.models.revision import Revision
 from lando.main.scm.consts import SCMType
-from lando.main.scm.helpers import PATCH_HELPER_MAPPING, PatchFormat
+from lando.main.scm.helpers import (
+    PATCH_HELPER_MAPPING,
+    PatchFormat,
+    PatchHelper,
+    decode_base64_patch,
+)
 from lando.utils.exceptions import (
     BadRequestProblemException,
     ForbiddenProblemException,
@@ -92,6 +97,43 @@ class JobResponse(Schema):
     ]
 
 
+def build_revision_from_patch(
+    patch_helper_class: type[PatchHelper], patch_no: int, patch_data: str
+) -> Revision:
+    """Build an unsaved `Revision` from a base64 encoded patch."""
+    # Decode the base64 patch data to bytes.
+    try:
+        patch_io = decode_base64_patch(patch_data)
+    except ValueError as exc:
+        raise BadRequestProblemException(
+            title="Invalid base64 patch data",
+            detail=f"Invalid base64 data for patch {patch_no}",
+        ) from exc
+
+    # Create PatchHelper instance to parse the patch
+    try:
+        patch_helper = patch_helper_class.from_bytes_io(patch_io)
+
+        # Extract patch information using PatchHelper
+        author_name, author_email = patch_helper.parse_author_information()
+        timestamp = patch_helper.get_timestamp()
+    except ValueError as exc:
+        raise BadRequestProblemException(
+            title="Invalid patch data",
+            detail=f"Invalid patch data for patch {patch_no}",
+        ) from exc
+
+    return Revision.build_from_patch(
+        raw_diff=patch_helper.get_diff(),
+        patch_data={
+            "author_name": author_name,
+            "author_email": author_email,
+            "commit_message": patch_helper.get_commit_description(),
+            "timestamp": timestamp,
+        },
+    )
+
+
 @api.post(
     "/patches",
     summary="Submit a new landing job to the provided try repo.",
@@ -185,47 +227,21 @@ def patches(
         status=JobStatus.CREATED,
     )
 
-    # Create Revision objects from patches and associate them with the job
-    revisions = []
+    # Create Revision objects from patches and associate them with the job.
+    # Patches are parsed concurrently, and all the revisions are inserted at once.
     patch_helper_class = PATCH_HELPER_MAPPING[patches_request.patch_format]
-
-    for patch_no, patch_data in enumerate(patches_request.patches):
-        # Decode the base64 patch data to bytes
-        try:
-            decoded_patch_bytes = base64.b64decode(patch_data)
-        except binascii.Error as exc:
-            raise BadRequestProblemException(
-                title="Invalid base64 patch data",
-                detail=f"Invalid base64 data for patch {patch_no}",
-            ) from exc
-
-        # Create PatchHelper instance to parse the patch
-        patch_io = io.BytesIO(decoded_patch_bytes)
-        try:
-            patch_helper = patch_helper_class.from_bytes_io(patch_io)
-
-            # Extract patch information using PatchHelper
-            author_name, author_email = patch_helper.parse_author_information()
-            timestamp = patch_helper.get_timestamp()
-        except ValueError as exc:
-            raise BadRequestProblemException(
-                title="Invalid patch data",
-                detail=f"Invalid patch data for patch {patch_no}",
-            ) from exc
-
-        commit_message = patch_helper.get_commit_description()
-        diff = patch_helper.get_diff()
-
-        revision = Revision.new_from_patch(
-            raw_diff=diff,
-            patch_data={
-                "author_name": author_name,
-                "author_email": author_email,
-                "commit_message": commit_message,
-                "timestamp": timestamp,
-            },
+    with ThreadPoolExecutor(
+        max_workers=settings.TRY_PATCH_PARSE_CONCURRENCY
+    ) as executor:
+        revisions = list(
+            executor.map(
+                build_revision_from_patch,
+                repeat(patch_helper_class),
+                count(),
+                patches_request.patches,
+            )
         )
-        revisions.append(revision)
+    Revision.bulk_create_with_patches(revisions)
 
     add_revisions_to_job(revisions, try_job)
 
@@ -342,3 +342,70 @@ def test_try_api_patches_success(
     assert (
         job.target_commit_hash == commit_maps[0].hg_hash
     ), "Target commit hash not correctly converted"
+
+
+@pytest.mark.benchmark
+@pytest.mark.django_db()
+@pytest.mark.parametrize("concurrency", (1, 4))
+def test_benchmark_try_api_patches_100_patch_stack(
+    mock_authenticate_builder: Callable,
+    mocked_repo_config_try: Mock,
+    scm_user: Callable,
+    commit_maps: list[CommitMap],
+    client_post: Callable,
+    benchmark_timer: Callable,
+    settings,
+    concurrency: int,
+):
+    settings.TRY_PATCH_PARSE_CONCURRENCY = concurrency
+    user = scm_user([Permission.objects.get(codename="scm_level_1")], "password")
+    mock_authenticate_builder(user)
+
+    for map in commit_maps:
+        # This is hardcoded for now.
+        map.git_repo_name = "firefox"
+        map.save()
+
+    added_lines = "".join(f"+line {line} of the file\n" for line in range(2_000))
+    patches = [
+        base64.b64encode(
+            (
+                "From 0f5a3c99e12c1e9b0e81bed245fe537961f89e57 Mon Sep 17 00:00:00 2001\n"
+                "From: Test User <test@example.com>\n"
+                "Date: Wed, 6 Jul 2022 16:36:09 -0400\n"
+                f"Subject: [PATCH] Bug 1 - change file{i}.txt\n"
+                "\n"
+                "---\n"
+                f"diff --git a/file{i}.txt b/file{i}.txt\n"
+                "new file mode 100644\n"
+                "--- /dev/null\n"
+                f"+++ b/file{i}.txt\n"
+                "@@ -0,0 +1,2000 @@\n"
+                f"{added_lines}"
+                "--\n"
+                "2.31.1\n"
+            ).encode()
+        ).decode()
+        for i in range(100)
+    ]
+    request_payload = json.dumps(
+        {
+            "base_commit": commit_maps[0].git_hash,
+            "base_commit_vcs": "git",
+            "patches": patches,
+            "patch_format": "git-format-patch",
+        }
+    )
+
+    def submit():
+        response = client_post(
+            "/api/try/patches",
+            data=request_payload,
+            headers={"AuThOrIzAtIoN": "bEaReR token success"},
+        )
+        assert response.status_code == 201, response.text
+        assert len(LandingJob.objects.get(id=response.json()["id"]).revisions) == 100
+
+    benchmark_timer(
+        f"try push of 100 patches, {concurrency} parsing threads", submit, rounds=5
+    )
@@ -41,17 +41,16 @@ class BaseJobView(LandoView, ABC):
             except Worker.DoesNotExist:
                 queue = []
             else:
-                queue_query = self.job_type.job_queue_query(
-                    repositories=worker.applicable_repos.all(),
-                    # We set the grace_seconds to 0, so all current jobs are shown, including
-                    # those in the grace period, so they don't appear unannounced later.
-                    grace_seconds=0,
+                # Only include jobs before the current job in the queue.
+                queue = list(
+                    job.jobs_ahead_query(
+                        repositories=worker.applicable_repos.all(),
+                        # We set the grace_seconds to 0, so all current jobs are shown,
+                        # including those in the grace period, so they don't appear
+                        # unannounced later.
+                        grace_seconds=0,
+                    )
                 )
-                queue = list(queue_query.all())
-                # Only include jobs before the current landing_job in the queue
-                # I'd rather do this DB-side, but I couldn't work out how.
-                if job in queue:
-                    queue = queue[: queue.index(job)]
             context["queue"] = queue
 
         return TemplateResponse(
@@ -102,17 +101,16 @@ class LandingJobView(LandoView):
             except Worker.DoesNotExist:
                 queue = []
             else:
-                queue_query = LandingJob.job_queue_query(
-                    repositories=landing_worker.applicable_repos.all(),
-                    # We set the grace_seconds to 0, so all current jobs are shown, including
-                    # those in the grace period, so they don't appear unannounced later.
-                    grace_seconds=0,
+                # Only include jobs before the current landing_job in the queue.
+                queue = list(
+                    landing_job.jobs_ahead_query(
+                        repositories=landing_worker.applicable_repos.all(),
+                        # We set the grace_seconds to 0, so all current jobs are shown,
+                        # including those in the grace period, so they don't appear
+                        # unannounced later.
+                        grace_seconds=0,
+                    )
                 )
-                queue = list(queue_query.all())
-                # Only include jobs before the current landing_job in the queue
-                # I'd rather do this DB-side, but I couldn't work out how.
-                if landing_job in queue:
-                    queue = queue[: queue.index(landing_job)]
             context["queue"] = queue
 
         return TemplateResponse(
@@ -11,6 +11,7 @@ from django.template.response import TemplateResponse
 from django.utils.decorators import method_decorator
 
 from lando.api.legacy import api as legacy_api
+from lando.api.legacy.stacks import StackSnapshot
 from lando.api.legacy.validation import parse_revision_ids
 from lando.main.auth import force_auth_refresh, require_phabricator_api_key
 from lando.main.models import Repo
@@ -395,8 +396,11 @@ class RevisionView(LandoView):
     ) -> TemplateResponse:
         lando_user = request.user
 
+        # Share the Phabricator data for the stack across the calls below.
+        snapshot = StackSnapshot(phab, revision_id)
+
         # This is added for backwards compatibility.
-        stack = legacy_api.stacks.get(phab, revision_id)
+        stack = legacy_api.stacks.get(phab, revision_id, snapshot=snapshot)
 
         form = TransplantRequestForm()
         errors = []
@@ -419,7 +423,9 @@ class RevisionView(LandoView):
             )
 
         # Request all previous landing jobs for the stack.
-        landing_jobs = legacy_api.transplants.get_list(phab, f"D{revision_id}")
+        landing_jobs = legacy_api.transplants.get_list(
+            phab, f"D{revision_id}", snapshot=snapshot
+        )
 
         # The revision may appear in many `landable_paths`` if it has
         # multiple children, or any of its landable descendents have
@@ -455,7 +461,7 @@ class RevisionView(LandoView):
             form.fields["landing_path"].initial = landing_path_json
 
             dryrun = legacy_api.transplants.dryrun(
-                phab, lando_user, data={"landing_path": landing_path}
+                phab, lando_user, data={"landing_path": landing_path}, snapshot=snapshot
             )
             form.fields["confirmation_token"].initial = dryrun["confirmation_token"]
             series = list(reversed(series))
@@ -3,6 +3,7 @@ from django.http import HttpResponseNotAllowed, JsonResponse
 
 from lando.main.auth import require_authenticated_user
 from lando.ui.legacy.forms import UserSettingsForm
+from lando.utils.phabricator import clear_api_token_cache
 
 
 @require_authenticated_user
@@ -21,6 +22,10 @@ def manage_api_key(request: WSGIRequest) -> JsonResponse:
         return JsonResponse({"errors": form.errors}, status=400)
 
     profile = request.user.profile
+
+    # Make sure the previous key is no longer considered valid from the cache.
+    clear_api_token_cache(profile.phabricator_api_key)
+
     if form.cleaned_data["reset_key"]:
         profile.clear_phabricator_api_key()
     else:
@@ -6,7 +6,7 @@ from django.http import Http404
 from django.template.response import TemplateResponse
 from requests import HTTPError
 
-from lando.main.models import Repo
+from lando.main.models import PullRequestSnapshot, Repo
 from lando.main.models.landing_job import (
     LandingJob,
     get_handover_jobs_for_pull,
@@ -50,7 +50,9 @@ class PullRequestView(LandoView):
         client = GitHubAPIClient(target_repo.url)
 
         try:
-            pull_request = client.build_pull_request(number)
+            pull_request = PullRequestSnapshot.get_pull_request(client, number)
+        except GitHubAPIClient.NotFoundError as e:
+            raise Http404(f"Pull request {repo_name}#{number} doesn't exist") from e
         except HTTPError as e:
             if e.response.status_code == 404:
                 raise Http404(f"Pull request {repo_name}#{number} doesn't exist") from e
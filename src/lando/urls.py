@@ -21,6 +21,7 @@ from django.urls import include, path, re_path
 
 from lando.api.legacy.api import landing_jobs
 from lando.api.views import (
+    GitHubWebhookAPIView,
     LandingJobPullRequestAPIView,
     LegacyDiffWarningView,
     PullRequestChecksAPIView,
@@ -130,6 +131,11 @@ urlpatterns += [
         PullRequestChecksAPIView.as_view(),
         name="api-pull-request-checks",
     ),
+    path(
+        "api/github/webhook",
+        GitHubWebhookAPIView.as_view(),
+        name="api-github-webhook",
+    ),
 ]
 
 # "API" endpoints ported from legacy API app.
@@ -139,6 +145,11 @@ urlpatterns += [
         landing_jobs.LandingJobApiView.as_view(),
         name="landing-jobs",
     ),
+    path(
+        "landing_jobs/<int:job_id>/queue/",
+        landing_jobs.LandingJobQueueApiView.as_view(),
+        name="landing-jobs-queue",
+    ),
     path(
         "D<int:revision_id>/landings/<int:job_id>/",
         jobs.LandingJobView.as_view(),
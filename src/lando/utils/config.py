@@ -9,3 +9,25 @@ def read_lando_config(lando_ini_contents: str) -> ConfigParser:
     parser.read_string(lando_ini_contents)
 
     return parser
+
+
+def read_autoformat_patterns(config: ConfigParser) -> dict[str, list[str]]:
+    """Return the path patterns handled by each formatter in the `.lando.ini` file.
+
+    Patterns are set in the `[autoformat]` section as `formatter:pattern` keys, with
+    whitespace-separated shell-style patterns matched against whole paths, e.g.
+
+        [autoformat]
+        black:pattern = *.py
+        clang-format:pattern = *.c *.cpp *.h
+
+    An empty dict is returned if no patterns are set.
+    """
+    if not config.has_section("autoformat"):
+        return {}
+
+    return {
+        key.removesuffix(":pattern"): value.split()
+        for key, value in config.items("autoformat")
+        if key.endswith(":pattern")
+    }
@@ -1,17 +1,23 @@
-import asyncio
+import hashlib
+import hmac
 import io
+import json
 import logging
 import math
 import re
+import threading
+import time
 from collections import Counter
-from collections.abc import Iterator
-from datetime import datetime
+from collections.abc import Callable, Iterator
+from datetime import datetime, timedelta, timezone
 from enum import Enum
 from itertools import count
 
 import requests
+from datadog import statsd
 from django.conf import settings
-from simple_github import AppAuth, AppInstallationAuth
+from django.core.cache import cache
+from jose import jwt
 from typing_extensions import override
 
 from lando.main.models.configuration import ConfigurationKey, ConfigurationVariable
@@ -22,6 +28,159 @@ from lando.utils.const import URL_USERINFO_RE
 logger = logging.getLogger(__name__)
 
 
+class GitHubAppInstallationTokens:
+    """Mint and cache GitHub App installation tokens, per repository.
+
+    Tokens are kept in a process-wide dictionary and reused until shortly before
+    they expire. If `GITHUB_TOKEN_SHARED_CACHE` is set, they are also shared with
+    other processes via the Django cache.
+
+    Minting is synchronous: the app JWT is signed locally, and the installation
+    token is requested from the GitHub API with a single call once the installation
+    ID of the repository is known.
+    """
+
+    # Tokens with less than this time left before expiry are refreshed.
+    refresh_margin = timedelta(minutes=5)
+
+    def __init__(self):
+        # Only held to access the dictionaries below, never during requests.
+        self._lock = threading.Lock()
+        self._tokens: dict[tuple[str, str], tuple[str, datetime]] = {}
+        self._installation_ids: dict[tuple[str, str], int] = {}
+        # Held while minting the token of a repository, so it is only minted once.
+        self._mint_locks: dict[tuple[str, str], threading.Lock] = {}
+
+    @staticmethod
+    def cache_key(owner: str, repo: str) -> str:
+        """Return the shared cache key for the token of a repository."""
+        return f"github-installation-token-{owner}/{repo}"
+
+    def get_token(self, app_id: str, private_key: str, owner: str, repo: str) -> str:
+        """Return a valid installation token for the repository, minting it if needed."""
+        key = (owner, repo)
+
+        if token := self._get_fresh_token(key):
+            return token
+
+        with self._lock:
+            mint_lock = self._mint_locks.setdefault(key, threading.Lock())
+
+        with mint_lock:
+            # Another thread may have minted the token while this one waited.
+            if token := self._get_fresh_token(key):
+                return token
+
+            if settings.GITHUB_TOKEN_SHARED_CACHE:
+                token, expires_at = cache.get(self.cache_key(owner, repo), (None, None))
+                if token and self._is_fresh(expires_at):
+                    with self._lock:
+                        self._tokens[key] = (token, expires_at)
+                    return token
+
+            token, expires_at = self._mint_token(app_id, private_key, owner, repo)
+            with self._lock:
+                self._tokens[key] = (token, expires_at)
+
+            if settings.GITHUB_TOKEN_SHARED_CACHE:
+                timeout = expires_at - self.refresh_margin - datetime.now(timezone.utc)
+                cache.set(
+                    self.cache_key(owner, repo),
+                    (token, expires_at),
+                    int(timeout.total_seconds()),
+                )
+
+            return token
+
+    def _get_fresh_token(self, key: tuple[str, str]) -> str | None:
+        with self._lock:
+            token, expires_at = self._tokens.get(key, (None, None))
+        return token if token and self._is_fresh(expires_at) else None
+
+    def clear(self):
+        """Forget all tokens and installations known to this process."""
+        with self._lock:
+            self._tokens.clear()
+            self._installation_ids.clear()
+            self._mint_locks.clear()
+
+    def _is_fresh(self, expires_at: datetime) -> bool:
+        return expires_at - datetime.now(timezone.utc) > self.refresh_margin
+
+    def _mint_token(
+        self, app_id: str, private_key: str, owner: str, repo: str
+    ) -> tuple[str, datetime]:
+        """Request a new installation token scoped to the repository."""
+        logger.info(f"Minting GitHub installation token for {owner}/{repo}")
+
+        issued_at = int(time.time())
+        app_jwt = jwt.encode(
+            # Allow for clock drift, as recommended by GitHub.
+            {"iat": issued_at - 60, "exp": issued_at + 540, "iss": str(app_id)},
+            private_key,
+            algorithm="RS256",
+        )
+
+        session = requests.Session()
+        session.headers.update(
+            {
+                "Authorization": f"Bearer {app_jwt}",
+                "User-Agent": settings.HTTP_USER_AGENT,
+                "Accept": "application/vnd.github+json",
+                "X-GitHub-Api-Version": "2022-11-28",
+            }
+        )
+        base_url = GitHubAPI.GITHUB_BASE_URL
+        timeout = (settings.GITHUB_CONNECT_TIMEOUT, settings.GITHUB_READ_TIMEOUT)
+
+        key = (owner, repo)
+        with self._lock:
+            installation_id = self._installation_ids.get(key)
+
+        if installation_id is None:
+            response = session.get(
+                f"{base_url}/repos/{owner}/{repo}/installation", timeout=timeout
+            )
+            response.raise_for_status()
+            installation_id = response.json()["id"]
+            with self._lock:
+                self._installation_ids[key] = installation_id
+
+        response = session.post(
+            f"{base_url}/app/installations/{installation_id}/access_tokens",
+            # Ensures the token is only valid for the current repo.
+            json={"repositories": [repo]},
+            timeout=timeout,
+        )
+        if response.status_code == 404:
+            # The app was likely reinstalled, look the installation up again next time.
+            with self._lock:
+                self._installation_ids.pop(key, None)
+        response.raise_for_status()
+        data = response.json()
+
+        return data["token"], datetime.fromisoformat(data["expires_at"])
+
+
+# Process-wide installation token cache.
+installation_tokens = GitHubAppInstallationTokens()
+
+
+def verify_webhook_signature(body: bytes, signature: str | None) -> bool:
+    """Check the `X-Hub-Signature-256` header of a GitHub webhook delivery."""
+    if not settings.GITHUB_WEBHOOK_SECRET:
+        logger.warning("GITHUB_WEBHOOK_SECRET is not set, rejecting webhook.")
+        return False
+
+    if not signature:
+        return False
+
+    expected = hmac.new(
+        settings.GITHUB_WEBHOOK_SECRET.encode(), body, hashlib.sha256
+    ).hexdigest()
+    return hmac.compare_digest(f"sha256={expected}", signature)
+
+
 class GitHub:
     """Work with authentication to GitHub repositories."""
 
@@ -73,7 +232,7 @@ class GitHub:
             return self.repo_url
 
         logger.info(
-            f"Obtaining fresh GitHub token for GitHub repo at {self.repo_url}",
+            f"Obtaining GitHub token for GitHub repo at {self.repo_url}",
         )
 
         token = self._fetch_token()
@@ -88,13 +247,15 @@ class GitHub:
         return self.repo_url
 
     def _fetch_token(self) -> str | None:
-        """Obtain a fresh GitHub token to push to the specified repo.
+        """Obtain a GitHub token to push to the specified repo.
 
         This relies on GITHUB_APP_ID and GITHUB_APP_PRIVKEY to be set in the
         environment. Returns None if those are missing.
 
         The app with ID GITHUB_APP_ID needs to be enabled for the target repo.
 
+        Tokens are reused until shortly before they expire, see
+        `GitHubAppInstallationTokens`.
         """
         app_id = settings.GITHUB_APP_ID
         private_key = settings.GITHUB_APP_PRIVKEY
@@ -105,14 +266,9 @@ class GitHub:
             )
             return None
 
-        app_auth = AppAuth(
-            app_id,
-            private_key,
-        )
-        session = AppInstallationAuth(
-            app_auth, self.repo_owner, repositories=[self.repo_name]
+        return installation_tokens.get_token(
+            app_id, private_key, self.repo_owner, self.repo_name
         )
-        return asyncio.run(session.get_token())
 
 
 class GitHubAPI(GitHub):
@@ -154,6 +310,201 @@ class GitHubAPIClient:
     class UpstreamError(Exception):
         pass
 
+    class NotFoundError(UpstreamError):
+        pass
+
+    # Paginated connections of a pull request, fetched along with its metadata by
+    # `get_pull_request_snapshot`. Each connection can be included or excluded from
+    # the query, and paginated, independently via `with<Name>` and `<name>Cursor`
+    # variables.
+    PULL_REQUEST_CONNECTIONS = (
+        "commits",
+        "comments",
+        "labels",
+        "reviewRequests",
+        "reviews",
+        "reviewThreads",
+    )
+
+    PULL_REQUEST_QUERY = """
+      query(
+        $owner: String!
+        $repo: String!
+        $number: Int!
+        $withMetadata: Boolean = true
+        $withCommits: Boolean = true
+        $commitsCursor: String
+        $withComments: Boolean = true
+        $commentsCursor: String
+        $withLabels: Boolean = true
+        $labelsCursor: String
+        $withReviewRequests: Boolean = true
+        $reviewRequestsCursor: String
+        $withReviews: Boolean = true
+        $reviewsCursor: String
+        $withReviewThreads: Boolean = true
+        $reviewThreadsCursor: String
+      ) {
+        repository(owner: $owner, name: $repo) {
+          pullRequest(number: $number) {
+            updatedAt
+            ... on PullRequest @include(if: $withMetadata) {
+              fullDatabaseId
+              number
+              url
+              title
+              body
+              state
+              isDraft
+              mergeStateStatus
+              createdAt
+              closedAt
+              mergedAt
+              author {
+                login
+                url
+                ... on User {
+                  databaseId
+                }
+              }
+              baseRefName
+              baseRefOid
+              baseRepository {
+                owner {
+                  login
+                  ... on User {
+                    databaseId
+                  }
+                  ... on Organization {
+                    databaseId
+                  }
+                }
+              }
+              headRefName
+              headRefOid
+              headRepository {
+                nameWithOwner
+              }
+            }
+            commits(first: 100, after: $commitsCursor)
+              @include(if: $withCommits) {
+              pageInfo {
+                hasNextPage
+                endCursor
+              }
+              nodes {
+                commit {
+                  oid
+                  url
+                  message
+                  author {
+                    name
+                    email
+                    date
+                  }
+                  committer {
+                    name
+                    email
+                    date
+                  }
+                }
+              }
+            }
+            comments(first: 100, after: $commentsCursor)
+              @include(if: $withComments) {
+              pageInfo {
+                hasNextPage
+                endCursor
+              }
+              nodes {
+                fullDatabaseId
+                body
+                url
+                updatedAt
+                author {
+                  login
+                }
+              }
+            }
+            labels(first: 100, after: $labelsCursor) @include(if: $withLabels) {
+              pageInfo {
+                hasNextPage
+                endCursor
+              }
+              nodes {
+                id
+                name
+                color
+                description
+              }
+            }
+            reviewRequests(first: 100, after: $reviewRequestsCursor)
+              @include(if: $withReviewRequests) {
+              pageInfo {
+                hasNextPage
+                endCursor
+              }
+              nodes {
+                requestedReviewer {
+                  ... on User {
+                    __typename
+                    databaseId
+                    login
+                    url
+                  }
+                  ... on Team {
+                    __typename
+                    databaseId
+                    name
+                    slug
+                    description
+                    url
+                  }
+                }
+              }
+            }
+            reviews(first: 100, after: $reviewsCursor) @include(if: $withReviews) {
+              pageInfo {
+                hasNextPage
+                endCursor
+              }
+              nodes {
+                fullDatabaseId
+                state
+                body
+                url
+                submittedAt
+                author {
+                  login
+                }
+                commit {
+                  oid
+                }
+              }
+            }
+            reviewThreads(first: 100, after: $reviewThreadsCursor)
+              @include(if: $withReviewThreads) {
+              pageInfo {
+                hasNextPage
+                endCursor
+              }
+              nodes {
+                comments(first: 1) {
+                  nodes {
+                    id
+                    body
+                    url
+                    updatedAt
+                  }
+                }
+                isResolved
+              }
+            }
+          }
+        }
+      }
+      """
+
     def __init__(self, repo_url: str):
         self._api = GitHubAPI(repo_url)
         self.repo_base_url = f"repos/{self.repo_owner}/{self.repo_name}"
@@ -210,27 +561,302 @@ class GitHubAPIClient:
             for value in ret:
                 yield value
 
+    def _etag_cache_key(self, path: str, accept: str) -> str:
+        """Return the response store key for a GET request.
+
+        Responses are keyed on the URL and the representation requested. All requests
+        for a repo are made with installation tokens scoped to that repo, so the
+        repo is the authentication scope, and is part of the URL already.
+        """
+        request_hash = hashlib.sha256(
+            f"{self._api.GITHUB_BASE_URL}/{path}\n{accept}".encode()
+        ).hexdigest()
+        return f"github-etag-{request_hash}"
+
     def _get(self, path: str, *args, **kwargs) -> dict | list | str | None:
-        result = self._api.get(path, *args, **kwargs)
+        """Send a conditional GET request to the GitHub API, and decode the result.
+
+        Responses with an ETag are kept in the cache. Later requests for the same
+        resource send it in an `If-None-Match` header, and are served from the cache if
+        GitHub responds with a 304. Those responses don't count against the rate
+        limit.
+        """
+        headers = dict(kwargs.pop("headers", None) or {})
+        cache_key = self._etag_cache_key(path, headers.get("Accept", ""))
+
+        stored = cache.get(cache_key)
+        if stored:
+            headers["If-None-Match"] = stored["etag"]
+
+        result = self._api.get(path, *args, headers=headers, **kwargs)
+
+        if stored and result.status_code == 304:
+            statsd.increment("lando-api.github.etag_store.hits")
+            return self._decode_response(stored["content_type"], stored["body"])
+
         result.raise_for_status()
         content_type = result.headers["content-type"]
+
+        if etag := result.headers.get("etag"):
+            statsd.increment("lando-api.github.etag_store.misses")
+            cache.set(
+                cache_key,
+                {"etag": etag, "content_type": content_type, "body": result.text},
+                settings.GITHUB_ETAG_STORE_TTL,
+            )
+        else:
+            statsd.increment("lando-api.github.etag_store.uncacheable")
+
         if content_type == "application/json; charset=utf-8":
             return result.json()
+
+        return self._decode_response(content_type, result.text)
+
+    @classmethod
+    def _decode_response(cls, content_type: str, body: str) -> dict | list | str | None:
+        if content_type == "application/json; charset=utf-8":
+            return json.loads(body)
         elif content_type == "application/vnd.github.patch; charset=utf-8":
-            return result.text
+            return body
         elif content_type == "application/vnd.github.diff; charset=utf-8":
-            return result.text
+            return body
 
     def _post(self, path: str, *args, **kwargs):
         result = self._api.post(path, *args, **kwargs)
         return result.json()
 
+    def _graphql(self, query: str, variables: dict) -> dict:
+        """Run a GraphQL query, and return its `data`."""
+        response = self._api.post(
+            "graphql", json={"query": query, "variables": variables}
+        )
+        response.raise_for_status()
+        response_json = response.json()
+
+        if errors := response_json.get("errors"):
+            if any(error.get("type") == "NOT_FOUND" for error in errors):
+                raise self.NotFoundError(f"Not found on GitHub: {errors}")
+            raise self.UpstreamError(f"Error from GitHub GraphQL: {response_json}")
+
+        return response_json["data"]
+
     def build_pull_request(self, pull_number: int) -> "PullRequest":
         """Build a PullRequest object.
 
-        This does the necessary network requests to collect the data."""
-        data = self.get_pull_request(pull_number)
-        return PullRequest(self, data)
+        This does the necessary network requests to collect the data. All the data
+        needed by the PullRequest properties and checks, except the diff and patch,
+        is fetched upfront with `get_pull_request_snapshot`.
+        """
+        snapshot = self.get_pull_request_snapshot(pull_number)
+        return PullRequest(self, snapshot["pull_request"], snapshot=snapshot)
+
+    def get_pull_request_snapshot(self, pull_number: int) -> dict:
+        """Fetch a pull request and all its connections in as few queries as possible.
+
+        A single GraphQL query returns the metadata and the first page of each
+        connection. Further queries are only needed for connections with more than
+        100 items, and only request those.
+
+        The data is converted to the shapes returned by the equivalent REST endpoints.
+
+        Return:
+            dict: with keys `pull_request` (as `get_pull_request`), `commits`,
+            `comments`, `reviews` and `review_threads` (as
+            `get_pull_request_commits_comments`).
+        """
+        variables = {
+            "owner": self.repo_owner,
+            "repo": self.repo_name,
+            "number": pull_number,
+        }
+        data = self._graphql(self.PULL_REQUEST_QUERY, variables)
+        pull_request = data["repository"]["pullRequest"]
+        nodes = {
+            connection: pull_request[connection]["nodes"]
+            for connection in self.PULL_REQUEST_CONNECTIONS
+        }
+        page_infos = {
+            connection: pull_request[connection]["pageInfo"]
+            for connection in self.PULL_REQUEST_CONNECTIONS
+        }
+
+        while pending := [
+            connection
+            for connection, page_info in page_infos.items()
+            if page_info["hasNextPage"]
+        ]:
+            page_variables = {**variables, "withMetadata": False}
+            for connection in self.PULL_REQUEST_CONNECTIONS:
+                flag = f"with{connection[0].upper()}{connection[1:]}"
+                page_variables[flag] = connection in pending
+            for connection in pending:
+                page_variables[f"{connection}Cursor"] = page_infos[connection][
+                    "endCursor"
+                ]
+
+            page = self._graphql(self.PULL_REQUEST_QUERY, page_variables)
+            page_pull_request = page["repository"]["pullRequest"]
+            for connection in pending:
+                nodes[connection] += page_pull_request[connection]["nodes"]
+                page_infos[connection] = page_pull_request[connection]["pageInfo"]
+
+        return {
+            "pull_request": self._pull_request_from_graphql(
+                pull_request, nodes["labels"], nodes["reviewRequests"]
+            ),
+            "commits": [
+                self._commit_from_graphql(node["commit"]) for node in nodes["commits"]
+            ],
+            "comments": [
+                self._comment_from_graphql(node) for node in nodes["comments"]
+            ],
+            "reviews": [
+                self._review_from_graphql(node)
+                for node in nodes["reviews"]
+                # Pending reviews have not been submitted yet.
+                if node["submittedAt"]
+            ],
+            "review_threads": [
+                self._review_thread_from_graphql(node)
+                for node in nodes["reviewThreads"]
+            ],
+        }
+
+    def _pull_request_from_graphql(
+        self, data: dict, labels: list[dict], review_requests: list[dict]
+    ) -> dict:
+        """Convert GraphQL pull request data to the REST API format."""
+        api_url = f"{GitHubAPI.GITHUB_BASE_URL}/{self.repo_base_url}"
+        number = data["number"]
+        author = data["author"] or {"login": "ghost", "url": "https://github.com/ghost"}
+        reviewers = [
+            request["requestedReviewer"]
+            for request in review_requests
+            if request["requestedReviewer"]
+        ]
+
+        return {
+            "url": f"{api_url}/pulls/{number}",
+            "id": int(data["fullDatabaseId"]),
+            "html_url": data["url"],
+            "diff_url": f"{data['url']}.diff",
+            "patch_url": f"{data['url']}.patch",
+            "comments_url": f"{api_url}/issues/{number}/comments",
+            "commits_url": f"{api_url}/pulls/{number}/commits",
+            "number": number,
+            "state": "open" if data["state"] == "OPEN" else "closed",
+            "title": data["title"],
+            "body": data["body"],
+            "draft": data["isDraft"],
+            "mergeable_state": data["mergeStateStatus"].lower(),
+            "created_at": data["createdAt"],
+            "updated_at": data["updatedAt"],
+            "closed_at": data["closedAt"],
+            "merged_at": data["mergedAt"],
+            "user": {
+                "id": author.get("databaseId"),
+                "html_url": author["url"],
+                "login": author["login"],
+            },
+            "base": {
+                "ref": data["baseRefName"],
+                "sha": data["baseRefOid"],
+                "user": {
+                    "id": data["baseRepository"]["owner"].get("databaseId"),
+                    "login": data["baseRepository"]["owner"]["login"],
+                },
+            },
+            "head": {
+                "ref": data["headRefName"],
+                "sha": data["headRefOid"],
+                "repo": (
+                    {
+                        "git_url": f"git://github.com/{data['headRepository']['nameWithOwner']}.git"
+                    }
+                    if data["headRepository"]
+                    else None
+                ),
+            },
+            "labels": [
+                {
+                    "node_id": label["id"],
+                    "name": label["name"],
+                    "color": label["color"],
+                    "description": label["description"],
+                }
+                for label in labels
+            ],
+            "requested_reviewers": [
+                {
+                    "id": reviewer["databaseId"],
+                    "html_url": reviewer["url"],
+                    "login": reviewer["login"],
+                }
+                for reviewer in reviewers
+                if reviewer["__typename"] == "User"
+            ],
+            "requested_teams": [
+                {
+                    "id": team["databaseId"],
+                    "html_url": team["url"],
+                    "name": team["name"],
+                    "slug": team["slug"],
+                    "description": team["description"],
+                }
+                for team in reviewers
+                if team["__typename"] == "Team"
+            ],
+        }
+
+    @classmethod
+    def _commit_from_graphql(cls, commit: dict) -> dict:
+        """Convert GraphQL commit data to the REST API format."""
+        return {
+            "sha": commit["oid"],
+            "html_url": commit["url"],
+            "commit": {
+                "message": commit["message"],
+                "author": commit["author"],
+                "committer": commit["committer"],
+            },
+        }
+
+    @classmethod
+    def _comment_from_graphql(cls, comment: dict) -> dict:
+        """Convert GraphQL issue comment data to the REST API format."""
+        return {
+            "id": int(comment["fullDatabaseId"]),
+            "body": comment["body"],
+            "html_url": comment["url"],
+            "updated_at": comment["updatedAt"],
+            "user": {"login": (comment["author"] or {}).get("login", "ghost")},
+        }
+
+    @classmethod
+    def _review_from_graphql(cls, review: dict) -> dict:
+        """Convert GraphQL review data to the REST API format."""
+        return {
+            "id": int(review["fullDatabaseId"]),
+            "state": review["state"],
+            "body": review["body"],
+            "html_url": review["url"],
+            "submitted_at": review["submittedAt"],
+            "commit_id": review["commit"]["oid"] if review["commit"] else None,
+            "user": {"login": (review["author"] or {}).get("login", "ghost")},
+        }
+
+    @classmethod
+    def _review_thread_from_graphql(cls, thread: dict) -> dict:
+        """Convert a GraphQL review thread to a summary of its first comment."""
+        # We only grab the first comment of each thread.
+        comment = thread["comments"]["nodes"][0]
+        return {
+            "id": comment["id"],
+            "body": comment["body"],
+            "url": comment["url"],
+            "updated_at": comment["updatedAt"],
+            "is_resolved": thread["isResolved"],
+        }
 
     def list_pull_requests(self) -> list:
         """List all pull requests in the repo."""
@@ -300,40 +926,19 @@ class GitHubAPIClient:
             }
           }
           """
-        comments_response = self.session.post(
-            "https://api.github.com/graphql",
-            json={
-                "query": comments_query,
-                "variables": {
-                    "owner": self.repo_owner,
-                    "repo": self.repo_name,
-                    "number": pull_number,
-                },
+        data = self._graphql(
+            comments_query,
+            {
+                "owner": self.repo_owner,
+                "repo": self.repo_name,
+                "number": pull_number,
             },
         )
-        comments_response.raise_for_status()
-        comments_response_json = comments_response.json()
-        if "errors" in comments_response_json:
-            raise self.UpstreamError(
-                f"Error from GitHub GraphQL: {comments_response_json}"
-            )
-
-        comments_dict = comments_response_json["data"]["repository"]["pullRequest"][
-            "reviewThreads"
-        ]["nodes"]
 
-        comments = []
-
-        for thread in comments_dict:
-            # We only grab the first comment of each thread.
-            comment = thread["comments"]["nodes"][0]
-            comment["updated_at"] = comment["updatedAt"]
-            del comment["updatedAt"]
-            comment["is_resolved"] = thread["isResolved"]
-
-            comments.append(comment)
-
-        return comments
+        return [
+            self._review_thread_from_graphql(thread)
+            for thread in data["repository"]["pullRequest"]["reviewThreads"]["nodes"]
+        ]
 
     def get_pull_request_labels(self, pull_number: int) -> list:
         """Return a list of labels for the PR."""
@@ -425,11 +1030,17 @@ class PullRequest:
 
     client: GitHubAPIClient
 
+    # Data prefetched by `GitHubAPIClient.get_pull_request_snapshot`, if any.
+    _snapshot: dict | None
+
     def __repr__(self) -> str:
         return f"Pull request #{self.number} ({self.head_repo_git_url})"
 
-    def __init__(self, client: GitHubAPIClient, data: dict):
+    def __init__(
+        self, client: GitHubAPIClient, data: dict, snapshot: dict | None = None
+    ):
         self.client = client
+        self._snapshot = snapshot
 
         self.url = data["url"]
         self.base_ref = data["base"]["ref"]  # "target" branch name
@@ -500,6 +1111,12 @@ class PullRequest:
     def author(self) -> tuple[str | None, str | None]:
         return self._select_commit_author(self.commits)
 
+    def _get_snapshot_or(self, key: str, fetch: Callable[[int], list]) -> list:
+        """Return the prefetched data for `key`, or `fetch` it from the API."""
+        if self._snapshot is not None and key in self._snapshot:
+            return self._snapshot[key]
+        return fetch(self.number)
+
     @property
     def diff(self) -> str:
         return self.client.get_diff(self.number)
@@ -507,7 +1124,9 @@ class PullRequest:
     @property
     @pr_cache_method
     def comments(self) -> list:
-        comments = self.client.get_pull_request_comments(self.number)
+        comments = self._get_snapshot_or(
+            "comments", self.client.get_pull_request_comments
+        )
         if any(
             self.client.convert_timestamp_from_github(comment["updated_at"])
             > self.client.convert_timestamp_from_github(self.updated_at)
@@ -522,7 +1141,7 @@ class PullRequest:
     @property
     @pr_cache_method
     def commits(self) -> list[dict]:
-        commits = self.client.get_pull_request_commits(self.number)
+        commits = self._get_snapshot_or("commits", self.client.get_pull_request_commits)
 
         if commits[-1]["sha"] != self.head_sha:
             raise self.StaleMetadataException(
@@ -548,7 +1167,9 @@ class PullRequest:
     @pr_cache_method
     def commit_comments(self) -> list:
         """Return a list of comments on specific changes of the PR."""
-        commits_comments = self.client.get_pull_request_commits_comments(self.number)
+        commits_comments = self._get_snapshot_or(
+            "review_threads", self.client.get_pull_request_commits_comments
+        )
 
         if any(
             self.client.convert_timestamp_from_github(comment["updated_at"])
@@ -584,7 +1205,7 @@ class PullRequest:
     @pr_cache_method
     def reviews(self) -> list:
         """Return a list of reviews for the PR."""
-        reviews = self.client.get_pull_request_reviews(self.number)
+        reviews = self._get_snapshot_or("reviews", self.client.get_pull_request_reviews)
 
         if any(
             self.client.convert_timestamp_from_github(review["submitted_at"])
@@ -1,7 +1,9 @@
 import re
 from abc import ABC, abstractmethod
 from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+from functools import partial
 
 import requests
 import rs_parsepatch
@@ -668,10 +670,14 @@ class BugReferencesCheck(PatchCollectionCheck):
 
 @dataclass
 class PatchCollectionAssessor:
-    """Assess pushes for landing issues."""
+    """Assess pushes for landing issues.
+
+    Individual patches are checked by up to `max_workers` threads.
+    """
 
     patch_helpers: Iterable[PatchHelper]
     push_user_email: str | None = None
+    max_workers: int = 1
 
     def run_patch_collection_checks(
         self,
@@ -688,23 +694,18 @@ class PatchCollectionAssessor:
 
         checks = [check(self.push_user_email) for check in patch_collection_checks]
 
-        for patch_helper in self.patch_helpers:
+        patch_helpers = list(self.patch_helpers)
+        for patch_helper in patch_helpers:
             # Pass the patch information into the push-wide check.
             for check in checks:
                 check.next_diff(patch_helper)
 
-            parsed_diff = rs_parsepatch.get_diffs(patch_helper.get_diff())
-
-            author, email = patch_helper.parse_author_information()
-
-            # Run diff-wide checks.
-            diff_assessor = DiffAssessor(
-                author=author,
-                email=email,
-                commit_message=patch_helper.get_commit_description(),
-                parsed_diff=parsed_diff,
-            )
-            if diff_issues := diff_assessor.run_diff_checks(patch_checks):
+        # Each patch helper is only used by a single thread from here on.
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for diff_issues in executor.map(
+                partial(self.run_patch_checks, patch_checks=patch_checks),
+                patch_helpers,
+            ):
                 issues.extend(diff_issues)
 
         # Collect the result of the push-wide checks.
@@ -714,6 +715,23 @@ class PatchCollectionAssessor:
 
         return issues
 
+    @staticmethod
+    def run_patch_checks(
+        patch_helper: PatchHelper, patch_checks: list[type[PatchCheck]]
+    ) -> list[str]:
+        """Run diff-wide checks on a single patch."""
+        parsed_diff = rs_parsepatch.get_diffs(patch_helper.get_diff())
+
+        author, email = patch_helper.parse_author_information()
+
+        diff_assessor = DiffAssessor(
+            author=author,
+            email=email,
+            commit_message=patch_helper.get_commit_description(),
+            parsed_diff=parsed_diff,
+        )
+        return diff_assessor.run_diff_checks(patch_checks)
+
 
 ALL_STACK_CHECKS = PatchCollectionCheck.__subclasses__()
 ALL_COMMIT_CHECKS = PatchCheck.__subclasses__()
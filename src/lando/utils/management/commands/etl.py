@@ -3,16 +3,20 @@
 import json
 import logging
 import os
+import tempfile
+import threading
 import time
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
 from functools import cached_property
 from pathlib import Path
-from typing import Any, Iterator
+from typing import IO, Any, Iterator
 
 from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.db import connections
 from django.db.models import Model, QuerySet
-from google.api_core.exceptions import NotFound
+from google.api_core.exceptions import GoogleAPIError, NotFound
 from google.cloud import bigquery
 from google.cloud.bigquery import Table
 from more_itertools import chunked
@@ -275,7 +279,6 @@ class RevisionTransformer(ModelTransformer):
         "pull_number",
         "commit_id",
     )
-    defer = ("patch", "patches")
 
     def transform(self, instance: BaseModel) -> dict[str, Any]:
         """Transform a `Revision` instance for loading.
@@ -363,7 +366,11 @@ def extract(model: type[Model], since: datetime) -> QuerySet:
 
 
 class Loader(ABC):
-    """Base class for data loaders."""
+    """Base class for data loaders.
+
+    `load` may be called concurrently for different transformers, from
+    different threads.
+    """
 
     @abstractmethod
     def setup(self, transformers: list[ModelTransformer]) -> None:
@@ -377,6 +384,10 @@ class Loader(ABC):
     def finalize(self) -> None:
         """Called once after all transformers are processed."""
 
+    @abstractmethod
+    def abort(self) -> None:
+        """Called once if processing failed, after all `load` calls have returned."""
+
 
 class JsonLinesLoader(Loader):
     """Loader that writes data to a JSON Lines file."""
@@ -387,6 +398,9 @@ class JsonLinesLoader(Loader):
 
         self.output_path = output_path
 
+        # Serialise writes from concurrent `load` calls.
+        self.write_lock = threading.Lock()
+
     def setup(self, *args, **kwargs):
         """Create the empty output file."""
         self.output_path.touch()
@@ -395,18 +409,29 @@ class JsonLinesLoader(Loader):
         self, transformer: ModelTransformer, queryset: QuerySet, chunk_size: int = 2000
     ) -> int:
         """Write transformed records to the JSON Lines output file."""
-        with self.output_path.open("a") as output_file:
+
+        def lines_iterator() -> Iterator[str]:
             for record in queryset.iterator(chunk_size=chunk_size):
                 row = transformer.transform(record)
                 row["_model"] = transformer.name
-                output_file.write(json.dumps(row) + "\n")
+                yield json.dumps(row) + "\n"
 
-        return queryset.count()
+        count = 0
+        for lines in chunked(lines_iterator(), chunk_size):
+            with self.write_lock, self.output_path.open("a") as output_file:
+                output_file.writelines(lines)
+            count += len(lines)
+
+        return count
 
     def finalize(self, *args, **kwargs):
         """No-op finalize for `JsonLinesLoader`."""
         pass
 
+    def abort(self):
+        """Keep the partial output file for inspection."""
+        pass
+
 
 class BigQueryLoader(Loader):
     """Loader that loads data into BigQuery using temporary incoming tables."""
@@ -438,10 +463,10 @@ class BigQueryLoader(Loader):
     ) -> None:
         """Wait for all incoming tables to be visible to the BigQuery API.
 
-        BigQuery's streaming insert API is eventually consistent with table
-        creation, so a newly created table may not be immediately available.
-        This method polls `get_table` for each incoming table until all are
-        confirmed visible, preventing `NotFound` errors on the first insert.
+        BigQuery is eventually consistent with table creation, so a newly created
+        table may not be immediately available. This method polls `get_table` for
+        each incoming table until all are confirmed visible, preventing `NotFound`
+        errors on the first load.
         """
         pending: list[Table] = list(self.incoming_tables.values())
 
@@ -474,35 +499,61 @@ class BigQueryLoader(Loader):
         )
 
     def load(
-        self, transformer: ModelTransformer, queryset: QuerySet, chunk_size: int = 500
+        self,
+        transformer: ModelTransformer,
+        queryset: QuerySet,
+        chunk_size: int = 2000,
+        batch_size: int = 100_000,
     ) -> int:
-        """Transform and insert records into the incoming table in chunks."""
+        """Transform records and load them into the incoming table in batches.
+
+        Each batch of up to `batch_size` rows is written to a temporary
+        newline-delimited JSON file, which is then loaded with a single load job.
+        """
         incoming_table = self.incoming_tables[transformer.table_id]
-        table_id = sql_table_id(incoming_table)
 
-        # Transform and insert in chunks to avoid memory issues.
         def transform_iterator() -> Iterator[dict]:
             for record in queryset.iterator(chunk_size=chunk_size):
                 yield transformer.transform(record)
 
-        for chunk in chunked(transform_iterator(), chunk_size):
-            if not self.insert_with_retry(table_id, chunk):
-                self.cleanup_incoming_tables()
-                raise CommandError(f"Failed to load {transformer.name}. Aborting.")
+        count = 0
+        for batch in chunked(transform_iterator(), batch_size):
+            with tempfile.TemporaryFile() as rows_file:
+                for row in batch:
+                    rows_file.write(json.dumps(row).encode("utf-8") + b"\n")
+
+                if not self.load_with_retry(incoming_table, rows_file):
+                    raise CommandError(f"Failed to load {transformer.name}. Aborting.")
+
+            count += len(batch)
 
-        return queryset.count()
+        return count
 
-    def insert_with_retry(
+    def load_with_retry(
         self,
-        table_id: str,
-        rows: list[dict],
+        table: bigquery.Table,
+        rows_file: IO[bytes],
         max_retries: int = 3,
         retry_base_delay_s: float = 1.0,
     ) -> bool:
-        """Insert rows with exponential backoff retry."""
+        """Load a newline-delimited JSON file with exponential backoff retry."""
+        table_id = sql_table_id(table)
+        job_config = bigquery.LoadJobConfig(
+            schema=table.schema,
+            source_format=bigquery.SourceFormat.NEWLINE_DELIMITED_JSON,
+            write_disposition=bigquery.WriteDisposition.WRITE_APPEND,
+        )
+
         for attempt in range(max_retries):
-            errors = self.bq_client.insert_rows_json(table_id, rows)
-            if not errors:
+            rows_file.seek(0)
+            try:
+                job = self.bq_client.load_table_from_file(
+                    rows_file, table_id, job_config=job_config
+                )
+                job.result()
+            except GoogleAPIError as exc:
+                errors = exc
+            else:
                 return True
 
             if attempt < max_retries - 1:
@@ -513,9 +564,13 @@ class BigQueryLoader(Loader):
                 )
                 time.sleep(delay)
 
-        logger.error(f"Failed to insert to {table_id} after {max_retries} attempts.")
+        logger.error(f"Failed to load into {table_id} after {max_retries} attempts.")
         return False
 
+    def abort(self) -> None:
+        """Delete all incoming tables, once no load is using them anymore."""
+        self.cleanup_incoming_tables()
+
     def cleanup_incoming_tables(self) -> None:
         """Delete all incoming tables on failure."""
         for incoming_table in self.incoming_tables.values():
@@ -618,6 +673,12 @@ class Command(BaseCommand):
             default=None,
             help="Write transformed data to a JSON file instead of BigQuery.",
         )
+        parser.add_argument(
+            "--jobs",
+            type=int,
+            default=4,
+            help="Number of models to extract and load concurrently.",
+        )
 
     def get_cutoff_timestamp(
         self,
@@ -658,6 +719,32 @@ class Command(BaseCommand):
 
         return last_run
 
+    def process_transformer(
+        self, loader: Loader, transformer: ModelTransformer, since: datetime
+    ) -> int:
+        """Extract and load the records of a transformer, in a worker thread.
+
+        Returns the number of rows loaded.
+        """
+        logger.info("Processing %s.", transformer.name)
+        start = time.perf_counter()
+
+        try:
+            queryset = extract(transformer.model, since)
+            if transformer.defer:
+                queryset = queryset.defer(*transformer.defer)
+            if transformer.select_related:
+                queryset = queryset.select_related(*transformer.select_related)
+
+            count = loader.load(transformer, queryset)
+        finally:
+            # Database connections are per-thread, close this thread's connection.
+            connections.close_all()
+
+        elapsed = round(time.perf_counter() - start, 2)
+        logger.info("Loaded %d %s rows in %ss.", count, transformer.name, elapsed)
+        return count
+
     def handle(self, *args, **options):
         """Run the ETL pipeline."""
         output_file = options["output_file"]
@@ -682,18 +769,25 @@ class Command(BaseCommand):
 
         loader.setup(TRANSFORMERS)
 
-        # Process each transformer.
-        for transformer in TRANSFORMERS:
-            logger.info("Processing %s.", transformer.name)
-
-            queryset = extract(transformer.model, since_timestamp)
-            if transformer.defer:
-                queryset = queryset.defer(*transformer.defer)
-            if transformer.select_related:
-                queryset = queryset.select_related(*transformer.select_related)
-
-            count = loader.load(transformer, queryset)
-            logger.info("Loaded %d rows.", count)
+        # Process transformers concurrently.
+        try:
+            with ThreadPoolExecutor(max_workers=max(options["jobs"], 1)) as executor:
+                futures = [
+                    executor.submit(
+                        self.process_transformer, loader, transformer, since_timestamp
+                    )
+                    for transformer in TRANSFORMERS
+                ]
+                try:
+                    for future in as_completed(futures):
+                        future.result()
+                except BaseException:
+                    executor.shutdown(cancel_futures=True)
+                    raise
+        except BaseException:
+            # The executor has waited for the running loads to finish.
+            loader.abort()
+            raise
 
         loader.finalize()
 
@@ -33,6 +33,12 @@ class Command(BaseCommand):
             help="Start the interactive Python debugger on errors",
         )
 
+        parser.add_argument(
+            "--run-benchmarks",
+            action="store_true",
+            help="Also run tests marked as benchmarks",
+        )
+
         parser.add_argument(
             "-n",
             type=str,
@@ -60,6 +66,9 @@ class Command(BaseCommand):
         if options["pdb"]:
             command.append("--pdb")
 
+        if options["run_benchmarks"]:
+            command.append("--run-benchmarks")
+
         env = os.environ.copy()
         env["DJANGO_SETTINGS_MODULE"] = "lando.test_settings"
         result = subprocess.run(command, cwd=ROOT_DIR, env=env)
@@ -1,5 +1,10 @@
+import hashlib
 import json
 import logging
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import (
     datetime,
     timezone,
@@ -8,6 +13,7 @@ from enum import (
     Enum,
     unique,
 )
+from http.cookiejar import DefaultCookiePolicy
 from json.decoder import JSONDecodeError
 from typing import (
     Any,
@@ -18,6 +24,8 @@ from typing import (
 
 import requests
 from django.conf import settings
+from django.core.cache import cache
+from requests.adapters import HTTPAdapter
 
 logger = logging.getLogger(__name__)
 
@@ -157,19 +165,50 @@ class PhabricatorClient:
     the request to the server or decoding the JSON response, this class will
     bubble up the exception, as a PhabricatorAPIException caused by the
     underlying exception.
+
+    Unless a session is given, all clients of a process share a pooled session, so
+    that connections to Phabricator are kept alive from one request to the next.
     """
 
+    # Read-only conduit methods, which are retried after transient errors.
+    READ_ONLY_METHODS = (
+        "conduit.ping",
+        "differential.getrawdiff",
+        "user.whoami",
+    )
+    READ_ONLY_METHOD_SUFFIXES = (".query", ".search")
+
+    # HTTP statuses of a server which is temporarily unable to answer.
+    RETRY_STATUS_CODES = (502, 503, 504)
+
+    # Constraints of a search which may be split into chunks of at most
+    # `SEARCH_CHUNK_SIZE` values, fetched concurrently.
+    CHUNKED_CONSTRAINTS = ("ids", "phids", "revisionPHIDs")
+    SEARCH_CHUNK_SIZE = 100
+
+    _shared_session: Optional[requests.Session] = None
+    _shared_session_lock = threading.Lock()
+
     def __init__(
-        self, url: str, api_token: str, *, session: Optional[requests.Session] = None
+        self,
+        url: str,
+        api_token: str,
+        *,
+        session: Optional[requests.Session] = None,
+        coalesce_searches: bool = False,
     ):
         self.url_base = url
         self.api_url = url + "api/" if url[-1] == "/" else url + "/api/"
         self.api_token = api_token
-        self.session = session or self.create_session()
+        self.session = session or self.shared_session()
+        self.searches = ConduitSearchCoalescer(self) if coalesce_searches else None
 
     def call_conduit(self, method: str, **kwargs) -> Any:  # noqa: ANN401
         """Return the result of an RPC call to a conduit method.
 
+        If the client coalesces searches, lookups of objects by ID or PHID are
+        served by its `ConduitSearchCoalescer`.
+
         Args:
             **kwargs: Every method parameter is passed as a keyword argument.
 
@@ -184,6 +223,13 @@ class PhabricatorClient:
                 if there is a request exception while communicating
                 with the conduit API.
         """
+        if self.searches and self.searches.lookup(method, kwargs):
+            return self.searches.search(method, kwargs)
+
+        return self.request_conduit(method, **kwargs)
+
+    def request_conduit(self, method: str, **kwargs) -> Any:  # noqa: ANN401
+        """Call a conduit method on Phabricator, see `call_conduit`."""
         if "__conduit__" not in kwargs:
             kwargs["__conduit__"] = {"token": self.api_token}
 
@@ -198,7 +244,7 @@ class PhabricatorClient:
         logger.debug("call to conduit", extra=extra_data)
 
         try:
-            response = self.session.post(self.api_url + method, data=data).json()
+            response = self.post(method, data)
         except requests.RequestException as exc:
             raise PhabricatorCommunicationException(
                 "An error occurred when communicating with Phabricator"
@@ -211,8 +257,55 @@ class PhabricatorClient:
         PhabricatorAPIException.raise_if_error(response)
         return response.get("result")
 
+    def post(self, method: str, data: dict) -> Any:  # noqa: ANN401
+        """Send a request to a conduit method and return the decoded response.
+
+        Read-only methods are retried up to `PHABRICATOR_RETRIES` times after a
+        connection error, a timeout or an unavailable server, with an exponential
+        backoff.
+        """
+        retries = settings.PHABRICATOR_RETRIES if self.is_read_only(method) else 0
+        timeout = (
+            settings.PHABRICATOR_CONNECT_TIMEOUT,
+            settings.PHABRICATOR_READ_TIMEOUT,
+        )
+
+        for attempt in range(retries + 1):
+            try:
+                response = self.session.post(
+                    self.api_url + method, data=data, timeout=timeout
+                )
+            except (requests.ConnectionError, requests.Timeout) as exc:
+                if attempt == retries:
+                    raise
+                logger.warning(f"Retrying {method} after error: {exc}")
+            else:
+                if (
+                    response.status_code not in self.RETRY_STATUS_CODES
+                    or attempt == retries
+                ):
+                    return response.json()
+                logger.warning(
+                    f"Retrying {method} after HTTP status {response.status_code}."
+                )
+
+            # Jitter spreads the retries of concurrent requests.
+            backoff = settings.PHABRICATOR_RETRY_BACKOFF / 1000 * 2**attempt
+            time.sleep(backoff * random.uniform(0.5, 1.5))
+
+    @classmethod
+    def is_read_only(cls, method: str) -> bool:
+        """Return `True` if calling `method` can't change anything in Phabricator."""
+        return method in cls.READ_ONLY_METHODS or method.endswith(
+            cls.READ_ONLY_METHOD_SUFFIXES
+        )
+
     def call_conduit_collated(self, method: str, **kwargs) -> dict[str, list[Any]]:
-        """Continuously call call_conduit and return the collated data in one dict."""
+        """Continuously call call_conduit and return the collated data in one dict.
+
+        If the search is constrained by a list of more than `SEARCH_CHUNK_SIZE` IDs or
+        PHIDs, the list is split in chunks which are searched concurrently.
+        """
 
         # NOTE: if a limit is passed, it is ignored since Phabricator already limits
         # results to 100, and raises and error if a limit is passed that is greater
@@ -222,9 +315,30 @@ class PhabricatorClient:
         if "limit" in kwargs:
             limit = kwargs.pop("limit")
 
+        chunks = self.chunk_constraints(kwargs.get("constraints"))
+        if len(chunks) > 1:
+            with ThreadPoolExecutor(
+                max_workers=settings.PHABRICATOR_SEARCH_CONCURRENCY
+            ) as executor:
+                results = executor.map(
+                    lambda constraints: self.call_conduit_pages(
+                        method, **{**kwargs, "constraints": constraints}
+                    ),
+                    chunks,
+                )
+                data = [item for result in results for item in result]
+        else:
+            data = self.call_conduit_pages(method, **kwargs)
+
+        if limit:
+            data = data[:limit]
+        return {"data": data}
+
+    def call_conduit_pages(self, method: str, **kwargs) -> list[Any]:
+        """Call a search method until its cursor is exhausted, and return all data."""
         result = self.call_conduit(method, **kwargs)
         if not result:
-            return {"data": []}
+            return []
 
         data = result["data"]
         while result and result["cursor"] and result["cursor"]["after"]:
@@ -233,17 +347,47 @@ class PhabricatorClient:
             )
             if result and "data" in result and result["data"]:
                 data += result["data"]
-        if limit:
-            data = data[:limit]
-        return {"data": data}
+        return data
+
+    @classmethod
+    def chunk_constraints(cls, constraints: Optional[dict]) -> list[Optional[dict]]:
+        """Split search constraints on a long list of IDs or PHIDs into chunks.
+
+        Returns a list with the constraints of each chunk, which is `[constraints]`
+        if there is nothing to split.
+        """
+        for key in cls.CHUNKED_CONSTRAINTS:
+            values = (constraints or {}).get(key)
+            if isinstance(values, list) and len(values) > cls.SEARCH_CHUNK_SIZE:
+                return [
+                    {**constraints, key: values[i : i + cls.SEARCH_CHUNK_SIZE]}
+                    for i in range(0, len(values), cls.SEARCH_CHUNK_SIZE)
+                ]
+
+        return [constraints]
 
     @staticmethod
     def create_session() -> requests.Session:
         session = requests.Session()
         headers = {"User-Agent": settings.HTTP_USER_AGENT}
         session.headers.update(headers)
+        # Conduit authenticates requests with the API token, and the session may be
+        # shared by clients of different users.
+        session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+
+        adapter = HTTPAdapter(pool_maxsize=settings.PHABRICATOR_POOL_SIZE)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
         return session
 
+    @classmethod
+    def shared_session(cls) -> requests.Session:
+        """Return the session shared by the clients of this process."""
+        with cls._shared_session_lock:
+            if cls._shared_session is None:
+                cls._shared_session = cls.create_session()
+            return cls._shared_session
+
     @classmethod
     def single(
         cls,
@@ -320,17 +464,178 @@ class PhabricatorClient:
         """
         return datetime.fromtimestamp(int(timestamp), timezone.utc)
 
+    def whoami(self) -> Optional[dict]:
+        """Return the Phabricator user data associated with the api token.
+
+        Returns None if Phabricator returns an error code when checking this
+        api token. Successful lookups are cached for
+        `PHABRICATOR_API_TOKEN_CACHE_TTL` seconds, keyed on a hash of the token.
+        """
+        cache_key = api_token_cache_key(self.api_token)
+        user_data = cache.get(cache_key)
+        if user_data is not None:
+            return user_data
+
+        try:
+            user_data = self.call_conduit("user.whoami")
+        except PhabricatorAPIException:
+            return None
+
+        cache.set(cache_key, user_data, settings.PHABRICATOR_API_TOKEN_CACHE_TTL)
+        return user_data
+
     def verify_api_token(self) -> bool:
         """Verifies that the api token is valid.
 
         Returns False if Phabricator returns an error code when checking this
         api token. Returns True if no errors are found.
         """
-        try:
-            self.call_conduit("user.whoami")
-        except PhabricatorAPIException:
-            return False
-        return True
+        return self.whoami() is not None
+
+
+class ConduitSearchCoalescer:
+    """Serve the `*.search` lookups of objects by ID or PHID made by a client.
+
+    Meant for clients which are used for a single request. Objects found are kept
+    in memory, so a later search for any of them, by ID or PHID, doesn't need to ask
+    Phabricator again. Objects being searched for by another thread are waited for
+    instead of being requested again, and PHIDs of a type a method can't return
+    aren't requested at all.
+
+    Only searches constrained by nothing but `ids` or `phids`, with the default
+    order, are coalesced. Objects are returned in Phabricator's default order,
+    newest first.
+    """
+
+    LOOKUP_CONSTRAINTS = ("ids", "phids")
+
+    # The type of the PHIDs of the objects returned by search methods.
+    PHID_TYPES = {
+        "differential.diff.search": "DIFF",
+        "differential.revision.search": "DREV",
+        "diffusion.repository.search": "REPO",
+        "project.search": "PROJ",
+        "user.search": "USER",
+    }
+
+    def __init__(self, client: PhabricatorClient):
+        self.client = client
+        self.lock = threading.Lock()
+
+        # Objects found, or `None` if missing, keyed on
+        # `(method, attachments, constraint, value)`.
+        self.found: dict[tuple, Optional[dict]] = {}
+        self.in_flight: dict[tuple, threading.Event] = {}
+
+    def lookup(self, method: str, kwargs: dict) -> Optional[tuple[str, list]]:
+        """Return the `(constraint, values)` of a search that can be coalesced."""
+        if not method.endswith(".search") or not set(kwargs) <= {
+            "attachments",
+            "constraints",
+            "limit",
+        }:
+            return None
+
+        constraints = kwargs.get("constraints") or {}
+        if len(constraints) != 1:
+            return None
+
+        key, values = next(iter(constraints.items()))
+        if (
+            key not in self.LOOKUP_CONSTRAINTS
+            or not isinstance(values, list)
+            or not values
+            or len(values)
+            > (kwargs.get("limit") or PhabricatorClient.SEARCH_CHUNK_SIZE)
+        ):
+            return None
+
+        return key, values
+
+    def search(self, method: str, kwargs: dict) -> dict:
+        """Return the result of a search by ID or PHID, asking only for new objects."""
+        key, values = self.lookup(method, kwargs)
+        attachments = json.dumps(kwargs.get("attachments") or {}, sort_keys=True)
+        cache_keys = {value: (method, attachments, key, value) for value in values}
+
+        phid_type = self.PHID_TYPES.get(method)
+        fetched = threading.Event()
+        with self.lock:
+            to_fetch = []
+            waits = set()
+            for value, cache_key in cache_keys.items():
+                if cache_key in self.found:
+                    continue
+                if (
+                    key == "phids"
+                    and phid_type
+                    and not str(value).startswith(f"PHID-{phid_type}-")
+                ):
+                    self.found[cache_key] = None
+                elif cache_key in self.in_flight:
+                    waits.add(self.in_flight[cache_key])
+                else:
+                    self.in_flight[cache_key] = fetched
+                    to_fetch.append(value)
+
+        result = None
+        if to_fetch:
+            try:
+                result = self.client.request_conduit(
+                    method,
+                    **{
+                        **kwargs,
+                        "constraints": {key: to_fetch},
+                        "limit": len(to_fetch),
+                    },
+                )
+                self.store(method, attachments, key, to_fetch, result)
+            finally:
+                with self.lock:
+                    for value in to_fetch:
+                        del self.in_flight[cache_keys[value]]
+                fetched.set()
+
+        for event in waits:
+            event.wait()
+
+        if len(to_fetch) == len(cache_keys) and result:
+            # Nothing was known already, keep Phabricator's response as is.
+            return result
+
+        with self.lock:
+            complete = all(cache_key in self.found for cache_key in cache_keys.values())
+            found = [self.found.get(cache_key) for cache_key in cache_keys.values()]
+
+        if not complete:
+            # Another thread failed to fetch some of the objects.
+            return self.client.request_conduit(method, **kwargs)
+
+        items = {item["phid"]: item for item in found if item is not None}
+
+        return {
+            "data": sorted(items.values(), key=lambda item: item["id"], reverse=True),
+            "maps": {},
+            "query": {"queryKey": None},
+            "cursor": {"limit": len(values), "after": None, "before": None},
+        }
+
+    def store(
+        self,
+        method: str,
+        attachments: str,
+        key: str,
+        values: list,
+        result: Optional[dict],
+    ):
+        """Keep the objects of a search result, by both ID and PHID."""
+        data = PhabricatorClient.expect(result, "data") if result else []
+        with self.lock:
+            for value in values:
+                self.found[(method, attachments, key, value)] = None
+            for item in data:
+                self.found[(method, attachments, "ids", item["id"])] = item
+                self.found[(method, attachments, "phids", item["phid"])] = item
 
 
 class PhabricatorAPIException(Exception):
@@ -381,6 +686,18 @@ def result_list_to_phid_dict(
     return result
 
 
+def api_token_cache_key(api_token: str) -> str:
+    """Return the cache key for the user data associated with an api token."""
+    token_hash = hashlib.sha256(api_token.encode("utf-8")).hexdigest()
+    return f"phabricator-api-token-{token_hash}"
+
+
+def clear_api_token_cache(api_token: str):
+    """Remove any cached user data associated with an api token."""
+    if api_token:
+        cache.delete(api_token_cache_key(api_token))
+
+
 def get_phabricator_client(
     privileged: Optional[bool] = False, api_key: Optional[str] = None
 ) -> PhabricatorClient:
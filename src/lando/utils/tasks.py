@@ -1,17 +1,20 @@
 import logging
 import smtplib
 import ssl
+import uuid
 from typing import Optional
 
 from django.conf import settings
 from django.contrib.auth.models import User
 from django.core import mail
+from django.core.cache import cache
 
 from lando.api.legacy.email import (
     make_failure_email,
     make_uplift_failure_email,
     make_uplift_success_email,
 )
+from lando.main.models import Repo
 from lando.utils.celery import app as celery_app
 from lando.utils.phabricator import (
     PhabricatorClient,
@@ -232,6 +235,37 @@ def admin_remove_phab_project(
     )
 
 
+# Set while a `phab_trigger_repo_update` task is queued.
+PHAB_REPO_UPDATE_QUEUED_KEY = "phab-repo-update-queued"
+
+# Time, in seconds, for which pending and sent repository updates are remembered.
+PHAB_REPO_UPDATE_TTL = 24 * 60 * 60
+
+
+def phab_repo_update_cache_keys(repo_identifier: str) -> tuple[str, str]:
+    """Return the keys of the pending and last sent updates of a repository."""
+    return (
+        f"phab-repo-update-pending-{repo_identifier}",
+        f"phab-repo-update-sent-{repo_identifier}",
+    )
+
+
+def mark_phab_repo_update_pending(repo_identifier: str) -> bool:
+    """Record that Phabricator should update a repository, following a landing.
+
+    Returns `True` if a `phab_trigger_repo_update` task needs to be queued, with a
+    countdown of `PHABRICATOR_REPO_UPDATE_DELAY`. Otherwise a task is already queued,
+    and it will update this repository as well when it runs.
+    """
+    pending_key, _sent_key = phab_repo_update_cache_keys(repo_identifier)
+    cache.set(pending_key, uuid.uuid4().hex, PHAB_REPO_UPDATE_TTL)
+
+    # The key expires in case the queued task is lost.
+    return cache.add(
+        PHAB_REPO_UPDATE_QUEUED_KEY, True, settings.PHABRICATOR_REPO_UPDATE_DELAY + 60
+    )
+
+
 @celery_app.task(
     autoretry_for=(IOError, PhabricatorCommunicationException),
     default_retry_delay=3,
@@ -239,13 +273,41 @@ def admin_remove_phab_project(
     ignore_result=True,
 )
 def phab_trigger_repo_update(repo_identifier: str):
-    """Trigger a repo update in Phabricator's backend."""
-    # Tell Phabricator to scan the landing repo so revisions are closed quickly.
+    """Trigger a repo update in Phabricator's backend.
+
+    All repositories marked with `mark_phab_repo_update_pending` since their last
+    update are updated along with `repo_identifier`.
+    """
+    # Landings from now on will queue another task, so none of them are missed.
+    cache.delete(PHAB_REPO_UPDATE_QUEUED_KEY)
+
+    identifiers = {repo.phab_identifier for repo in Repo.objects.all()}
+    identifiers = {identifier for identifier in identifiers if identifier}
+    cache_keys = {
+        identifier: phab_repo_update_cache_keys(identifier)
+        for identifier in identifiers | {repo_identifier}
+    }
+    cached = cache.get_many([key for keys in cache_keys.values() for key in keys])
+
+    # An update is pending until the marker set for it has been sent.
+    pending = {
+        identifier: cached[pending_key]
+        for identifier, (pending_key, sent_key) in cache_keys.items()
+        if pending_key in cached and cached[pending_key] != cached.get(sent_key)
+    }
+    repositories = sorted(set(pending) | {repo_identifier})
+
+    # Tell Phabricator to scan the landing repos so revisions are closed quickly.
     phab = PhabricatorClient(
         settings.PHABRICATOR_URL,
         settings.PHABRICATOR_ADMIN_API_KEY,
     )
-    phab.call_conduit("diffusion.looksoon", repositories=[repo_identifier])
+    phab.call_conduit("diffusion.looksoon", repositories=repositories)
+
+    cache.set_many(
+        {cache_keys[identifier][1]: marker for identifier, marker in pending.items()},
+        PHAB_REPO_UPDATE_TTL,
+    )
 
 
 @celery_app.task(
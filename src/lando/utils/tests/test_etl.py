@@ -1,5 +1,6 @@
 import json
 import tempfile
+import time
 from datetime import datetime, timezone
 from pathlib import Path
 from unittest.mock import MagicMock, patch
@@ -8,7 +9,7 @@ import pytest
 from django.contrib.auth.models import User
 from django.core.management import call_command
 from django.core.management.base import CommandError
-from google.api_core.exceptions import NotFound
+from google.api_core.exceptions import BadRequest, NotFound
 
 from lando.headless_api.models.automation_job import AutomationAction, AutomationJob
 from lando.main.models.landing_job import LandingJob
@@ -21,6 +22,7 @@ from lando.main.models.uplift import (
     UpliftSubmission,
 )
 from lando.utils.management.commands.etl import (
+    TRANSFORMERS,
     AutomationActionTransformer,
     AutomationJobTransformer,
     BigQueryLoader,
@@ -715,7 +717,9 @@ def test_json_lines_loader_raises_if_output_file_exists():
             JsonLinesLoader(output_path)
 
 
-@pytest.mark.django_db
+# Models are extracted in worker threads with their own database connections, which
+# only see committed data.
+@pytest.mark.django_db(transaction=True)
 @patch("lando.utils.management.commands.etl.bigquery.Client")
 def test_etl_output_file_writes_json_lines(mock_bq_client):
     # Create test data.
@@ -884,3 +888,122 @@ def test_wait_for_incoming_tables_raises_after_max_retries():
 
     with pytest.raises(CommandError, match="Incoming tables not visible"):
         loader.wait_for_incoming_tables(max_retries=2, retry_base_delay_s=0)
+
+
+def test_bigquery_loader_loads_batches_from_files():
+    """Rows should be loaded with one load job per batch, and counted as streamed."""
+    mock_client = MagicMock()
+    loaded_rows = []
+
+    def load_table_from_file(rows_file, table_id, job_config):
+        loaded_rows.append([json.loads(line) for line in rows_file.read().splitlines()])
+        return MagicMock()
+
+    mock_client.load_table_from_file.side_effect = load_table_from_file
+    loader = BigQueryLoader(mock_client)
+
+    transformer = MagicMock()
+    transformer.table_id = "proj.ds.tbl"
+    transformer.transform.side_effect = lambda record: {"id": record}
+    loader.incoming_tables["proj.ds.tbl"] = MagicMock()
+
+    queryset = MagicMock()
+    queryset.iterator.return_value = iter(range(5))
+
+    count = loader.load(transformer, queryset, batch_size=2)
+
+    assert count == 5, "Should count the rows that were loaded."
+    queryset.count.assert_not_called()
+    assert loaded_rows == [
+        [{"id": 0}, {"id": 1}],
+        [{"id": 2}, {"id": 3}],
+        [{"id": 4}],
+    ], "Should load each batch of rows with its own load job."
+    mock_client.insert_rows_json.assert_not_called()
+
+
+def test_bigquery_loader_load_retries_failed_load_jobs():
+    """Failed load jobs should be retried, then abort the load."""
+    mock_client = MagicMock()
+    mock_client.load_table_from_file.return_value.result.side_effect = BadRequest(
+        "Invalid row."
+    )
+    loader = BigQueryLoader(mock_client)
+
+    incoming_table = MagicMock()
+    incoming_table.project = "proj"
+    incoming_table.dataset_id = "ds"
+    incoming_table.table_id = "tbl_incoming"
+
+    with tempfile.TemporaryFile() as rows_file:
+        rows_file.write(b'{"id": 1}\n')
+        assert not loader.load_with_retry(
+            incoming_table, rows_file, max_retries=2, retry_base_delay_s=0
+        ), "Should fail after all retries."
+
+    assert (
+        mock_client.load_table_from_file.call_count == 2
+    ), "Should have retried the load job."
+
+
+def test_etl_aborts_loader_once_loads_have_finished():
+    """A failed load should only abort the loader once the other loads are done."""
+    running = set()
+
+    def process_transformer(loader, transformer, since):
+        if transformer is TRANSFORMERS[0]:
+            raise CommandError(f"Failed to load {transformer.name}. Aborting.")
+        running.add(transformer)
+        time.sleep(0.05)
+        running.remove(transformer)
+        return 0
+
+    def abort(loader):
+        assert not running, "Should wait for the running loads to finish."
+
+    with (
+        tempfile.TemporaryDirectory() as tmpdir,
+        patch.object(Command, "process_transformer", side_effect=process_transformer),
+        patch.object(
+            JsonLinesLoader, "abort", autospec=True, side_effect=abort
+        ) as mock_abort,
+        pytest.raises(CommandError, match="Failed to load"),
+    ):
+        call_command(
+            "etl", "--output-file", str(Path(tmpdir) / "export.jsonl"), "--full"
+        )
+
+    assert mock_abort.call_count == 1, "Should abort the loader once."
+
+
+@pytest.mark.benchmark
+@pytest.mark.django_db(transaction=True)
+def test_benchmark_etl_output_file(make_repo, benchmark_timer):
+    repos = [make_repo(i) for i in range(10)]
+    LandingJob.objects.bulk_create(
+        LandingJob(
+            status="LANDED",
+            requester_email="test@example.com",
+            target_repo=repos[i % len(repos)],
+        )
+        for i in range(20_000)
+    )
+    Revision.objects.bulk_create(
+        Revision(revision_id=i, diff_id=i, patch_data={}) for i in range(20_000)
+    )
+
+    for jobs in (1, 4):
+
+        def run_etl(jobs=jobs):
+            with tempfile.TemporaryDirectory() as tmpdir:
+                output_path = Path(tmpdir) / "export.jsonl"
+                call_command(
+                    "etl",
+                    "--output-file",
+                    str(output_path),
+                    "--full",
+                    "--jobs",
+                    str(jobs),
+                )
+
+        benchmark_timer(f"etl wall time, --jobs {jobs}", run_etl, rounds=3)
@@ -1,10 +1,58 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from unittest.mock import MagicMock, patch
 
 import pytest
 from django.contrib.auth.models import User
+from django.core.cache import cache
 from django.test import Client, override_settings
 
 from lando.environments import Environment
+from lando.main.models.profile import CLAIM_GROUPS_KEY
+
+FAKE_USERINFO = {
+    "email": "api-user@example.com",
+    "email_verified": True,
+    "name": "api-user",
+    "picture": "https://example.com/api-user.png",
+    "sub": "ad|Mozilla-LDAP|api-user",
+    CLAIM_GROUPS_KEY: ["active_scm_level_1", "all_scm_level_1", "everyone"],
+}
+
+
+@pytest.fixture
+def fake_oidc_server():
+    """Run a local OIDC userinfo endpoint which counts the requests it receives."""
+
+    class FakeOIDCHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            server.userinfo_requests += 1
+            if self.headers.get("Authorization") != "Bearer valid_token":
+                self.send_response(401)
+                self.end_headers()
+                return
+
+            body = json.dumps(server.userinfo).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FakeOIDCHandler)
+    server.userinfo = dict(FAKE_USERINFO)
+    server.userinfo_requests = 0
+    server.url = f"http://127.0.0.1:{server.server_port}/userinfo"
+
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
 
 
 @pytest.mark.django_db()
@@ -106,3 +154,90 @@ def test_userinfo_not_in_prod(mock_authenticate: MagicMock, client: Client):
     )
 
     assert response.status_code == 404, "__userinfo__ should not be available in prod"
+
+
+@override_settings(
+    CACHES={
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "test-oidc-cache",
+        }
+    },
+    OIDC_ACCESS_TOKEN_CACHE_TTL=60,
+)
+@pytest.mark.django_db()
+def test_authentication_caches_userinfo(fake_oidc_server, client: Client):
+    cache.clear()
+    request_count = 5
+
+    with override_settings(OIDC_OP_USER_ENDPOINT=fake_oidc_server.url):
+        for _ in range(request_count):
+            response = client.get(
+                "/auth/__userinfo__", headers={"Authorization": "Bearer valid_token"}
+            )
+            assert response.status_code == 200, "Valid token should result in 200"
+
+    assert (
+        fake_oidc_server.userinfo_requests == 1
+    ), f"Expected 1 upstream userinfo request, {request_count - 1} should be saved"
+
+    user = User.objects.get(email=FAKE_USERINFO["email"])
+    assert user.has_perm("main.scm_level_1")
+
+
+@override_settings(
+    CACHES={
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "test-oidc-cache",
+        }
+    },
+)
+@pytest.mark.django_db()
+def test_authentication_invalid_token_not_cached(fake_oidc_server, client: Client):
+    cache.clear()
+
+    with override_settings(OIDC_OP_USER_ENDPOINT=fake_oidc_server.url):
+        for _ in range(2):
+            response = client.get(
+                "/auth/__userinfo__", headers={"Authorization": "Bearer invalid_token"}
+            )
+            assert response.status_code == 401, "Invalid token should result in 401"
+
+    assert (
+        fake_oidc_server.userinfo_requests == 2
+    ), "Failed userinfo lookups should not be cached"
+
+
+@override_settings(OIDC_ACCESS_TOKEN_CACHE_TTL=0)
+@pytest.mark.django_db()
+def test_authentication_updates_profile_only_on_claim_change(
+    fake_oidc_server, client: Client
+):
+    with override_settings(OIDC_OP_USER_ENDPOINT=fake_oidc_server.url):
+        client.get(
+            "/auth/__userinfo__", headers={"Authorization": "Bearer valid_token"}
+        )
+        user = User.objects.get(email=FAKE_USERINFO["email"])
+        updated_at = user.profile.updated_at
+
+        # Unchanged claims should not rewrite the profile.
+        client.get(
+            "/auth/__userinfo__", headers={"Authorization": "Bearer valid_token"}
+        )
+        user.profile.refresh_from_db()
+        assert user.profile.updated_at == updated_at
+
+        # Changed claims should update the profile and permissions.
+        fake_oidc_server.userinfo[CLAIM_GROUPS_KEY] = [
+            "active_scm_level_3",
+            "all_scm_level_3",
+        ]
+        client.get(
+            "/auth/__userinfo__", headers={"Authorization": "Bearer valid_token"}
+        )
+
+    user = User.objects.get(email=FAKE_USERINFO["email"])
+    assert user.profile.updated_at > updated_at
+    assert user.has_perm("main.scm_level_3")
+    assert not user.has_perm("main.scm_level_1")
@@ -0,0 +1,29 @@
+import subprocess
+from unittest import mock
+
+import pytest
+from django.core.management import call_command
+
+
+def test_tests_command_run_benchmarks(monkeypatch: pytest.MonkeyPatch):
+    """`lando tests --run-benchmarks` should start pytest with a known option."""
+    mock_run = mock.Mock(return_value=mock.Mock(returncode=0))
+    monkeypatch.setattr(
+        "lando.utils.management.commands.tests.subprocess.run", mock_run
+    )
+
+    call_command("tests", "--run-benchmarks")
+
+    (command,), kwargs = mock_run.call_args
+    assert "--run-benchmarks" in command, "Should pass the option to pytest."
+
+    # Start pytest the same way, but only parse the command line.
+    result = subprocess.run(
+        [*command, "--help"],
+        cwd=kwargs["cwd"],
+        env=kwargs["env"],
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 0, f"Pytest rejected the options: {result.stderr}"
+    assert "--run-benchmarks" in result.stdout, "Pytest should know the option."